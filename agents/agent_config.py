@@ -30,8 +30,14 @@ AGENT_TEAM_CONFIG: Dict[str, Any] = {
     # 에이전트 실행 주기 (초)
     "reader_interval": 60,               # Reader 분석 주기 (1분)
     "strategist_interval": 21600,        # Strategist LLM 최적화 주기 (6시간)
-    "monitor_interval": 30,              # Monitor 체크 주기 (30초)
-    "trader_interval": 5,                # Trader 메시지 폴링 주기 (5초)
+    "monitor_interval": 30,              # Monitor 잔고/Drawdown 체크 주기 (30초, 승인 요청은 도착 즉시 처리)
+    "trader_interval": 5,                # Trader 만료 요청 정리 주기 (5초, 신호/승인은 도착 즉시 처리)
+
+    # LLM 자문 대기 시한 (초) — 넘기면 규칙 기반 판단으로 진행하고 늦은 응답은 기록만
+    "llm_deadlines": {
+        "trade_approval": 5.0,           # 거래 승인 (Monitor)
+        "code_review": 60.0,             # 코드 변경 리뷰 (Monitor, 대기하지 않고 만료 시 거부)
+    },
 
     # 뉴스 소스
     "news_sources": ["cryptopanic", "rss"],
@@ -4,11 +4,14 @@ BaseAgent 추상 클래스
 
 모든 에이전트의 공통 인터페이스 및 라이프사이클 관리.
 스레드 기반으로 run_cycle()을 주기적으로 실행한다.
+event_driven 에이전트는 주기 사이에 메시지가 도착하면 즉시 깨어나
+handle_messages()로 처리한다 (승인/주문 경로의 폴링 지연 제거).
 """
 
 import threading
 import time
 import traceback
+from collections import deque
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional
@@ -19,6 +22,9 @@ from utils.logger import log_system, log_error, log_info
 class BaseAgent(ABC):
     """에이전트 기본 클래스"""
 
+    # True면 메시지 도착 시 즉시 handle_messages() 호출 (run_cycle은 주기 작업만)
+    event_driven = False
+
     def __init__(self, name: str, message_bus, state_manager, llm_client,
                  interval: float = 60.0):
         """
@@ -37,11 +43,14 @@ class BaseAgent(ABC):
 
         self._thread: Optional[threading.Thread] = None
         self._running = False
+        self._stop_event = threading.Event()
         self._cycle_count = 0
+        self._event_count = 0  # 메시지 도착으로 깨어나 처리한 횟수
         self._last_error: Optional[str] = None
         self._started_at: Optional[datetime] = None
         self._skip_emergency_check = False  # Monitor는 True로 설정
         self._last_emergency_log = 0  # 긴급 정지 로그 스팸 방지
+        self._tasks: deque = deque()  # call_soon()으로 예약된 (fn, args)
 
     # ==================== 라이프사이클 ====================
 
@@ -52,6 +61,7 @@ class BaseAgent(ABC):
             return
 
         self._running = True
+        self._stop_event.clear()
         self._started_at = datetime.now()
         self._thread = threading.Thread(
             target=self._run_loop,
@@ -64,6 +74,10 @@ class BaseAgent(ABC):
     def stop(self) -> None:
         """에이전트 안전 정지"""
         self._running = False
+        # 대기 중인 루프를 바로 깨움
+        self._stop_event.set()
+        if self.event_driven:
+            self.message_bus.get_wakeup(self.name).set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=10)
         self.log("🛑 에이전트 정지")
@@ -75,37 +89,80 @@ class BaseAgent(ABC):
     # ==================== 실행 루프 ====================
 
     def _run_loop(self) -> None:
-        """메인 실행 루프"""
+        """메인 실행 루프
+
+        interval마다 run_cycle()을 실행하고, 그 사이에는
+        event_driven 에이전트면 메시지 도착을, 아니면 정지 신호만 기다린다.
+        """
         self.log("실행 루프 시작")
-        while self._running:
-            try:
-                # 긴급 정지 확인 (Monitor는 복구 판단을 위해 계속 실행)
-                if (self.state_manager.is_emergency_stopped()
-                        and not self._skip_emergency_check):
-                    # 60초마다만 로그 출력 (스팸 방지)
-                    now = time.time()
-                    if now - self._last_emergency_log >= 60:
-                        self.log("⚠️ 긴급 정지 상태 — 사이클 건너뜀")
-                        self._last_emergency_log = now
-                    time.sleep(self.interval)
-                    continue
+        wakeup = self.message_bus.get_wakeup(self.name) if self.event_driven else None
+        next_cycle = time.monotonic()
 
+        while self._running:
+            # 긴급 정지 확인 (Monitor는 복구 판단을 위해 계속 실행)
+            if (self.state_manager.is_emergency_stopped()
+                    and not self._skip_emergency_check):
+                # 60초마다만 로그 출력 (스팸 방지)
+                now = time.time()
+                if now - self._last_emergency_log >= 60:
+                    self.log("⚠️ 긴급 정지 상태 — 사이클 건너뜀")
+                    self._last_emergency_log = now
+                self._stop_event.wait(self.interval)
+                continue
+
+            if time.monotonic() >= next_cycle:
                 self._cycle_count += 1
-                self.run_cycle()
-                self._last_error = None
-
-            except Exception as e:
-                self._last_error = str(e)
-                self.log(f"사이클 오류: {e}", level="error")
-                log_error(f"[{self.name}] {traceback.format_exc()}")
-
-            time.sleep(self.interval)
+                self._run_tasks()
+                self._safe_call(self.run_cycle)
+                next_cycle = time.monotonic() + self.interval
+
+            # 다음 주기까지 대기 (event_driven이면 메시지 도착 시 즉시 깨어남)
+            remaining = max(next_cycle - time.monotonic(), 0.0)
+            if wakeup is None:
+                self._stop_event.wait(remaining)
+                continue
+
+            if wakeup.wait(remaining) and self._running:
+                wakeup.clear()
+                self._run_tasks()
+                messages = self.get_messages(timeout=0)
+                if messages:
+                    self._event_count += 1
+                    self._safe_call(self.handle_messages, messages)
+
+    def call_soon(self, fn, *args) -> None:
+        """fn을 에이전트 스레드에서 실행하도록 예약 (다른 스레드의 콜백에서 에이전트 상태를 바꿀 때)
+
+        event_driven 에이전트는 바로 깨어나 실행하고, 아니면 다음 사이클 직전에 실행한다.
+        """
+        self._tasks.append((fn, args))
+        if self.event_driven:
+            self.message_bus.get_wakeup(self.name).set()
+
+    def _run_tasks(self) -> None:
+        while self._tasks:
+            fn, args = self._tasks.popleft()
+            self._safe_call(fn, *args)
+
+    def _safe_call(self, fn, *args) -> None:
+        """사이클/메시지 처리 실행 (예외는 기록만 하고 루프 유지)"""
+        try:
+            fn(*args)
+            self._last_error = None
+        except Exception as e:
+            self._last_error = str(e)
+            self.log(f"사이클 오류: {e}", level="error")
+            log_error(f"[{self.name}] {traceback.format_exc()}")
 
     @abstractmethod
     def run_cycle(self) -> None:
         """한 사이클 실행 (서브클래스에서 구현)"""
         ...
 
+    def handle_messages(self, messages: list) -> None:
+        """도착한 메시지 즉시 처리 (event_driven 에이전트가 구현)"""
+        ...
+
     # ==================== 메시지 ====================
 
     def send_message(self, msg_type: str, data: dict,
@@ -143,6 +200,8 @@ class BaseAgent(ABC):
             "name": self.name,
             "running": self._running,
             "cycle_count": self._cycle_count,
+            "event_count": self._event_count,
+            "event_driven": self.event_driven,
             "interval": self.interval,
             "last_error": self._last_error,
             "started_at": self._started_at.isoformat() if self._started_at else None,
@@ -0,0 +1,286 @@
+# agents/bus_transport.py
+"""
+에이전트 팀 프로세스 간 전송 계층
+
+기본은 한 프로세스 안에서 MessageBus를 스레드로 공유한다.
+LLM CLI 호출(최대 120초)이나 뉴스 파싱처럼 무거운 에이전트를 별도 프로세스로
+분리하면 Trader/Monitor 스레드와 GIL을 다투지 않는다.
+
+- 메인 프로세스: AgentTeamServer가 MessageBus / StateManager / StrategyModifier를
+  multiprocessing.managers 서버(로컬 Unix 도메인 소켓, Windows는 named pipe)로 공개
+- 자식 프로세스: RemoteMessageBus가 발행은 서버의 MessageBus로 전달하고,
+  수신 메시지는 롱 폴링 스레드가 로컬 AgentQueue로 옮겨 wakeup 이벤트를 set
+  (BaseAgent 실행 루프는 그대로 동작)
+- StateManager / StrategyModifier는 프록시로 접근 — 메서드는 메인 프로세스에서 실행되고
+  결과는 복사본으로 돌아오므로 모든 프로세스가 같은 상태를 본다
+"""
+
+import os
+import signal
+import threading
+from multiprocessing.managers import BaseManager, EventProxy
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from agents.message_bus import AgentQueue, DEFAULT_MAX_QUEUE_SIZE
+from utils.logger import log_system, log_error
+
+
+# 서버가 공개하는 공유 객체 이름
+SHARED_OBJECTS = ("message_bus", "state_manager", "strategy_modifier")
+
+
+class AgentTeamServer:
+    """
+    공유 객체 서버 (메인 프로세스의 백그라운드 스레드에서 실행)
+
+    사용법:
+        server = AgentTeamServer(message_bus, state_manager, strategy_modifier)
+        server.start()
+        proc = server.spawn_agent(factory, args)   # 자식 프로세스에서 에이전트 실행
+        ...
+        server.stop()
+    """
+
+    def __init__(self, message_bus, state_manager, strategy_modifier=None,
+                 address=None, authkey: bytes = None):
+        """
+        Args:
+            message_bus: 메인 프로세스의 MessageBus
+            state_manager: StateManager 인스턴스
+            strategy_modifier: StrategyModifier 인스턴스
+            address: 서버 주소 (None이면 임시 Unix 소켓 경로 자동 생성)
+            authkey: 연결 인증 키 (None이면 무작위)
+        """
+        self.authkey = authkey or os.urandom(16)
+        self._shutdown = threading.Event()
+        shared = {
+            "message_bus": message_bus,
+            "state_manager": state_manager,
+            "strategy_modifier": strategy_modifier,
+        }
+
+        # 서버 쪽 등록은 인스턴스 전용 클래스에 (클래스 레지스트리를 다른 서버와 공유하지 않도록)
+        manager_cls = type("AgentTeamServerManager", (BaseManager,), {})
+        for name, obj in shared.items():
+            manager_cls.register(name, callable=lambda obj=obj: obj)
+        manager_cls.register("shutdown_event", callable=lambda: self._shutdown,
+                             proxytype=EventProxy)
+
+        self._server = manager_cls(address=address, authkey=self.authkey).get_server()
+        self.address = self._server.address
+        self._thread: Optional[threading.Thread] = None
+        self._processes: List[Any] = []
+
+    def start(self) -> None:
+        """서버 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._serve, name="agent-team-server", daemon=True,
+        )
+        self._thread.start()
+        log_system(f"[AgentTeamServer] 시작: {self.address}")
+
+    def _serve(self) -> None:
+        try:
+            self._server.serve_forever()
+        except SystemExit:
+            # serve_forever는 종료 시 sys.exit(0) 호출 (이 스레드만 종료)
+            pass
+
+    def spawn_agent(self, factory: Callable, factory_args: Tuple = (),
+                    agent_config: Optional[Dict] = None, name: str = None):
+        """
+        에이전트 1개를 자식 프로세스로 실행 (spawn 방식 — 부모의 스레드/소켓 상태를 물려받지 않음)
+
+        Args:
+            factory: (message_bus, state_manager, strategy_modifier, *factory_args) → BaseAgent
+                     (모듈 최상위 함수여야 함)
+            factory_args: factory 추가 인자 (pickle 가능해야 함)
+            agent_config: 자식 프로세스의 AGENT_TEAM_CONFIG에 덮어쓸 값
+            name: 프로세스 이름
+        """
+        import multiprocessing
+        ctx = multiprocessing.get_context("spawn")
+        proc = ctx.Process(
+            target=run_remote_agent,
+            args=(self.address, bytes(self.authkey), factory, tuple(factory_args), agent_config),
+            name=name or "agent-process",
+            daemon=True,
+        )
+        proc.start()
+        self._processes.append(proc)
+        return proc
+
+    def stop(self, timeout: float = 15.0) -> None:
+        """자식 프로세스에 종료 신호 → 대기 → 서버 종료"""
+        self._shutdown.set()
+        for proc in self._processes:
+            proc.join(timeout=timeout)
+            if proc.is_alive():
+                log_error(f"[AgentTeamServer] {proc.name} 종료 지연 — 강제 종료")
+                proc.terminate()
+        self._processes.clear()
+
+        stop_event = getattr(self._server, "stop_event", None)
+        if stop_event is not None:
+            stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        try:
+            self._server.listener.close()
+        except Exception:
+            pass
+        log_system("[AgentTeamServer] 종료")
+
+    def get_status(self) -> dict:
+        return {
+            "address": str(self.address),
+            "processes": {
+                p.name: {"pid": p.pid, "alive": p.is_alive()} for p in self._processes
+            },
+        }
+
+
+class AgentTeamClient(BaseManager):
+    """자식 프로세스 쪽 매니저 (공유 객체 프록시 생성)"""
+
+
+for _name in SHARED_OBJECTS:
+    AgentTeamClient.register(_name)
+AgentTeamClient.register("shutdown_event", proxytype=EventProxy)
+
+
+class RemoteMessageBus:
+    """
+    원격 MessageBus 클라이언트 (MessageBus와 같은 인터페이스)
+
+    구독한 에이전트마다 펌프 스레드가 서버의 get_messages()를 롱 폴링해
+    로컬 우선순위 큐로 옮긴다 (프록시는 스레드별로 연결을 따로 연다).
+    """
+
+    def __init__(self, bus_proxy, poll_timeout: float = 1.0,
+                 max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        """
+        Args:
+            bus_proxy: 서버 MessageBus 프록시
+            poll_timeout: 롱 폴링 대기 시간 (초)
+            max_queue_size: 로컬 큐 최대 메시지 수
+        """
+        self._bus = bus_proxy
+        self._poll_timeout = poll_timeout
+        self._max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._queues: Dict[str, AgentQueue] = {}
+        self._pumps: Dict[str, threading.Thread] = {}
+        self._closed = threading.Event()
+
+    def _queue_for(self, agent_name: str) -> AgentQueue:
+        with self._lock:
+            q = self._queues.get(agent_name)
+            if q is None:
+                q = self._queues[agent_name] = AgentQueue(self._max_queue_size)
+            return q
+
+    def subscribe(self, agent_name: str, message_types: List[str]) -> None:
+        """서버에 구독 등록 후 수신 펌프 시작"""
+        self._bus.subscribe(agent_name, list(message_types))
+        q = self._queue_for(agent_name)
+        with self._lock:
+            if agent_name in self._pumps:
+                return
+            pump = threading.Thread(
+                target=self._pump, args=(agent_name, q),
+                name=f"bus-pump-{agent_name}", daemon=True,
+            )
+            self._pumps[agent_name] = pump
+        pump.start()
+
+    def _pump(self, agent_name: str, q: AgentQueue) -> None:
+        while not self._closed.is_set():
+            try:
+                messages = self._bus.get_messages(agent_name, self._poll_timeout)
+            except (EOFError, OSError) as e:
+                if not self._closed.is_set():
+                    log_error(f"[RemoteMessageBus] 서버 연결 끊김 ({agent_name}): {e}")
+                self._closed.set()
+                q.wakeup.set()
+                return
+            for message in messages:
+                q.put(message)
+
+    def get_wakeup(self, agent_name: str) -> threading.Event:
+        return self._queue_for(agent_name).wakeup
+
+    def publish(self, message: dict) -> None:
+        self._bus.publish(message)
+
+    def broadcast(self, message: dict) -> None:
+        message["to"] = "all"
+        self.publish(message)
+
+    def get_messages(self, agent_name: str, timeout: float = 0.1) -> List[dict]:
+        q = self._queues.get(agent_name)
+        if q is None:
+            return []
+        return q.get_all(timeout)
+
+    def get_history(self, limit: int = 50, msg_type: Optional[str] = None) -> List[dict]:
+        return self._bus.get_history(limit, msg_type)
+
+    def get_stats(self) -> dict:
+        stats = self._bus.get_stats()
+        stats["local_queues"] = {name: q.get_stats() for name, q in self._queues.items()}
+        return stats
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def close(self) -> None:
+        self._closed.set()
+        for pump in list(self._pumps.values()):
+            pump.join(timeout=self._poll_timeout + 1)
+
+
+def connect(address, authkey: bytes) -> AgentTeamClient:
+    """서버 연결"""
+    client = AgentTeamClient(address=address, authkey=authkey)
+    client.connect()
+    return client
+
+
+def run_remote_agent(address, authkey: bytes, factory: Callable, factory_args: Tuple = (),
+                     agent_config: Optional[Dict] = None) -> None:
+    """
+    자식 프로세스 진입점: 서버에 연결해 에이전트 1개를 실행하고 종료 신호까지 대기
+
+    Args:
+        address: AgentTeamServer 주소
+        authkey: 인증 키
+        factory: (message_bus, state_manager, strategy_modifier, *factory_args) → BaseAgent
+        factory_args: factory 추가 인자
+        agent_config: AGENT_TEAM_CONFIG에 덮어쓸 값 (부모의 CLI 설정 전달용)
+    """
+    # Ctrl+C는 부모가 받아 shutdown 이벤트로 전달
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if agent_config:
+        from agents.agent_config import AGENT_TEAM_CONFIG
+        AGENT_TEAM_CONFIG.update(agent_config)
+
+    client = connect(address, authkey)
+    bus = RemoteMessageBus(client.message_bus())
+    shutdown = client.shutdown_event()
+    agent = factory(bus, client.state_manager(), client.strategy_modifier(), *factory_args)
+
+    agent.start()
+    try:
+        while not shutdown.is_set() and not bus.closed and agent.is_running:
+            shutdown.wait(1.0)
+    except (EOFError, OSError):
+        pass
+    finally:
+        agent.stop()
+        bus.close()
@@ -7,12 +7,22 @@ Claude LLM 클라이언트
 2. Claude Code CLI (claude 명령어) — 기존 Claude 구독 사용
 
 우선순위: Anthropic API → Claude Code CLI → 비활성
+
+시장 분석 / 리스크 평가 / 거래 승인 판단은 응답 캐시를 거친다:
+입력을 양자화한 키(EMA-가격 차이 반올림, 뉴스 해시 등)가 같으면 TTL 동안 이전 응답을 재사용하고,
+같은 키의 요청이 진행 중이면 새로 호출하지 않고 그 결과를 함께 기다린다.
 """
 
+import hashlib
 import json
+import math
 import subprocess
 import shutil
-from typing import Dict, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Optional, Any, Tuple
 
 from utils.logger import log_system, log_error
 
@@ -25,6 +35,85 @@ except ImportError:
     HAS_ANTHROPIC = False
 
 
+# 응답 캐시 TTL (초) — 없는 종류는 캐시하지 않음
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "analyze_market": 300.0,
+    "assess_risk": 300.0,
+    "evaluate_trade_request": 120.0,
+}
+
+# 캐시 최대 항목 수 (LRU)
+DEFAULT_CACHE_SIZE = 256
+
+# submit()으로 동시에 실행할 수 있는 LLM 호출 수 (CLI 서브프로세스 수 상한)
+DEFAULT_MAX_CONCURRENT = 2
+
+# 캐시 키 양자화 단위
+PRICE_LOG_STEP = 0.002     # 가격: 약 0.2%
+EMA_DELTA_STEP = 0.0005    # (EMA - 가격) / 가격: 5bp
+PCT_STEP = 0.05            # 변동률(%): 0.05%p
+
+# 캐시 키에서 제외하는 필드 (매번 달라지지만 판단에는 영향 없음)
+_VOLATILE_KEYS = frozenset({
+    "timestamp", "request_id", "last_balance_update", "reasoning", "_seq", "_published_at",
+})
+
+
+def _quantize(value: float, step: float) -> int:
+    return int(round(value / step))
+
+
+def _normalize(obj: Any) -> Any:
+    """캐시 키용 정규화 (변동 필드 제거, 실수는 유효숫자 3자리)"""
+    if isinstance(obj, dict):
+        return {str(k): _normalize(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))
+                if k not in _VOLATILE_KEYS}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(v) for v in obj]
+    if isinstance(obj, bool) or obj is None or isinstance(obj, (int, str)):
+        return obj
+    if isinstance(obj, float):
+        return float(f"{obj:.3g}") if math.isfinite(obj) else str(obj)
+    return str(obj)
+
+
+def _digest(payload: Any) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _market_cache_key(price_data: Dict, ema_data: Dict, news_summary: str) -> Dict[str, Any]:
+    """시장 분석 캐시 키 (가격은 로그 스케일, EMA는 가격 대비 차이로 양자화)"""
+    price = float(price_data.get("current_price") or 0.0)
+    key: Dict[str, Any] = {
+        "symbol": price_data.get("symbol"),
+        "news": _digest(news_summary or ""),
+    }
+    if price > 0:
+        key["price"] = _quantize(math.log(price), PRICE_LOG_STEP)
+        key["ema"] = {
+            name: _quantize((float(value) - price) / price, EMA_DELTA_STEP)
+            for name, value in sorted(ema_data.items())
+            if isinstance(value, (int, float))
+        }
+    for name in ("change_1m_pct", "change_30m_pct"):
+        if name in price_data:
+            key[name] = _quantize(float(price_data[name]), PCT_STEP)
+    return key
+
+
+class LLMBusyError(RuntimeError):
+    """submit() 동시 실행 한도 초과 (실행 중인 호출이 끝날 때까지 새 호출을 받지 않음)"""
+
+
+class _InFlight:
+    """진행 중인 LLM 호출 (같은 키 요청이 결과를 함께 기다림)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.text: Optional[str] = None
+
+
 def _find_claude_cli() -> Optional[str]:
     """claude CLI 경로 탐색"""
     path = shutil.which("claude")
@@ -47,12 +136,17 @@ class LLMClient:
     """Claude LLM 클라이언트 (API + CLI 듀얼 백엔드)"""
 
     def __init__(self, api_key: str = "", model: str = "claude-sonnet-4-5-20250929",
-                 use_cli: bool = True):
+                 use_cli: bool = True, cache_ttls: Optional[Dict[str, float]] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT):
         """
         Args:
             api_key: Anthropic API 키 (없으면 CLI 모드)
             model: Anthropic API 모델 ID
             use_cli: True면 API 실패 시 Claude Code CLI 사용
+            cache_ttls: 종류별 응답 캐시 TTL (초), None이면 DEFAULT_CACHE_TTLS, {}면 캐시 안 함
+            cache_size: 응답 캐시 최대 항목 수
+            max_concurrent: submit() 동시 실행 한도
         """
         self.api_key = api_key
         self.model = model
@@ -61,6 +155,20 @@ class LLMClient:
         self._backend = "none"
         self._call_count = 0
 
+        # 응답 캐시: 키 → (만료 monotonic 시각, 응답 텍스트, 원 호출 소요 시간)
+        self._cache_ttls = dict(DEFAULT_CACHE_TTLS if cache_ttls is None else cache_ttls)
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, str, float]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], _InFlight] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_stats = {
+            "requests": 0, "hits": 0, "coalesced": 0, "misses": 0,
+            "evictions": 0, "saved_seconds": 0.0, "call_seconds": 0.0,
+        }
+
+        # submit() 슬롯 (시한을 넘긴 호출도 끝날 때까지 슬롯을 잡고 있음)
+        self._submit_slots = threading.BoundedSemaphore(max_concurrent)
+
         # 1순위: Anthropic API
         if HAS_ANTHROPIC and api_key:
             try:
@@ -114,6 +222,100 @@ class LLMClient:
             return self._call_cli(system_prompt, user_prompt)
         return None
 
+    def _cached_call(self, kind: str, key_payload: Any, system_prompt: str,
+                     user_prompt: str, max_tokens: int = 1024) -> Optional[str]:
+        """
+        캐시/중복 제거를 거치는 LLM 호출
+
+        Args:
+            kind: 요청 종류 (TTL 선택, 키 구분)
+            key_payload: 캐시 키로 쓸 정규화된 입력
+        """
+        ttl = self._cache_ttls.get(kind, 0.0)
+        if ttl <= 0:
+            return self._call(system_prompt, user_prompt, max_tokens)
+
+        key = (kind, _digest(key_payload))
+        with self._cache_lock:
+            self._cache_stats["requests"] += 1
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires, text, elapsed = entry
+                if expires > time.monotonic():
+                    self._cache.move_to_end(key)
+                    self._cache_stats["hits"] += 1
+                    self._cache_stats["saved_seconds"] += elapsed
+                    return text
+                del self._cache[key]
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _InFlight()
+                self._cache_stats["misses"] += 1
+            else:
+                self._cache_stats["coalesced"] += 1
+
+        if not leader:
+            # CLI 타임아웃(120초)보다 조금 길게 대기
+            flight.done.wait(150)
+            return flight.text
+
+        started = time.monotonic()
+        text = None
+        try:
+            text = self._call(system_prompt, user_prompt, max_tokens)
+        finally:
+            elapsed = time.monotonic() - started
+            with self._cache_lock:
+                self._cache_stats["call_seconds"] += elapsed
+                if text:
+                    self._cache[key] = (time.monotonic() + ttl, text, elapsed)
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+                        self._cache_stats["evictions"] += 1
+                self._inflight.pop(key, None)
+            flight.text = text
+            flight.done.set()
+        return text
+
+    def submit(self, method: str, *args, **kwargs) -> Future:
+        """
+        LLM 호출을 별도 스레드에서 실행 (호출부는 future.result(timeout)으로 대기 시간을 제한)
+
+        ThreadPoolExecutor 대신 데몬 스레드를 쓴다 — 시한을 넘긴 CLI 호출(최대 120초)이
+        프로그램 종료를 붙잡지 않도록. 동시 실행은 max_concurrent개로 제한하고,
+        슬롯이 없으면 대기열에 쌓지 않고 LLMBusyError로 끝난 future를 바로 반환한다
+        (응답 없는 CLI가 서브프로세스를 계속 늘리지 않도록).
+
+        Args:
+            method: 호출할 메서드 이름 (예: "evaluate_trade_request")
+        """
+        fn = getattr(self, method)
+        future: Future = Future()
+        if not self._submit_slots.acquire(blocking=False):
+            future.set_exception(LLMBusyError(f"LLM 동시 호출 한도 초과 ({method})"))
+            return future
+
+        def _run():
+            try:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+            finally:
+                self._submit_slots.release()
+
+        threading.Thread(target=_run, name=f"llm-{method}", daemon=True).start()
+        return future
+
+    def clear_cache(self) -> None:
+        """응답 캐시 비우기 (전략 변경 직후 등)"""
+        with self._cache_lock:
+            self._cache.clear()
+
     def _call_api(self, system_prompt: str, user_prompt: str,
                   max_tokens: int) -> Optional[str]:
         """Anthropic API 호출"""
@@ -244,7 +446,10 @@ EMA 지표:
 
 종합 분석 후 매매 신호를 JSON으로 응답하세요."""
 
-        text = self._call(system_prompt, user_prompt)
+        text = self._cached_call(
+            "analyze_market", _market_cache_key(price_data, ema_data, news_summary),
+            system_prompt, user_prompt,
+        )
         return self._parse_json_response(text, default)
 
     # ==================== 전략 최적화 (Strategist용) ====================
@@ -372,7 +577,10 @@ EMA 지표:
 
 리스크를 평가하고 JSON으로 응답하세요."""
 
-        text = self._call(system_prompt, user_prompt)
+        text = self._cached_call(
+            "assess_risk", _normalize({"portfolio": portfolio_state, "market": market_conditions}),
+            system_prompt, user_prompt,
+        )
         return self._parse_json_response(text, default)
 
     # ==================== 거래 승인 판단 (Monitor용) ====================
@@ -413,16 +621,29 @@ EMA 지표:
 
 이 거래를 승인할까요? JSON으로 응답하세요."""
 
-        text = self._call(system_prompt, user_prompt)
+        text = self._cached_call(
+            "evaluate_trade_request",
+            _normalize({"request": trade_request, "portfolio": portfolio_state}),
+            system_prompt, user_prompt,
+        )
         return self._parse_json_response(text, default)
 
     # ==================== 통계 ====================
 
     def get_stats(self) -> Dict[str, Any]:
-        """LLM 호출 통계"""
+        """LLM 호출 통계 (응답 캐시 적중률 / 절약 시간 포함)"""
+        with self._cache_lock:
+            cache = dict(self._cache_stats)
+            cache["size"] = len(self._cache)
+        served = cache["hits"] + cache["coalesced"]
+        cache["hit_rate"] = served / cache["requests"] if cache["requests"] else 0.0
+        cache["avg_call_seconds"] = (
+            cache["call_seconds"] / cache["misses"] if cache["misses"] else 0.0
+        )
         return {
             "available": self.is_available,
             "backend": self._backend,
             "model": self.model if self._backend == "api" else "claude-code-cli",
             "call_count": self._call_count,
+            "cache": cache,
         }
@@ -2,15 +2,21 @@
 """
 에이전트 간 통신 메시지 버스
 
-Queue 기반 thread-safe 구독/발행 패턴.
+thread-safe 구독/발행 패턴.
 각 에이전트는 관심 있는 메시지 타입을 구독하고,
 해당 타입의 메시지만 수신한다.
+메시지가 큐에 들어가면 수신 에이전트의 wakeup 이벤트를 set해서
+대기 중인 에이전트를 즉시 깨운다.
+
+에이전트별 큐는 우선순위 레인으로 나뉘어 긴급 정지 → 승인 흐름 → 신호/결과 →
+변경 요청 → 상태 보고 순으로 꺼내진다. 큐 용량을 넘으면 우선순위가 가장 낮은
+레인의 오래된 메시지부터 버리고, 상태 보고는 같은 발신자/이벤트의 최신 것만 남긴다.
 """
 
-import queue
 import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from collections import deque
 
 from utils.logger import log_system
@@ -27,24 +33,190 @@ MSG_REJECTION = "REJECTION"            # Monitor → 거부
 MSG_EMERGENCY_STOP = "EMERGENCY_STOP"  # Monitor → 긴급 정지
 MSG_STATUS = "STATUS"                  # 상태 보고
 
+# 메시지 우선순위 (작을수록 먼저 꺼냄)
+PRIORITY_EMERGENCY = 0
+PRIORITY_APPROVAL = 1
+PRIORITY_TRADE = 2
+PRIORITY_CHANGE = 3
+PRIORITY_STATUS = 4
+
+MESSAGE_PRIORITY: Dict[str, int] = {
+    MSG_EMERGENCY_STOP: PRIORITY_EMERGENCY,
+    MSG_TRADE_REQUEST: PRIORITY_APPROVAL,
+    MSG_APPROVAL: PRIORITY_APPROVAL,
+    MSG_REJECTION: PRIORITY_APPROVAL,
+    MSG_SIGNAL: PRIORITY_TRADE,
+    MSG_TRADE_RESULT: PRIORITY_TRADE,
+    MSG_PARAM_CHANGE: PRIORITY_CHANGE,
+    MSG_CODE_CHANGE: PRIORITY_CHANGE,
+    MSG_STATUS: PRIORITY_STATUS,
+}
+
+# 대기 중인 같은 키의 메시지를 최신 것으로 교체하는 타입
+COALESCE_TYPES = frozenset({MSG_STATUS})
+
+# 에이전트별 큐 최대 메시지 수
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+
+class AgentQueue:
+    """에이전트 1개의 우선순위 레인 큐 (용량 제한 + 상태 메시지 병합)"""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        self.max_size = max_size
+        self._cond = threading.Condition()
+        # 우선순위 → [메시지, 넣은 시각] 셀 deque (병합 시 셀 내용만 교체)
+        self._lanes: Dict[int, deque] = {}
+        self._coalesce: Dict[tuple, list] = {}
+        self._size = 0
+        # 메시지 도착 시 set (BaseAgent 실행 루프가 대기)
+        self.wakeup = threading.Event()
+
+        # 통계
+        self.dropped: Dict[str, int] = {}
+        self.coalesced = 0
+        self.dequeued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @staticmethod
+    def _coalesce_key(message: dict) -> tuple:
+        data = message.get("data") or {}
+        return message.get("type"), message.get("from"), data.get("event")
+
+    def put(self, message: dict) -> bool:
+        """
+        메시지 추가
+
+        Returns:
+            큐에 들어갔는지 (용량 초과로 버려졌으면 False)
+        """
+        msg_type = message.get("type", "")
+        priority = MESSAGE_PRIORITY.get(msg_type, PRIORITY_CHANGE)
+        now = time.monotonic()
+
+        with self._cond:
+            key = None
+            if msg_type in COALESCE_TYPES:
+                key = self._coalesce_key(message)
+                cell = self._coalesce.get(key)
+                if cell is not None:
+                    # 대기 순서는 유지하고 내용만 최신으로 교체
+                    cell[0] = message
+                    self.coalesced += 1
+                    self.wakeup.set()
+                    return True
+
+            if self._size >= self.max_size and not self._evict(priority):
+                self._count_drop(msg_type)
+                return False
+
+            cell = [message, now]
+            self._lanes.setdefault(priority, deque()).append(cell)
+            if key is not None:
+                self._coalesce[key] = cell
+            self._size += 1
+            self._cond.notify()
+        self.wakeup.set()
+        return True
+
+    def _evict(self, priority: int) -> bool:
+        """새 메시지보다 중요하지 않은 레인 중 가장 낮은 레인의 가장 오래된 메시지 제거 (_cond 보유)"""
+        for lane_priority in sorted(self._lanes, reverse=True):
+            if lane_priority < priority:
+                break
+            lane = self._lanes[lane_priority]
+            if lane:
+                cell = lane.popleft()
+                self._forget(cell)
+                self._size -= 1
+                self._count_drop(cell[0].get("type", ""))
+                return True
+        return False
+
+    def _forget(self, cell: list) -> None:
+        message = cell[0]
+        if message.get("type") in COALESCE_TYPES:
+            key = self._coalesce_key(message)
+            if self._coalesce.get(key) is cell:
+                del self._coalesce[key]
+
+    def _count_drop(self, msg_type: str) -> None:
+        self.dropped[msg_type] = self.dropped.get(msg_type, 0) + 1
+
+    def get_all(self, timeout: float = 0.1) -> List[dict]:
+        """
+        대기 중인 메시지 모두 꺼내기 (우선순위 순, 같은 레인은 FIFO)
+
+        Args:
+            timeout: 큐가 비어 있을 때 최초 대기 시간 (초)
+        """
+        with self._cond:
+            if not self._size and timeout and timeout > 0:
+                self._cond.wait(timeout)
+            if not self._size:
+                return []
+
+            now = time.monotonic()
+            messages = []
+            for priority in sorted(self._lanes):
+                lane = self._lanes[priority]
+                while lane:
+                    cell = lane.popleft()
+                    self._forget(cell)
+                    wait = now - cell[1]
+                    self.total_wait += wait
+                    if wait > self.max_wait:
+                        self.max_wait = wait
+                    messages.append(cell[0])
+            self.dequeued += len(messages)
+            self._size = 0
+            return messages
+
+    def qsize(self) -> int:
+        return self._size
+
+    def get_stats(self) -> dict:
+        with self._cond:
+            return {
+                "depth": self._size,
+                "depth_by_priority": {p: len(l) for p, l in sorted(self._lanes.items()) if l},
+                "dropped": dict(self.dropped),
+                "coalesced": self.coalesced,
+                "dequeued": self.dequeued,
+                "avg_wait_ms": self.total_wait / self.dequeued * 1000 if self.dequeued else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
 
 class MessageBus:
     """Thread-safe 메시지 버스"""
 
-    def __init__(self, max_history: int = 500):
+    def __init__(self, max_history: int = 500, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
         """
         Args:
             max_history: 메시지 히스토리 최대 보관 수
+            max_queue_size: 에이전트별 큐 최대 메시지 수
         """
         self._lock = threading.Lock()
+        self._max_queue_size = max_queue_size
         # 에이전트별 메시지 큐
-        self._queues: Dict[str, queue.Queue] = {}
+        self._queues: Dict[str, AgentQueue] = {}
         # 에이전트별 구독 메시지 타입
         self._subscriptions: Dict[str, List[str]] = {}
+        # 메시지 타입 → 구독 에이전트 (subscribe 시 재구성)
+        self._routes: Dict[str, Tuple[str, ...]] = {}
         # 전체 메시지 히스토리
         self._history: deque = deque(maxlen=max_history)
         self._message_count = 0
 
+    def _queue_for(self, agent_name: str) -> AgentQueue:
+        """에이전트 큐 (없으면 생성, _lock 보유 상태에서 호출)"""
+        q = self._queues.get(agent_name)
+        if q is None:
+            q = self._queues[agent_name] = AgentQueue(self._max_queue_size)
+        return q
+
     def subscribe(self, agent_name: str, message_types: List[str]) -> None:
         """
         메시지 타입 구독 등록
@@ -55,10 +227,24 @@ class MessageBus:
         """
         with self._lock:
             self._subscriptions[agent_name] = message_types
-            if agent_name not in self._queues:
-                self._queues[agent_name] = queue.Queue()
+            self._queue_for(agent_name)
+
+            routes: Dict[str, List[str]] = {}
+            for name, types in self._subscriptions.items():
+                for msg_type in types:
+                    routes.setdefault(msg_type, []).append(name)
+            self._routes = {t: tuple(names) for t, names in routes.items()}
         log_system(f"[MessageBus] {agent_name} 구독: {message_types}")
 
+    def get_wakeup(self, agent_name: str) -> threading.Event:
+        """
+        에이전트 wakeup 이벤트 (메시지가 전달되면 set)
+
+        에이전트는 이벤트를 clear한 뒤 큐를 비워야 그 사이 도착한 메시지를 놓치지 않는다.
+        """
+        with self._lock:
+            return self._queue_for(agent_name).wakeup
+
     def publish(self, message: dict) -> None:
         """
         메시지 발행 — 구독자에게 전달
@@ -69,26 +255,26 @@ class MessageBus:
         with self._lock:
             self._message_count += 1
             message["_seq"] = self._message_count
+            # 지연 시간 측정용 발행 시각 (time.monotonic())
+            message["_published_at"] = time.monotonic()
             self._history.append(message)
 
             msg_type = message.get("type", "")
             msg_to = message.get("to", "all")
             msg_from = message.get("from", "unknown")
 
-            for agent_name, subscribed_types in self._subscriptions.items():
+            for agent_name in self._routes.get(msg_type, ()):
                 # 자기 자신에게는 전달하지 않음
                 if agent_name == msg_from:
                     continue
                 # 수신 대상 필터
                 if msg_to != "all" and msg_to != agent_name:
                     continue
-                # 구독 타입 필터
-                if msg_type in subscribed_types:
-                    self._queues[agent_name].put(message)
+                self._queues[agent_name].put(message)
 
     def get_messages(self, agent_name: str, timeout: float = 0.1) -> List[dict]:
         """
-        에이전트의 수신 메시지 모두 가져오기
+        에이전트의 수신 메시지 모두 가져오기 (우선순위 순)
 
         Args:
             agent_name: 에이전트 이름
@@ -97,26 +283,10 @@ class MessageBus:
         Returns:
             수신된 메시지 리스트
         """
-        messages = []
         q = self._queues.get(agent_name)
         if q is None:
-            return messages
-
-        # 첫 메시지는 timeout 대기
-        try:
-            msg = q.get(timeout=timeout)
-            messages.append(msg)
-        except queue.Empty:
-            return messages
-
-        # 나머지는 즉시 가져오기
-        while not q.empty():
-            try:
-                messages.append(q.get_nowait())
-            except queue.Empty:
-                break
-
-        return messages
+            return []
+        return q.get_all(timeout)
 
     def broadcast(self, message: dict) -> None:
         """모든 에이전트에게 메시지 발송"""
@@ -141,13 +311,16 @@ class MessageBus:
             return history[-limit:]
 
     def get_stats(self) -> dict:
-        """메시지 버스 통계"""
+        """메시지 버스 통계 (큐 깊이, 대기 시간, 버림/병합 수 포함)"""
         with self._lock:
+            queues = {name: q.get_stats() for name, q in self._queues.items()}
             return {
                 "total_messages": self._message_count,
                 "subscribers": list(self._subscriptions.keys()),
                 "history_size": len(self._history),
                 "queue_sizes": {
-                    name: q.qsize() for name, q in self._queues.items()
+                    name: st["depth"] for name, st in queues.items()
                 },
+                "dropped_total": sum(sum(st["dropped"].values()) for st in queues.values()),
+                "queues": queues,
             }
@@ -4,14 +4,22 @@ Agent 4: Monitor (리스크 관리 & 승인)
 
 역할:
 - 포트폴리오 상태 실시간 감시 (30초 주기)
-- 거래 요청 승인/거부
+- 거래 요청 승인/거부 (요청 도착 즉시, 주기 감시와 별도 경로)
 - 파라미터 변경 범위 검증
 - 코드 변경 Claude API 리뷰
 - 긴급 정지 조건 감시 (Drawdown 기반)
+
+LLM 자문은 별도 스레드에서 실행하고 호출 지점별 시한(llm_deadlines)까지만 기다린다.
+시한을 넘기면 규칙 기반 판단으로 진행하고, 늦게 도착한 LLM 판단은 보정용으로 기록한다.
+코드 리뷰는 아예 기다리지 않고, 결과 도착 / 시한 만료 시 Monitor 스레드에서 마무리한다.
 """
 
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from agents.base_agent import BaseAgent
 from agents.message_bus import (
@@ -26,6 +34,8 @@ from utils.logger import log_system, log_error
 class MonitorAgent(BaseAgent):
     """리스크 관리 & 승인 에이전트"""
 
+    event_driven = True
+
     def __init__(self, message_bus, state_manager, llm_client,
                  strategy_modifier, order_manager=None):
         """
@@ -48,6 +58,15 @@ class MonitorAgent(BaseAgent):
         self._min_confidence = AGENT_TEAM_CONFIG.get("min_signal_confidence", 0.7)
         self._max_position_pct = AGENT_TEAM_CONFIG.get("max_position_pct", 0.30)
         self._dry_run = AGENT_TEAM_CONFIG.get("dry_run", False)
+        self._llm_deadlines = AGENT_TEAM_CONFIG.get("llm_deadlines", {})
+
+        # LLM 자문 통계 (호출 지점별) + 시한 초과 후 도착한 판단 (규칙 판단과 비교용)
+        self._advisory_lock = threading.Lock()
+        self._advisory_stats: Dict[str, Dict[str, int]] = {}
+        self._late_verdicts: deque = deque(maxlen=100)
+
+        # 리뷰 중인 코드 변경: change_id → {"msg", "future", "timer"}
+        self._pending_reviews: Dict[str, Dict[str, Any]] = {}
 
         # Monitor는 긴급 정지 중에도 실행 (복구 판단 위해)
         self._skip_emergency_check = True
@@ -59,7 +78,7 @@ class MonitorAgent(BaseAgent):
         ])
 
     def run_cycle(self) -> None:
-        """Monitor 사이클 실행"""
+        """Monitor 주기 사이클 (상태 갱신 + Drawdown 감시)"""
         # 1. 상태 갱신
         self.state_manager.refresh_balance()
         self.state_manager.refresh_positions()
@@ -67,14 +86,17 @@ class MonitorAgent(BaseAgent):
         # 2. Drawdown 모니터링
         self._check_drawdown()
 
-        # 3. 수신 메시지 처리 (승인 요청 등)
-        messages = self.get_messages(timeout=0.5)
-        for msg in messages:
-            self._handle_message(msg)
+        # 3. 남은 수신 메시지 처리 (보통은 도착 즉시 handle_messages에서 처리됨)
+        self.handle_messages(self.get_messages(timeout=0))
 
-        # 4. 보류 중인 코드 변경 처리
+        # 4. 리뷰 결과가 나왔거나 시한이 지난 코드 변경 처리
         self._process_pending_code_changes()
 
+    def handle_messages(self, messages: list) -> None:
+        """승인 요청 등 즉시 처리 (REST 갱신 없이 마지막 주기의 상태로 판단)"""
+        for msg in messages:
+            self._handle_message(msg)
+
     # ==================== Drawdown 감시 ====================
 
     def _check_drawdown(self) -> None:
@@ -213,15 +235,22 @@ class MonitorAgent(BaseAgent):
                 return
 
         # LLM 판단 (신규 진입만 — 청산은 즉시 승인)
+        reason = "청산 승인" if is_close else "모든 검증 통과"
         if not is_close and self.llm_client and self.llm_client.is_available:
             portfolio_state = self.state_manager.get_team_status()
-            result = self.llm_client.evaluate_trade_request(data, portfolio_state)
-            if not result.get("approved", False):
+            result, late = self._ask_llm(
+                "trade_approval", "evaluate_trade_request", data, portfolio_state,
+            )
+            if result is None:
+                # 시한 초과 / 호출 불가: 규칙 검증 결과(승인)로 진행
+                if late is not None:
+                    self._watch_late_verdict("trade_approval", request_id, True, late)
+                reason = "모든 검증 통과 (LLM 판단 없음 — 규칙 기반 승인)"
+            elif not result.get("approved", False):
                 self._reject(msg, request_id, f"LLM 거부: {result.get('reasoning', 'N/A')}")
                 return
 
         # 승인
-        reason = "청산 승인" if is_close else "모든 검증 통과"
         self._approve(msg, request_id, reason)
 
     def _approve(self, original_msg: Dict, request_id: str, reason: str) -> None:
@@ -283,24 +312,70 @@ class MonitorAgent(BaseAgent):
             self._reject(msg, change_id, "변경 ID를 찾을 수 없음")
             return
 
-        # LLM 코드 리뷰
-        if self.llm_client and self.llm_client.is_available:
-            review = self.llm_client.review_code_change(
-                target["original_code"],
-                target["new_code"],
-                target["reason"],
-            )
+        if change_id in self._pending_reviews:
+            return
 
-            if not review.get("approved", False):
-                self.log(f"❌ 코드 변경 거부: {change_id} — {review.get('feedback', 'N/A')}")
-                self._strategy_modifier.rollback_code_change(change_id)
-                self._reject(msg, change_id, f"코드 리뷰 거부: {review.get('feedback', '')}")
-                return
-        else:
-            # LLM 미사용 시 보수적으로 거부
-            self.log(f"❌ 코드 변경 거부: {change_id} — LLM 리뷰 불가")
+        # LLM 미사용 시 보수적으로 거부
+        if not (self.llm_client and self.llm_client.is_available):
+            self._finish_code_change(msg, change_id, None, "LLM 리뷰 불가")
+            return
+
+        # LLM 코드 리뷰는 기다리지 않음 — 결과가 나오거나 시한이 지나면
+        # Monitor 스레드에서 _process_pending_code_changes()가 마무리
+        future = self._submit_llm(
+            "review_code_change",
+            target["original_code"], target["new_code"], target["reason"],
+        )
+        deadline = self._llm_deadlines.get("code_review", 60.0)
+        timer = threading.Timer(deadline, self.call_soon, args=(self._process_pending_code_changes,))
+        timer.daemon = True
+        self._pending_reviews[change_id] = {"msg": msg, "future": future, "timer": timer}
+        timer.start()
+        future.add_done_callback(lambda f: self.call_soon(self._process_pending_code_changes))
+        self.log(f"🔍 코드 변경 리뷰 요청: {change_id} (시한 {deadline:g}초)")
+
+    def _process_pending_code_changes(self) -> None:
+        """리뷰 결과가 나왔거나 시한이 지난 코드 변경 적용/거부 (Monitor 스레드에서 실행)"""
+        deadline = self._llm_deadlines.get("code_review", 60.0)
+        now = time.monotonic()
+        for change_id, pending in list(self._pending_reviews.items()):
+            future = pending["future"]
+            if not future.done() and now - future.started_at < deadline:
+                continue
+            del self._pending_reviews[change_id]
+            pending["timer"].cancel()
+            msg = pending["msg"]
+
+            if not future.done():
+                # 시한 초과: LLM 미사용 시와 같이 보수적으로 거부
+                self._count_advisory("code_review", "timeouts")
+                self._watch_late_verdict("code_review", change_id, False, future)
+                self._finish_code_change(msg, change_id, None, "LLM 리뷰 시한 초과")
+                continue
+
+            try:
+                review = future.result()
+            except Exception as e:
+                self._count_advisory("code_review", "errors")
+                log_error(f"[Monitor] LLM 자문 오류 (code_review): {e}")
+                self._finish_code_change(msg, change_id, None, "LLM 리뷰 불가")
+                continue
+            self._count_advisory("code_review", "on_time")
+            self._finish_code_change(msg, change_id, review or {}, "")
+
+    def _finish_code_change(self, msg: Dict, change_id: str,
+                            review: Optional[Dict], no_review_reason: str) -> None:
+        """리뷰 결과에 따라 적용 또는 롤백 (review가 None이면 no_review_reason으로 거부)"""
+        if review is None:
+            self.log(f"❌ 코드 변경 거부: {change_id} — {no_review_reason}")
             self._strategy_modifier.rollback_code_change(change_id)
-            self._reject(msg, change_id, "LLM 리뷰 불가 — 코드 변경 거부")
+            self._reject(msg, change_id, f"{no_review_reason} — 코드 변경 거부")
+            return
+
+        if not review.get("approved", False):
+            self.log(f"❌ 코드 변경 거부: {change_id} — {review.get('feedback', 'N/A')}")
+            self._strategy_modifier.rollback_code_change(change_id)
+            self._reject(msg, change_id, f"코드 리뷰 거부: {review.get('feedback', '')}")
             return
 
         # 승인 및 적용
@@ -309,8 +384,84 @@ class MonitorAgent(BaseAgent):
         else:
             self._reject(msg, change_id, "코드 적용 실패")
 
-    def _process_pending_code_changes(self) -> None:
-        """외부에서 직접 제출된 보류 코드 변경 처리"""
-        # 메시지 버스를 통하지 않은 변경은 여기서 처리하지 않음
-        # (모든 코드 변경은 메시지 버스 통해 제출되어야 함)
-        pass
+    # ==================== LLM 자문 (시한 제한) ====================
+
+    def _submit_llm(self, method: str, *args) -> Future:
+        """LLM 호출을 별도 스레드에서 시작 (future.started_at: 시작 monotonic 시각)"""
+        started = time.monotonic()
+        future = self.llm_client.submit(method, *args)
+        future.started_at = started
+        return future
+
+    def _ask_llm(self, call_site: str, method: str, *args) -> Tuple[Optional[Dict], Optional[Future]]:
+        """
+        LLM 호출을 별도 스레드에서 실행하고 호출 지점별 시한까지만 대기
+
+        Returns:
+            (LLM 결과, None) — 시한 내 응답
+            (None, future)   — 시한 초과 (future는 계속 진행 중)
+            (None, None)     — 호출 오류 / 동시 호출 한도 초과
+        """
+        deadline = self._llm_deadlines.get(call_site, 5.0)
+        future = self._submit_llm(method, *args)
+        try:
+            result = future.result(timeout=deadline)
+        except FutureTimeout:
+            self._count_advisory(call_site, "timeouts")
+            self.log(f"⏱️ LLM 자문 시한 초과 ({call_site}, {deadline:g}초) — 규칙 기반 판단")
+            return None, future
+        except Exception as e:
+            self._count_advisory(call_site, "errors")
+            log_error(f"[Monitor] LLM 자문 오류 ({call_site}): {e}")
+            return None, None
+        self._count_advisory(call_site, "on_time")
+        return result or {}, None
+
+    def _count_advisory(self, call_site: str, key: str) -> None:
+        with self._advisory_lock:
+            stats = self._advisory_stats.setdefault(call_site, {
+                "on_time": 0, "timeouts": 0, "errors": 0,
+                "late_agree": 0, "late_disagree": 0,
+            })
+            stats[key] += 1
+
+    def _watch_late_verdict(self, call_site: str, ref_id: str, rule_approved: bool,
+                            future: Future) -> None:
+        """시한을 넘긴 LLM 판단이 도착하면 규칙 판단과 비교해 기록 (LLM 스레드에서 실행)"""
+        def _on_done(f: Future) -> None:
+            elapsed = time.monotonic() - f.started_at
+            try:
+                result = f.result() or {}
+            except Exception as e:
+                log_error(f"[Monitor] 지연 LLM 응답 오류 ({call_site} {ref_id}): {e}")
+                return
+            llm_approved = bool(result.get("approved", False))
+            agree = llm_approved == rule_approved
+            self._count_advisory(call_site, "late_agree" if agree else "late_disagree")
+            self._late_verdicts.append({
+                "call_site": call_site,
+                "ref_id": ref_id,
+                "rule_approved": rule_approved,
+                "llm_approved": llm_approved,
+                "elapsed_s": round(elapsed, 2),
+                "reasoning": result.get("reasoning") or result.get("feedback", ""),
+                "timestamp": datetime.now().isoformat(),
+            })
+            self.log(
+                f"🕒 지연 LLM 판단 ({call_site} {ref_id}, {elapsed:.1f}초): "
+                f"{'승인' if llm_approved else '거부'} — 규칙 판단과 {'일치' if agree else '불일치'}"
+            )
+
+        future.add_done_callback(_on_done)
+
+    def get_late_verdicts(self, limit: int = 20) -> list:
+        """시한 초과 후 도착한 LLM 판단 (최근순)"""
+        return list(self._late_verdicts)[-limit:][::-1]
+
+    def get_status(self) -> dict:
+        status = super().get_status()
+        with self._advisory_lock:
+            status["llm_advisory"] = {k: dict(v) for k, v in self._advisory_stats.items()}
+        status["pending_reviews"] = len(self._pending_reviews)
+        return status
+
@@ -19,7 +19,8 @@ import pandas as pd
 from agents.base_agent import BaseAgent
 from agents.message_bus import MSG_SIGNAL
 from agents.agent_config import AGENT_TEAM_CONFIG
-from config import make_api_request, EMA_PERIODS
+from config import EMA_PERIODS
+from okx.async_client import cached_api_request
 from utils.logger import log_system, log_error
 
 
@@ -122,7 +123,8 @@ class ReaderAgent(BaseAgent):
             bar_map = {"1m": "1m", "30m": "30m", "1H": "1H", "4H": "4H"}
             bar = bar_map.get(timeframe, timeframe)
 
-            result = make_api_request(
+            # 엔진/GUI의 같은 캔들 요청과 병합
+            result = cached_api_request(
                 "GET", "/api/v5/market/candles",
                 params={
                     "instId": self._symbol,
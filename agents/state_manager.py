@@ -13,7 +13,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from copy import deepcopy
 
-from config import make_api_request, LONG_STRATEGY_CONFIG, EMA_PERIODS
+from config import make_api_request, get_api_latency_stats, LONG_STRATEGY_CONFIG, EMA_PERIODS
+from okx.async_client import cached_api_request
 from utils.logger import log_system, log_error
 
 
@@ -120,9 +121,9 @@ class StateManager:
         return []
 
     def refresh_price(self) -> float:
-        """OKX API에서 현재가 갱신"""
+        """OKX API에서 현재가 갱신 (다른 호출부와 요청 병합 / 짧은 TTL 캐시)"""
         try:
-            result = make_api_request(
+            result = cached_api_request(
                 "GET", "/api/v5/market/ticker",
                 params={"instId": self._symbol}
             )
@@ -267,6 +268,10 @@ class StateManager:
 
     # ==================== 팀 상태 ====================
 
+    def get_api_latency(self) -> Dict[str, Dict[str, Any]]:
+        """OKX REST 엔드포인트별 지연 히스토그램 (공유 커넥션 풀 기준)"""
+        return get_api_latency_stats()
+
     def get_team_status(self) -> Dict[str, Any]:
         """팀 전체 상태 요약"""
         with self._lock:
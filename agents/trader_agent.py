@@ -7,10 +7,15 @@ Agent 2: Trader (자율 매매 집행)
 - Monitor에 거래 승인 요청
 - 승인 시 OrderManager로 주문 실행
 - 거래 결과를 Message Bus에 발행
+- 신호 → 승인 → 주문 지연 시간 측정
+
+신호/승인 메시지는 도착 즉시 처리하고 (event_driven),
+주기 사이클에서는 만료된 승인 대기 요청만 정리한다.
 """
 
 import uuid
 import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -26,6 +31,8 @@ from utils.logger import log_system, log_error
 class TraderAgent(BaseAgent):
     """자율 매매 집행 에이전트"""
 
+    event_driven = True
+
     def __init__(self, message_bus, state_manager, llm_client, order_manager):
         """
         Args:
@@ -46,6 +53,8 @@ class TraderAgent(BaseAgent):
         self._pending_requests: Dict[str, Dict] = {}
         # 승인 대기 타임아웃 (초)
         self._approval_timeout = 60
+        # 최근 주문의 신호 → 승인 → 주문 지연 시간 (ms)
+        self._latencies: deque = deque(maxlen=100)
 
         # 메시지 구독
         self.message_bus.subscribe("trader", [
@@ -53,9 +62,14 @@ class TraderAgent(BaseAgent):
         ])
 
     def run_cycle(self) -> None:
-        """Trader 사이클: 신호 수신 → 승인 요청 → 주문 실행"""
-        messages = self.get_messages(timeout=1.0)
+        """Trader 주기 사이클: 남은 메시지 처리 + 만료 요청 정리"""
+        self.handle_messages(self.get_messages(timeout=0))
 
+        # 타임아웃된 요청 정리
+        self._cleanup_expired_requests()
+
+    def handle_messages(self, messages: list) -> None:
+        """신호 수신 → 승인 요청 → 주문 실행 (메시지 도착 즉시)"""
         for msg in messages:
             msg_type = msg.get("type")
 
@@ -69,9 +83,6 @@ class TraderAgent(BaseAgent):
                 self.log("🚨 긴급 정지 수신 — 모든 대기 요청 취소")
                 self._pending_requests.clear()
 
-        # 타임아웃된 요청 정리
-        self._cleanup_expired_requests()
-
     # ==================== 신호 처리 ====================
 
     def _handle_signal(self, msg: Dict) -> None:
@@ -122,9 +133,12 @@ class TraderAgent(BaseAgent):
             **trade_info,
         }
 
+        now = time.monotonic()
         self._pending_requests[request_id] = {
             "request": trade_request,
             "created_at": datetime.now(),
+            "signal_at": msg.get("_published_at", now),
+            "requested_at": now,
         }
 
         self.log(f"📤 거래 승인 요청: {request_id} ({signal} {trade_info.get('size', 0)} 계약)")
@@ -151,6 +165,12 @@ class TraderAgent(BaseAgent):
 
         # 주문 실행
         result = self._execute_trade(request)
+        latency = self._record_latency(pending, msg.get("_published_at"), time.monotonic())
+        self.log(
+            f"⏱️ 신호→주문 {latency['total_ms']:.0f}ms "
+            f"(요청 {latency['signal_to_request_ms']:.0f} / 승인 {latency['request_to_approval_ms']:.0f} "
+            f"/ 주문 {latency['approval_to_order_ms']:.0f})"
+        )
 
         # 거래 결과 발행
         self.send_message(MSG_TRADE_RESULT, {
@@ -158,6 +178,7 @@ class TraderAgent(BaseAgent):
             "action": action,
             "success": result is not None,
             "order_result": result,
+            "latency_ms": latency,
             "timestamp": datetime.now().isoformat(),
         })
 
@@ -287,6 +308,44 @@ class TraderAgent(BaseAgent):
             log_error(f"[Trader] 주문 실행 오류: {e}")
             return None
 
+    # ==================== 지연 시간 ====================
+
+    def _record_latency(self, pending: Dict, approved_at: Optional[float],
+                        ordered_at: float) -> Dict[str, float]:
+        """신호 → 승인 요청 → 승인 → 주문 완료 구간별 지연 시간 (ms)"""
+        signal_at = pending["signal_at"]
+        requested_at = pending["requested_at"]
+        if approved_at is None:
+            approved_at = ordered_at
+        latency = {
+            "signal_to_request_ms": (requested_at - signal_at) * 1000,
+            "request_to_approval_ms": (approved_at - requested_at) * 1000,
+            "approval_to_order_ms": (ordered_at - approved_at) * 1000,
+            "total_ms": (ordered_at - signal_at) * 1000,
+        }
+        self._latencies.append(latency)
+        return latency
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """최근 주문의 신호 → 주문 지연 시간 요약"""
+        if not self._latencies:
+            return {"count": 0}
+        totals = sorted(l["total_ms"] for l in self._latencies)
+        return {
+            "count": len(totals),
+            "last_ms": self._latencies[-1]["total_ms"],
+            "avg_ms": sum(totals) / len(totals),
+            "p50_ms": totals[len(totals) // 2],
+            "max_ms": totals[-1],
+            "last": dict(self._latencies[-1]),
+        }
+
+    def get_status(self) -> dict:
+        status = super().get_status()
+        status["pending_requests"] = len(self._pending_requests)
+        status["latency"] = self.get_latency_stats()
+        return status
+
     # ==================== 타임아웃 관리 ====================
 
     def _cleanup_expired_requests(self) -> None:
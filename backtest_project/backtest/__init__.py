@@ -2,20 +2,30 @@
 """
 백테스트 모듈
 - data_fetcher: Binance 데이터 수집
+- candle_store: 바이너리 캔들 저장소 (데이터 캐시)
 - backtest_engine: 백테스트 엔진
 - result_analyzer: 결과 분석
+- param_sweep: 파라미터 스윕 (병렬 그리드 서치)
+- portfolio: 멀티 심볼 포트폴리오 백테스트
 """
 
 from .data_fetcher import DataFetcher
+from .candle_store import CandleStore
 from .backtest_engine import BacktestEngine, Params, Trade, Position, BacktestResult
 from .result_analyzer import ResultAnalyzer
+from .param_sweep import ParamSweep
+from .portfolio import PortfolioBacktest, PortfolioResult
 
 __all__ = [
     'DataFetcher',
+    'CandleStore',
     'BacktestEngine', 
     'Params',
     'Trade',
     'Position',
     'BacktestResult',
     'ResultAnalyzer',
+    'ParamSweep',
+    'PortfolioBacktest',
+    'PortfolioResult',
 ]
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Any, List, Literal, Tuple, Dict
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,6 +23,18 @@ def ema(series: pd.Series, period: int) -> pd.Series:
     return series.ewm(span=period, adjust=False).mean()
 
 
+def build_ema_cache(df: pd.DataFrame, periods) -> Dict[int, np.ndarray]:
+    """기간별 EMA를 한 번씩만 계산해 {기간: 배열}로 반환 (BacktestEngine.run의 ema_cache용)"""
+    close = df["close"].astype(float)
+    return {int(p): ema(close, int(p)).to_numpy() for p in sorted(set(periods))}
+
+
+EMA_PERIOD_FIELDS = (
+    "trend_fast", "trend_slow", "entry_fast", "entry_slow",
+    "long_exit_fast", "long_exit_slow", "short_exit_fast", "short_exit_slow",
+)
+
+
 def cross_up(prev_fast: float, prev_slow: float, curr_fast: float, curr_slow: float) -> bool:
     """골든크로스 감지"""
     return (prev_fast <= prev_slow) and (curr_fast > curr_slow)
@@ -32,6 +45,20 @@ def cross_down(prev_fast: float, prev_slow: float, curr_fast: float, curr_slow:
     return (prev_fast >= prev_slow) and (curr_fast < curr_slow)
 
 
+def _cross_up_arr(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """cross_up의 배열 버전 - out[i]는 (i-1, i) 봉 사이의 골든크로스 (out[0]은 False)"""
+    out = np.zeros(len(fast), dtype=bool)
+    out[1:] = (fast[:-1] <= slow[:-1]) & (fast[1:] > slow[1:])
+    return out
+
+
+def _cross_down_arr(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """cross_down의 배열 버전 - out[i]는 (i-1, i) 봉 사이의 데드크로스 (out[0]은 False)"""
+    out = np.zeros(len(fast), dtype=bool)
+    out[1:] = (fast[:-1] >= slow[:-1]) & (fast[1:] < slow[1:])
+    return out
+
+
 def calc_mdd(equity_curve: List[float]) -> float:
     """MDD (최대 낙폭) 계산 - 비율로 반환 (0~1)"""
     if not equity_curve:
@@ -47,6 +74,35 @@ def calc_mdd(equity_curve: List[float]) -> float:
     return max_dd
 
 
+def calc_mdd_array(equity: np.ndarray) -> float:
+    """calc_mdd의 배열 버전 - 비율로 반환 (0~1)"""
+    if len(equity) == 0:
+        return 0.0
+    peak = np.maximum.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = np.where(peak > 0, (peak - equity) / peak, 0.0)
+    return float(dd.max(initial=0.0))
+
+
+class _DrawdownTracker:
+    """자산곡선을 저장하지 않고 값이 바뀔 때만 MDD 갱신 (summary_only 모드)"""
+    
+    __slots__ = ("last", "peak", "max_dd")
+    
+    def __init__(self, initial: float):
+        self.last = initial
+        self.peak = initial
+        self.max_dd = 0.0
+    
+    def update(self, v: float):
+        self.last = v
+        if v > self.peak:
+            self.peak = v
+        dd = (self.peak - v) / self.peak if self.peak > 0 else 0.0
+        if dd > self.max_dd:
+            self.max_dd = dd
+
+
 # =========================
 # 데이터 구조
 # =========================
@@ -117,6 +173,31 @@ class MarkerEvent:
     details: Dict = field(default_factory=dict)
 
 
+# 압축 거래 기록 (run(compact=True) / run(summary_only=True))
+# 시각 대신 봉 번호(df 행 번호)를 기록 - BacktestResult.bar_times로 시각 변환
+EXIT_REASONS = ("ema_dead_cross", "ema_golden_cross", "trailing_stop", "reverse_to_short", "reverse_to_long")
+_EXIT_REASON_CODE = {r: i for i, r in enumerate(EXIT_REASONS)}
+
+TRADE_DTYPE = np.dtype([
+    ("side", "i1"),      # 1: LONG, -1: SHORT
+    ("mode", "i1"),      # 1: REAL, 0: VIRTUAL
+    ("reason", "i1"),    # EXIT_REASONS 인덱스
+    ("entry_bar", "<i8"),
+    ("exit_bar", "<i8"),
+    ("entry_price", "<f8"),
+    ("exit_price", "<f8"),
+    ("size", "<f8"),
+    ("leverage", "<f8"),
+    ("pnl", "<f8"),
+    ("fee", "<f8"),
+    ("net_pnl", "<f8"),
+    ("entry_capital", "<f8"),
+    ("entry_notional", "<f8"),
+    ("exit_capital_before", "<f8"),
+    ("exit_capital_after", "<f8"),
+])
+
+
 @dataclass
 class Params:
     """백테스트 파라미터"""
@@ -203,6 +284,22 @@ class BacktestResult:
     # EMA 데이터 (차트용)
     ema_data: Optional[pd.DataFrame] = None
     
+    # 압축 결과 (compact / summary_only 실행 시, 이때 trades/markers/equity_curve_*는 빈 리스트)
+    trade_records: Optional[np.ndarray] = None   # TRADE_DTYPE 레코드 배열
+    equity_real: Optional[np.ndarray] = None     # equity_real[k] = 봉 번호 start_bar + k 종료 시 자산 (summary_only면 None)
+    equity_virtual: Optional[np.ndarray] = None
+    bar_times: Optional[np.ndarray] = None       # 봉 번호 → 시각 (datetime64[ns], UTC)
+    start_bar: int = 0
+    
+    @property
+    def is_compact(self) -> bool:
+        return self.trade_records is not None
+    
+    def _net_pnls(self) -> List[float]:
+        if self.trade_records is not None:
+            return self.trade_records["net_pnl"].tolist()
+        return [t.net_pnl for t in self.trades]
+    
     @property
     def win_rate(self) -> float:
         """승률 (%)"""
@@ -213,21 +310,74 @@ class BacktestResult:
     @property
     def avg_profit(self) -> float:
         """평균 수익 (이익 거래만)"""
-        profits = [t.net_pnl for t in self.trades if t.net_pnl > 0]
+        profits = [v for v in self._net_pnls() if v > 0]
         return sum(profits) / len(profits) if profits else 0.0
     
     @property
     def avg_loss(self) -> float:
         """평균 손실 (손실 거래만)"""
-        losses = [t.net_pnl for t in self.trades if t.net_pnl < 0]
+        losses = [v for v in self._net_pnls() if v < 0]
         return sum(losses) / len(losses) if losses else 0.0
     
     @property
     def profit_factor(self) -> float:
         """손익비"""
-        gross_profit = sum(t.net_pnl for t in self.trades if t.net_pnl > 0)
-        gross_loss = abs(sum(t.net_pnl for t in self.trades if t.net_pnl < 0))
+        net_pnls = self._net_pnls()
+        gross_profit = sum(v for v in net_pnls if v > 0)
+        gross_loss = abs(sum(v for v in net_pnls if v < 0))
         return gross_profit / gross_loss if gross_loss > 0 else float('inf')
+    
+    @property
+    def equity_times(self) -> Optional[np.ndarray]:
+        """equity_real/equity_virtual에 대응하는 봉 시각"""
+        if self.bar_times is None or self.equity_real is None:
+            return None
+        return self.bar_times[self.start_bar:self.start_bar + len(self.equity_real)]
+    
+    def trade_list(self) -> List[Trade]:
+        """거래 목록 (압축 결과면 레코드 배열에서 Trade 객체로 변환)"""
+        if self.trade_records is None:
+            return self.trades
+        
+        rec = self.trade_records
+        times = pd.to_datetime(self.bar_times, utc=True) if self.bar_times is not None else None
+        
+        def _time(bar: int):
+            return times[bar] if times is not None else bar
+        
+        return [
+            Trade(
+                side="LONG" if r["side"] > 0 else "SHORT",
+                mode="REAL" if r["mode"] == 1 else "VIRTUAL",
+                entry_time=_time(int(r["entry_bar"])),
+                entry_price=float(r["entry_price"]),
+                exit_time=_time(int(r["exit_bar"])),
+                exit_price=float(r["exit_price"]),
+                size=float(r["size"]),
+                leverage=float(r["leverage"]),
+                reason_exit=EXIT_REASONS[r["reason"]],
+                pnl=float(r["pnl"]),
+                fee=float(r["fee"]),
+                net_pnl=float(r["net_pnl"]),
+                entry_capital=float(r["entry_capital"]),
+                entry_notional=float(r["entry_notional"]),
+                exit_capital_before=float(r["exit_capital_before"]),
+                exit_capital_after=float(r["exit_capital_after"]),
+            )
+            for r in rec
+        ]
+    
+    def equity_series(self, mode: Literal["REAL", "VIRTUAL"] = "REAL") -> pd.Series:
+        """자산곡선 Series (시간 인덱스, 압축/일반 결과 모두 지원)"""
+        if self.equity_real is not None:
+            values = self.equity_real if mode == "REAL" else self.equity_virtual
+            return pd.Series(values, index=pd.to_datetime(self.equity_times, utc=True), dtype=float)
+        
+        curve = self.equity_curve_real if mode == "REAL" else self.equity_curve_virtual
+        if not curve:
+            return pd.Series(dtype=float)
+        times, values = zip(*curve)
+        return pd.Series(values, index=pd.Index(times), dtype=float)
 
 
 # =========================
@@ -266,6 +416,14 @@ class BacktestEngine:
         # 전환 카운터
         self.cnt_r2v: int = 0
         self.cnt_v2r: int = 0
+        
+        # 결과 기록 방식 ("full" / "compact" / "summary") - run()에서 설정
+        self._record: str = "full"
+        self._trade_rows: List[tuple] = []
+        self._eq_real_arr: Optional[np.ndarray] = None
+        self._eq_virtual_arr: Optional[np.ndarray] = None
+        self._dd_real: Optional[_DrawdownTracker] = None
+        self._dd_virtual: Optional[_DrawdownTracker] = None
     
     def reset(self):
         """엔진 상태 초기화"""
@@ -281,6 +439,11 @@ class BacktestEngine:
         self.equity_curve_virtual = []
         self.cnt_r2v = 0
         self.cnt_v2r = 0
+        self._trade_rows = []
+        self._eq_real_arr = None
+        self._eq_virtual_arr = None
+        self._dd_real = None
+        self._dd_virtual = None
     
     # --------- 유틸리티 ----------
     def _fee_roundtrip(self, notional: float) -> float:
@@ -330,7 +493,9 @@ class BacktestEngine:
             entry_notional=notional,
         )
         
-        # 마커 추가
+        # 마커 추가 (압축 모드는 마커를 기록하지 않음)
+        if self._record != "full":
+            return
         self.markers.append(MarkerEvent(
             time=t,
             price=price,
@@ -369,6 +534,20 @@ class BacktestEngine:
         
         exit_cap_after = self.real_capital if pos_mode == "REAL" else self.virtual_capital
         
+        # 압축 모드: 레코드 튜플만 기록 (t는 봉 번호)
+        if self._record != "full":
+            self._trade_rows.append((
+                1 if pos.side == "LONG" else -1,
+                1 if pos_mode == "REAL" else 0,
+                _EXIT_REASON_CODE[reason],
+                pos.entry_time, t,
+                pos.entry_price, price, pos.size, pos.leverage,
+                pnl, fee, net,
+                pos.entry_capital, pos.entry_notional, exit_cap_before, exit_cap_after,
+            ))
+            self.pos = None
+            return
+        
         # 거래 기록
         trade = Trade(
             side=pos.side,
@@ -418,6 +597,8 @@ class BacktestEngine:
         if self.p.reset_real_peak_on_r2v:
             self.real_peak = self.real_capital
         
+        if self._record != "full":
+            return
         self.markers.append(MarkerEvent(
             time=t,
             price=price,
@@ -436,6 +617,8 @@ class BacktestEngine:
         if self.p.reset_real_peak_on_v2r:
             self.real_peak = self.real_capital
         
+        if self._record != "full":
+            return
         self.markers.append(MarkerEvent(
             time=t,
             price=price,
@@ -475,6 +658,29 @@ class BacktestEngine:
         curr_sx_fast: float = 0,
         curr_sx_slow: float = 0,
     ):
+        # (C) 진입/청산 신호
+        long_trend_ok = trend_fast > trend_slow
+        short_trend_ok = trend_fast < trend_slow
+        long_entry = long_trend_ok and cross_up(prev_e20, prev_e50, curr_e20, curr_e50)
+        short_entry = False if self.p.long_only else (short_trend_ok and cross_down(prev_e20, prev_e50, curr_e20, curr_e50))
+        long_exit_cross = cross_down(prev_lx_fast, prev_lx_slow, curr_lx_fast, curr_lx_slow)
+        short_exit_cross = cross_up(prev_sx_fast, prev_sx_slow, curr_sx_fast, curr_sx_slow)
+        
+        self._on_bar_signals(t, close_price, long_entry, short_entry, long_exit_cross, short_exit_cross)
+    
+    def _on_bar_signals(
+        self,
+        t,
+        close_price: float,
+        long_entry: bool,
+        short_entry: bool,
+        long_exit_cross: bool,
+        short_exit_cross: bool,
+    ):
+        """
+        봉 처리 상태 머신 (신호가 미리 계산된 상태)
+        - on_bar와 배열 기반 fast path가 공유
+        """
         # (A) 전환 체크
         self._check_and_switch_mode(t, close_price)
         
@@ -485,12 +691,6 @@ class BacktestEngine:
             else:
                 self.pos.trough_price = min(self.pos.trough_price, close_price)
         
-        # (C) 진입 신호
-        long_trend_ok = trend_fast > trend_slow
-        short_trend_ok = trend_fast < trend_slow
-        long_entry = long_trend_ok and cross_up(prev_e20, prev_e50, curr_e20, curr_e50)
-        short_entry = False if self.p.long_only else (short_trend_ok and cross_down(prev_e20, prev_e50, curr_e20, curr_e50))
-        
         # (D) 리버스 (Long Only면 숏 진입 없음)
         if self.pos is not None and not self.p.long_only:
             if self.pos.side == "LONG" and short_entry:
@@ -509,7 +709,7 @@ class BacktestEngine:
         if self.pos is not None:
             if self.pos.side == "LONG":
                 # EMA 데드크로스
-                if cross_down(prev_lx_fast, prev_lx_slow, curr_lx_fast, curr_lx_slow):
+                if long_exit_cross:
                     self._close_position(t, close_price, "ema_dead_cross")
                     self._check_and_switch_mode(t, close_price)
                     return
@@ -522,7 +722,7 @@ class BacktestEngine:
                     return
             
             else:  # SHORT
-                if cross_up(prev_sx_fast, prev_sx_slow, curr_sx_fast, curr_sx_slow):
+                if short_exit_cross:
                     self._close_position(t, close_price, "ema_golden_cross")
                     self._check_and_switch_mode(t, close_price)
                     return
@@ -552,31 +752,34 @@ class BacktestEngine:
         self._check_and_switch_mode(t, close_price)
     
     # --------- 백테스트 실행 ----------
-    def run(self, df: pd.DataFrame, progress_callback=None) -> BacktestResult:
+    def run(
+        self,
+        df: pd.DataFrame,
+        progress_callback=None,
+        use_fast_path: bool = True,
+        ema_cache: Optional[Dict[int, np.ndarray]] = None,
+        compact: bool = False,
+        summary_only: bool = False,
+    ) -> BacktestResult:
         """
         백테스트 실행
         
         Args:
             df: OHLC 데이터 (timestamp, open, high, low, close 컬럼 필요)
             progress_callback: 진행률 콜백 (current, total, message)
+            use_fast_path: True면 NumPy 배열 기반 루프, False면 기존 iloc 루프
+            ema_cache: {기간: EMA 배열} - 같은 df에 대해 미리 계산된 EMA (파라미터 스윕용)
+            compact: True면 거래는 TRADE_DTYPE 레코드 배열, 자산곡선은 봉 번호 기준
+                float64 배열로 기록 (Trade/MarkerEvent/튜플 객체와 ema_data 생략)
+            summary_only: True면 compact에 더해 자산곡선도 저장하지 않음 (MDD만 추적)
         
         Returns:
             BacktestResult
         """
         self.reset()
+        self._record = "summary" if summary_only else "compact" if compact else "full"
         
-        close = df["close"].astype(float)
-        
-        # EMA 계산
-        df = df.copy()
-        df["ema_trend_fast"] = ema(close, self.p.trend_fast)
-        df["ema_trend_slow"] = ema(close, self.p.trend_slow)
-        df["ema_e20"] = ema(close, self.p.entry_fast)
-        df["ema_e50"] = ema(close, self.p.entry_slow)
-        df["ema_lx_fast"] = ema(close, self.p.long_exit_fast)
-        df["ema_lx_slow"] = ema(close, self.p.long_exit_slow)
-        df["ema_sx_fast"] = ema(close, self.p.short_exit_fast)
-        df["ema_sx_slow"] = ema(close, self.p.short_exit_slow)
+        df = self._prepare_indicators(df, ema_cache)
         
         # 시작 인덱스
         start_idx = max(
@@ -589,18 +792,77 @@ class BacktestEngine:
         if len(df) <= start_idx + 2:
             raise ValueError("데이터가 너무 짧습니다.")
         
-        total_bars = len(df) - start_idx - 1
-        
         # 초기 자산곡선 기록
-        self.equity_curve_real.append((df.iloc[start_idx]["datetime_utc"], self.real_capital))
-        self.equity_curve_virtual.append((df.iloc[start_idx]["datetime_utc"], self.virtual_capital))
+        if self._record == "full":
+            self.equity_curve_real.append((df.iloc[start_idx]["datetime_utc"], self.real_capital))
+            self.equity_curve_virtual.append((df.iloc[start_idx]["datetime_utc"], self.virtual_capital))
+        elif self._record == "compact":
+            self._eq_real_arr = np.empty(len(df) - start_idx)
+            self._eq_virtual_arr = np.empty(len(df) - start_idx)
+            self._eq_real_arr[0] = self.real_capital
+            self._eq_virtual_arr[0] = self.virtual_capital
+        else:
+            self._dd_real = _DrawdownTracker(self.real_capital)
+            self._dd_virtual = _DrawdownTracker(self.virtual_capital)
+        
+        if use_fast_path:
+            self._run_arrays(df, start_idx, progress_callback)
+        else:
+            self._run_rows(df, start_idx, progress_callback)
+        
+        return self._build_result(df, start_idx)
+    
+    def _prepare_indicators(
+        self,
+        df: pd.DataFrame,
+        ema_cache: Optional[Dict[int, np.ndarray]] = None,
+    ) -> pd.DataFrame:
+        """EMA 컬럼이 추가된 복사본 반환 (ema_cache에 있는 기간은 재계산하지 않음)"""
+        close = df["close"].astype(float)
+        
+        def _ema(period: int):
+            if ema_cache is not None and period in ema_cache:
+                return ema_cache[period]
+            return ema(close, period)
+        
+        # EMA 계산
+        df = df.copy()
+        df["ema_trend_fast"] = _ema(self.p.trend_fast)
+        df["ema_trend_slow"] = _ema(self.p.trend_slow)
+        df["ema_e20"] = _ema(self.p.entry_fast)
+        df["ema_e50"] = _ema(self.p.entry_slow)
+        df["ema_lx_fast"] = _ema(self.p.long_exit_fast)
+        df["ema_lx_slow"] = _ema(self.p.long_exit_slow)
+        df["ema_sx_fast"] = _ema(self.p.short_exit_fast)
+        df["ema_sx_slow"] = _ema(self.p.short_exit_slow)
+        return df
+    
+    def _record_equity(self, k: int, t):
+        """k번째 자산곡선 지점 기록 (k = 봉 번호 - start_idx)"""
+        if self._record == "full":
+            self.equity_curve_real.append((t, self.real_capital))
+            self.equity_curve_virtual.append((t, self.virtual_capital))
+        elif self._record == "compact":
+            self._eq_real_arr[k] = self.real_capital
+            self._eq_virtual_arr[k] = self.virtual_capital
+        else:
+            if self.real_capital != self._dd_real.last:
+                self._dd_real.update(self.real_capital)
+            if self.virtual_capital != self._dd_virtual.last:
+                self._dd_virtual.update(self.virtual_capital)
+    
+    def _run_rows(self, df: pd.DataFrame, start_idx: int, progress_callback=None):
+        """기존 봉 순회 (iloc 행 접근, 벤치마크/검증용)"""
+        total_bars = len(df) - start_idx - 1
         
-        # 봉 순회
         for i in range(start_idx + 1, len(df)):
             prev = df.iloc[i - 1]
             row = df.iloc[i]
             
-            t = row["datetime_utc"] if "datetime_utc" in row else row["timestamp"]
+            if self._record == "full":
+                t = row["datetime_utc"] if "datetime_utc" in row else row["timestamp"]
+            else:
+                t = i
             
             self.on_bar(
                 t=t,
@@ -622,15 +884,89 @@ class BacktestEngine:
             )
             
             # 자산곡선 기록
-            self.equity_curve_real.append((t, self.real_capital))
-            self.equity_curve_virtual.append((t, self.virtual_capital))
+            self._record_equity(i - start_idx, t)
             
             # 진행률 콜백
             if progress_callback and (i % 100 == 0 or i == len(df) - 1):
                 progress = int((i - start_idx) / total_bars * 100)
                 progress_callback(i - start_idx, total_bars, f"백테스트 진행 중... {progress}%")
+    
+    def _run_arrays(self, df: pd.DataFrame, start_idx: int, progress_callback=None):
+        """
+        배열 기반 봉 순회 (fast path)
+        - EMA 컬럼을 한 번만 NumPy 배열로 추출
+        - 교차 신호는 벡터 연산으로 미리 계산, 루프는 상태 머신만 실행
+        """
+        n = len(df)
+        total_bars = n - start_idx - 1
+        
+        close = df["close"].astype(float).to_numpy()
+        e = {
+            name: df[name].to_numpy(dtype=np.float64)
+            for name in ("ema_trend_fast", "ema_trend_slow", "ema_e20", "ema_e50",
+                         "ema_lx_fast", "ema_lx_slow", "ema_sx_fast", "ema_sx_slow")
+        }
+        
+        long_entry = _cross_up_arr(e["ema_e20"], e["ema_e50"])
+        long_entry &= e["ema_trend_fast"] > e["ema_trend_slow"]
+        
+        if self.p.long_only:
+            short_entry = np.zeros(n, dtype=bool)
+        else:
+            short_entry = _cross_down_arr(e["ema_e20"], e["ema_e50"])
+            short_entry &= e["ema_trend_fast"] < e["ema_trend_slow"]
+        
+        long_exit_cross = _cross_down_arr(e["ema_lx_fast"], e["ema_lx_slow"])
+        short_exit_cross = _cross_up_arr(e["ema_sx_fast"], e["ema_sx_slow"])
+        
+        # 원소 접근은 파이썬 리스트가 NumPy 스칼라보다 빠름
+        # 압축 모드는 시각 대신 봉 번호를 기록하므로 시각 목록을 만들지 않음
+        full = self._record == "full"
+        if full:
+            times = df["datetime_utc" if "datetime_utc" in df.columns else "timestamp"].tolist()
+        else:
+            times = range(n)
+        close_l = close.tolist()
+        long_entry_l = long_entry.tolist()
+        short_entry_l = short_entry.tolist()
+        long_exit_l = long_exit_cross.tolist()
+        short_exit_l = short_exit_cross.tolist()
+        
+        step = self._on_bar_signals
+        eq_real = self.equity_curve_real
+        eq_virtual = self.equity_curve_virtual
+        eq_real_arr = self._eq_real_arr
+        eq_virtual_arr = self._eq_virtual_arr
+        dd_real = self._dd_real
+        dd_virtual = self._dd_virtual
+        
+        for i in range(start_idx + 1, n):
+            t = times[i]
+            step(t, close_l[i], long_entry_l[i], short_entry_l[i], long_exit_l[i], short_exit_l[i])
+            
+            # 자산곡선 기록 (_record_equity를 루프 안에 풀어 씀)
+            if full:
+                eq_real.append((t, self.real_capital))
+                eq_virtual.append((t, self.virtual_capital))
+            elif eq_real_arr is not None:
+                eq_real_arr[i - start_idx] = self.real_capital
+                eq_virtual_arr[i - start_idx] = self.virtual_capital
+            else:
+                if self.real_capital != dd_real.last:
+                    dd_real.update(self.real_capital)
+                if self.virtual_capital != dd_virtual.last:
+                    dd_virtual.update(self.virtual_capital)
+            
+            # 진행률 콜백
+            if progress_callback and (i % 100 == 0 or i == n - 1):
+                progress = int((i - start_idx) / total_bars * 100)
+                progress_callback(i - start_idx, total_bars, f"백테스트 진행 중... {progress}%")
+    
+    def _build_result(self, df: pd.DataFrame, start_idx: int) -> BacktestResult:
+        """엔진 상태로부터 BacktestResult 생성"""
+        if self._record != "full":
+            return self._build_compact_result(df, start_idx)
         
-        # 결과 생성
         equity_real_values = [e[1] for e in self.equity_curve_real]
         equity_virtual_values = [e[1] for e in self.equity_curve_virtual]
         
@@ -670,6 +1006,55 @@ class BacktestEngine:
                          "ema_e20", "ema_e50", "ema_lx_fast", "ema_lx_slow"]].copy() if "datetime_utc" in df.columns else None,
         )
     
+    def _build_compact_result(self, df: pd.DataFrame, start_idx: int) -> BacktestResult:
+        """압축 기록(compact / summary_only)으로부터 BacktestResult 생성"""
+        records = np.array(self._trade_rows, dtype=TRADE_DTYPE) if self._trade_rows else np.empty(0, dtype=TRADE_DTYPE)
+        
+        real_roi = (self.real_capital - self.initial_capital) / self.initial_capital * 100
+        virtual_roi = (self.virtual_capital - self.virtual_baseline) / self.virtual_baseline * 100
+        
+        if self._record == "compact":
+            mdd_real = calc_mdd_array(self._eq_real_arr) * 100
+            mdd_virtual = calc_mdd_array(self._eq_virtual_arr) * 100
+        else:
+            mdd_real = self._dd_real.max_dd * 100
+            mdd_virtual = self._dd_virtual.max_dd * 100
+        
+        winning = int((records["net_pnl"] > 0).sum())
+        real_cnt = int((records["mode"] == 1).sum())
+        
+        bar_times = None
+        if "datetime_utc" in df.columns:
+            bar_times = pd.to_datetime(df["datetime_utc"], utc=True).to_numpy(dtype="datetime64[ns]")
+        
+        return BacktestResult(
+            initial_capital=self.initial_capital,
+            final_real_capital=self.real_capital,
+            final_virtual_capital=self.virtual_capital,
+            trades=[],
+            markers=[],
+            equity_curve_real=[],
+            equity_curve_virtual=[],
+            total_trades=len(records),
+            real_trades=real_cnt,
+            virtual_trades=len(records) - real_cnt,
+            winning_trades=winning,
+            losing_trades=len(records) - winning,
+            real_roi=real_roi,
+            virtual_roi=virtual_roi,
+            mdd_real=mdd_real,
+            mdd_virtual=mdd_virtual,
+            r2v_switches=self.cnt_r2v,
+            v2r_switches=self.cnt_v2r,
+            has_open_position=self.pos is not None,
+            open_position=self.pos,
+            trade_records=records,
+            equity_real=self._eq_real_arr,
+            equity_virtual=self._eq_virtual_arr,
+            bar_times=bar_times,
+            start_bar=start_idx,
+        )
+    
     def get_entry_exit_points(self) -> List[Dict]:
         """차트 마커용 진입/청산 포인트 반환"""
         points = []
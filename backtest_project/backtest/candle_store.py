@@ -0,0 +1,331 @@
+# backtest/candle_store.py
+"""
+바이너리 컬럼형 캔들 저장소
+- 심볼/인터벌별 디렉토리에 .npy 세그먼트(구조화 배열)로 저장
+- 세그먼트는 추가만 함 (파일명 = 수집을 완료한 구간 [start_ms, end_ms))
+- 읽기는 memory-map으로 필요한 구간만 복사
+- 요청 구간 중 저장되지 않은 부분(gap)만 계산해 추가 수집 가능
+- 기존 CSV 캐시 가져오기 지원 (가져온 파일 목록은 저장소 안 manifest에 기록)
+
+디렉토리 구조:
+    {root}/{SYMBOL}/{interval}/{start_ms}_{end_ms}.npy
+    {root}/{SYMBOL}/{interval}/imported.json   (가져온 CSV: 파일명 → 크기/수정 시각)
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# 세그먼트 레코드 형식
+CANDLE_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+])
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+}
+
+_SEGMENT_RE = re.compile(r"^(\d+)_(\d+)\.npy$")
+
+# 기존 CSV 캐시 파일명: {SYMBOL}_{interval}_{YYYYMMDD}_to_{YYYYMMDD}.csv
+_CSV_NAME_RE = re.compile(r"^([A-Z0-9]+)_(\d+[mhd])_\d{8}_to_\d{8}\.csv$")
+
+# 가져온 CSV 목록 파일 (심볼/인터벌 디렉토리 안 - 저장소를 지우면 함께 지워짐)
+_MANIFEST_NAME = "imported.json"
+
+
+def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """겹치거나 맞닿은 [start, end) 구간 병합"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class CandleStore:
+    """
+    심볼/인터벌별 바이너리 캔들 저장소
+    
+    사용법:
+        store = CandleStore("./cache/store")
+        for gap_start, gap_end in store.missing_ranges("BTCUSDT", "30m", start_ms, end_ms):
+            rows = fetch(gap_start, gap_end)
+            store.append("BTCUSDT", "30m", rows, gap_start, gap_end)
+        df = store.read("BTCUSDT", "30m", start_ms, end_ms)
+    """
+    
+    def __init__(self, root: str):
+        """
+        Args:
+            root: 저장소 루트 디렉토리
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        
+        # (symbol, interval) → [(start_ms, end_ms, path), ...] 세그먼트 목록 캐시
+        self._segments: Dict[Tuple[str, str], List[Tuple[int, int, Path]]] = {}
+        self._lock = threading.Lock()
+    
+    def _dir(self, symbol: str, interval: str) -> Path:
+        return self.root / symbol.upper() / interval
+    
+    def segments(self, symbol: str, interval: str) -> List[Tuple[int, int, Path]]:
+        """세그먼트 목록 (start_ms 순)"""
+        key = (symbol.upper(), interval)
+        with self._lock:
+            if key not in self._segments:
+                found = []
+                d = self._dir(symbol, interval)
+                if d.exists():
+                    for path in d.iterdir():
+                        m = _SEGMENT_RE.match(path.name)
+                        if m:
+                            found.append((int(m.group(1)), int(m.group(2)), path))
+                self._segments[key] = sorted(found)
+            return list(self._segments[key])
+    
+    def coverage(self, symbol: str, interval: str) -> List[Tuple[int, int]]:
+        """저장된 구간 목록 (병합된 [start_ms, end_ms))"""
+        return _merge_ranges([(s, e) for s, e, _ in self.segments(symbol, interval)])
+    
+    def missing_ranges(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> List[Tuple[int, int]]:
+        """
+        [start_ms, end_ms) 중 저장되지 않은 구간
+        
+        Returns:
+            [(gap_start_ms, gap_end_ms), ...]
+        """
+        gaps = []
+        cursor = start_ms
+        for s, e in self.coverage(symbol, interval):
+            if e <= cursor:
+                continue
+            if s >= end_ms:
+                break
+            if s > cursor:
+                gaps.append((cursor, s))
+            cursor = max(cursor, e)
+            if cursor >= end_ms:
+                break
+        if cursor < end_ms:
+            gaps.append((cursor, end_ms))
+        return gaps
+    
+    def append(
+        self,
+        symbol: str,
+        interval: str,
+        rows,
+        start_ms: int,
+        end_ms: int,
+    ) -> Optional[Path]:
+        """
+        수집한 구간을 새 세그먼트로 저장
+        
+        빈 구간(상장 이전 등)도 빈 세그먼트로 기록해 다시 수집하지 않도록 함
+        
+        Args:
+            symbol: 심볼
+            interval: 인터벌 (예: "30m")
+            rows: [{"timestamp", "open", "high", "low", "close", "volume"}, ...] 또는 DataFrame
+            start_ms: 수집 구간 시작 (포함)
+            end_ms: 수집 구간 끝 (미포함)
+        
+        Returns:
+            저장된 세그먼트 경로 (end_ms <= start_ms면 None)
+        """
+        if end_ms <= start_ms:
+            return None
+        
+        records = self._to_records(rows)
+        mask = (records["timestamp"] >= start_ms) & (records["timestamp"] < end_ms)
+        records = records[mask]
+        if len(records):
+            # timestamp 기준 정렬, 중복 timestamp는 첫 값 유지
+            _, first = np.unique(records["timestamp"], return_index=True)
+            records = records[first]
+        
+        d = self._dir(symbol, interval)
+        d.mkdir(parents=True, exist_ok=True)
+        path = d / f"{start_ms}_{end_ms}.npy"
+        tmp = path.with_suffix(".tmp")
+        
+        with open(tmp, "wb") as f:
+            np.save(f, records, allow_pickle=False)
+        tmp.replace(path)
+        
+        with self._lock:
+            self._segments.pop((symbol.upper(), interval), None)
+        return path
+    
+    def read(self, symbol: str, interval: str, start_ms: int = None, end_ms: int = None) -> pd.DataFrame:
+        """
+        [start_ms, end_ms) 구간 캔들 조회 (저장된 부분만)
+        
+        Returns:
+            pd.DataFrame: timestamp, open, high, low, close, volume, datetime_utc
+        """
+        lo = start_ms if start_ms is not None else np.iinfo(np.int64).min
+        hi = end_ms if end_ms is not None else np.iinfo(np.int64).max
+        
+        parts = []
+        for s, e, path in self.segments(symbol, interval):
+            if e <= lo or s >= hi:
+                continue
+            arr = np.load(path, mmap_mode="r", allow_pickle=False)
+            if len(arr) == 0:
+                continue
+            ts = arr["timestamp"]
+            i = np.searchsorted(ts, lo, side="left")
+            j = np.searchsorted(ts, hi, side="left")
+            if j > i:
+                parts.append(np.array(arr[i:j]))
+        
+        if parts:
+            records = np.concatenate(parts)
+            if len(parts) > 1:
+                # 세그먼트가 겹치는 구간의 중복 timestamp 제거 (먼저 저장된 값 유지)
+                order = np.argsort(records["timestamp"], kind="stable")
+                records = records[order]
+                _, first = np.unique(records["timestamp"], return_index=True)
+                records = records[first]
+        else:
+            records = np.empty(0, dtype=CANDLE_DTYPE)
+        
+        df = pd.DataFrame({name: records[name] for name in CANDLE_DTYPE.names})
+        df["datetime_utc"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+        return df
+    
+    def compact(self, symbol: str, interval: str) -> int:
+        """
+        연속된 세그먼트를 하나로 병합 (세그먼트 수가 많아졌을 때)
+        
+        Returns:
+            병합 후 세그먼트 수
+        """
+        for start, end in self.coverage(symbol, interval):
+            old = [p for s, e, p in self.segments(symbol, interval) if start <= s and e <= end]
+            if len(old) <= 1:
+                continue
+            df = self.read(symbol, interval, start, end)
+            new_path = self.append(symbol, interval, df, start, end)
+            for p in old:
+                if p != new_path:
+                    p.unlink(missing_ok=True)
+            with self._lock:
+                self._segments.pop((symbol.upper(), interval), None)
+        return len(self.segments(symbol, interval))
+    
+    def _manifest_path(self, symbol: str, interval: str) -> Path:
+        return self._dir(symbol, interval) / _MANIFEST_NAME
+    
+    def imported_sources(self, symbol: str, interval: str) -> Dict[str, Dict]:
+        """가져온 CSV 목록 (파일명 → {"size", "mtime_ns"})"""
+        path = self._manifest_path(symbol, interval)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _source_stamp(path: Path) -> Dict:
+        st = path.stat()
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    
+    def is_imported(self, filepath: str, symbol: str = None, interval: str = None) -> bool:
+        """CSV를 이미 가져왔는지 (파일이 바뀌었으면 False)"""
+        path = Path(filepath)
+        key = self._csv_key(path, symbol, interval)
+        if key is None:
+            return False
+        entry = self.imported_sources(*key).get(path.name)
+        return entry is not None and entry == self._source_stamp(path)
+    
+    def _record_import(self, path: Path, symbol: str, interval: str):
+        with self._lock:
+            sources = self.imported_sources(symbol, interval)
+            sources[path.name] = self._source_stamp(path)
+            manifest = self._manifest_path(symbol, interval)
+            manifest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = manifest.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(sources, f, indent=1, sort_keys=True)
+            os.replace(tmp, manifest)
+    
+    @staticmethod
+    def _csv_key(path: Path, symbol: str = None, interval: str = None) -> Optional[Tuple[str, str]]:
+        if symbol is None or interval is None:
+            m = _CSV_NAME_RE.match(path.name)
+            if not m:
+                return None
+            symbol = symbol or m.group(1)
+            interval = interval or m.group(2)
+        return symbol.upper(), interval
+    
+    def import_csv(self, filepath: str, symbol: str = None, interval: str = None) -> Optional[Path]:
+        """
+        기존 CSV 캐시 파일 가져오기 (가져온 파일은 manifest에 기록)
+        
+        Args:
+            filepath: CSV 경로 (DataFetcher 캐시 형식)
+            symbol: 심볼 (None이면 파일명에서 추출)
+            interval: 인터벌 (None이면 파일명에서 추출)
+        
+        Returns:
+            저장된 세그먼트 경로 (데이터가 없거나 형식을 알 수 없으면 None)
+        """
+        path = Path(filepath)
+        key = self._csv_key(path, symbol, interval)
+        if key is None:
+            return None
+        symbol, interval = key
+        
+        df = pd.read_csv(path, usecols=lambda c: c in CANDLE_DTYPE.names)
+        segment = None
+        if not df.empty and "timestamp" in df.columns:
+            step = INTERVAL_MS.get(interval, 0)
+            ts = df["timestamp"].astype(np.int64)
+            segment = self.append(symbol, interval, df, int(ts.min()), int(ts.max()) + step)
+        self._record_import(path, symbol, interval)
+        return segment
+    
+    @staticmethod
+    def _to_records(rows) -> np.ndarray:
+        """dict 리스트/DataFrame → CANDLE_DTYPE 구조화 배열"""
+        if isinstance(rows, pd.DataFrame):
+            df = rows
+        else:
+            df = pd.DataFrame(list(rows))
+        
+        records = np.zeros(len(df), dtype=CANDLE_DTYPE)
+        if len(df) == 0:
+            return records
+        
+        for name in CANDLE_DTYPE.names:
+            if name in df.columns:
+                records[name] = df[name].to_numpy(dtype=CANDLE_DTYPE[name])
+            elif name != "timestamp":
+                records[name] = np.nan
+        return records
@@ -2,19 +2,121 @@
 """
 Binance 30분봉 데이터 수집 모듈
 - REST API를 통한 OHLC 데이터 수집
-- 페이지네이션 및 재시도 로직 포함
-- 로컬 캐싱 지원
+- 페이지를 미리 나눠 동시 요청 (가중치 기반 토큰 버킷으로 속도 제한)
+- 재시도 로직 포함
+- 로컬 캐싱 지원 (바이너리 세그먼트 저장소, 부족한 구간만 추가 수집)
 """
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 
+from .candle_store import CandleStore, INTERVAL_MS
+
+
+def klines_request_weight(limit: int) -> int:
+    """/api/v3/klines 요청 가중치 (limit 구간별)"""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+class WeightRateLimiter:
+    """
+    가중치 기반 토큰 버킷
+    
+    - 분당 max_weight_per_min 가중치를 초 단위로 균등하게 채움
+    - max_requests_per_sec로 요청 빈도도 함께 제한
+    - 서버가 429/418을 주면 pause()로 모든 스레드의 요청을 멈춤
+    """
+    
+    def __init__(self, max_weight_per_min: int = 1200, max_requests_per_sec: float = 10.0):
+        """
+        Args:
+            max_weight_per_min: 분당 사용할 최대 가중치 (Binance 한도 6000보다 여유 있게)
+            max_requests_per_sec: 초당 최대 요청 수
+        """
+        self.max_weight_per_min = max_weight_per_min
+        self.max_requests_per_sec = max_requests_per_sec
+        
+        self._capacity = float(max_weight_per_min) / 6  # 최대 10초치 버스트
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._next_request_at = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        rate = self.max_weight_per_min / 60.0
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+    
+    def acquire(self, weight: int = 1):
+        """가중치만큼 토큰을 확보할 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                
+                wait = max(self._paused_until - now, self._next_request_at - now)
+                if wait <= 0 and self._tokens >= weight:
+                    self._tokens -= weight
+                    self._next_request_at = now + 1.0 / self.max_requests_per_sec
+                    return
+                if wait <= 0:
+                    wait = (weight - self._tokens) / (self.max_weight_per_min / 60.0)
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """seconds 동안 모든 요청 중지"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def observe_used_weight(self, used_weight):
+        """응답 헤더의 사용 가중치가 한도에 가까우면 토큰을 비움"""
+        if not used_weight:
+            return
+        try:
+            used = int(used_weight)
+        except ValueError:
+            return
+        if used >= self.max_weight_per_min * 0.9:
+            with self._lock:
+                self._tokens = 0.0
+
+
+class RequestPacer:
+    """
+    호출 단위 요청 간격 제한 (fetch_klines_30m의 sleep_sec)
+    
+    공유 WeightRateLimiter 설정은 건드리지 않고 해당 호출의 요청만 간격을 둠
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            at = max(self._next_at, now)
+            self._next_at = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
 
 class DataFetcher:
     """Binance 30분봉 데이터 수집 클래스"""
@@ -22,14 +124,32 @@ class DataFetcher:
     BINANCE_SPOT_BASE_URL = "https://api.binance.com"
     KLINES_ENDPOINT = "/api/v3/klines"
     
-    def __init__(self, cache_dir: str = "./cache"):
+    def __init__(
+        self,
+        cache_dir: str = "./cache",
+        concurrency: int = 4,
+        max_weight_per_min: int = 1200,
+    ):
         """
         Args:
             cache_dir: 캐시 파일 저장 디렉토리
+            concurrency: 페이지 동시 요청 수
+            max_weight_per_min: 분당 사용할 최대 요청 가중치
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = WeightRateLimiter(max_weight_per_min=max_weight_per_min)
+        self.last_fetch_report: Dict = {}
+        
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(10, self.concurrency))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # 바이너리 캔들 저장소 (기존 CSV 캐시는 처음 사용할 때 한 번 가져옴)
+        self.store = CandleStore(str(self.cache_dir / "store"))
+        self._csv_imported = False
     
     @staticmethod
     def dt_to_ms_utc(dt: datetime) -> int:
@@ -54,22 +174,27 @@ class DataFetcher:
         end_dt_utc: datetime = None,
         limit: int = 1000,
         timeout: int = 15,
-        sleep_sec: float = 0.2,
+        sleep_sec: float = None,
         max_retries: int = 8,
         progress_callback=None,
+        concurrency: int = None,
     ) -> List[Dict]:
         """
         Binance Spot /api/v3/klines를 이용해 30분봉 데이터 수집
         
+        시간 범위를 limit개 단위 페이지로 미리 나눠 동시에 요청하고,
+        도착 순서와 관계없이 시간순으로 다시 조립함
+        
         Args:
             symbol: 거래 심볼 (예: BTCUSDT)
             start_dt_utc: 시작 시간 (UTC)
             end_dt_utc: 종료 시간 (UTC)
             limit: 요청당 캔들 수 (1-1000)
             timeout: 요청 타임아웃 (초)
-            sleep_sec: 요청 간 대기 시간 (초)
+            sleep_sec: 요청 간 최소 간격 (초, 이 호출의 요청에만 적용)
             max_retries: 최대 재시도 횟수
             progress_callback: 진행률 콜백 함수 (current, total, message)
+            concurrency: 동시 요청 수 (None이면 self.concurrency)
         
         Returns:
             [{"timestamp": ms, "open": float, "high": float, "low": float, "close": float}, ...]
@@ -85,80 +210,130 @@ class DataFetcher:
         if limit < 1 or limit > 1000:
             raise ValueError("limit은 1~1000 범위여야 합니다.")
         
-        # 예상 총 캔들 수 계산 (진행률 표시용)
-        total_ms = end_ms - start_ms
-        candle_interval_ms = 30 * 60 * 1000  # 30분
-        estimated_total = max(1, total_ms // candle_interval_ms)
+        # 페이지 미리 계산 - 각 페이지는 [page_start, page_end] 구간의 최대 limit개 캔들
+        candle_interval_ms = INTERVAL_MS["30m"]
+        page_span_ms = limit * candle_interval_ms
+        pages = []
+        page_start = start_ms
+        while page_start < end_ms:
+            page_end = min(page_start + page_span_ms - 1, end_ms)
+            pages.append((page_start, page_end))
+            page_start = page_end + 1
         
-        out: List[Dict] = []
-        next_start_ms = start_ms
+        if not pages:
+            return []
         
-        while True:
-            if next_start_ms >= end_ms:
-                break
-            
+        # 예상 총 캔들 수 (진행률 표시용)
+        estimated_total = max(1, (end_ms - start_ms) // candle_interval_ms)
+        
+        url = self.BINANCE_SPOT_BASE_URL + self.KLINES_ENDPOINT
+        weight = klines_request_weight(limit)
+        pacer = RequestPacer(sleep_sec) if sleep_sec and sleep_sec > 0 else None
+        
+        def _fetch(page):
             params = {
                 "symbol": symbol,
                 "interval": "30m",
-                "startTime": next_start_ms,
-                "endTime": end_ms,
+                "startTime": page[0],
+                "endTime": page[1],
                 "limit": limit,
             }
-            
-            url = self.BINANCE_SPOT_BASE_URL + self.KLINES_ENDPOINT
-            
-            # 재시도 로직 (지수 백오프)
-            last_err = None
-            data = None
-            
-            for attempt in range(1, max_retries + 1):
-                try:
-                    r = self.session.get(url, params=params, timeout=timeout)
-                    if r.status_code == 200:
-                        data = r.json()
-                        last_err = None
-                        break
-                    
-                    last_err = RuntimeError(f"HTTP {r.status_code}: {r.text[:200]}")
-                    wait = min(2 ** attempt, 30)
-                    time.sleep(wait)
+            return self._request_page(url, params, weight, timeout, max_retries, pacer)
+        
+        workers = max(1, min(concurrency or self.concurrency, len(pages)))
+        results: Dict[int, list] = {}
+        fetched = 0
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_fetch, page): i for i, page in enumerate(pages)}
+            try:
+                for future in as_completed(futures):
+                    data = future.result()
+                    results[futures[future]] = data
+                    fetched += len(data)
                     
-                except requests.RequestException as e:
-                    last_err = e
-                    wait = min(2 ** attempt, 30)
-                    time.sleep(wait)
-            
-            if last_err is not None:
-                raise RuntimeError(f"요청 실패: {last_err}")
-            
-            if not data:
-                break
-            
-            # kline 배열 파싱
-            for k in data:
+                    # 진행률 콜백
+                    if progress_callback:
+                        msg = f"{symbol} {fetched:,}개 수집 중... ({len(results)}/{len(pages)} 페이지)"
+                        progress_callback(min(fetched, estimated_total), estimated_total, msg)
+            except Exception:
+                for f in futures:
+                    f.cancel()
+                raise
+        
+        # 페이지 순서대로 재조립 + 중복/누락 검사
+        out: List[Dict] = []
+        duplicates = 0
+        last_ts = None
+        gaps = []
+        for i in range(len(pages)):
+            for k in results[i]:
+                ts = int(k[0])
+                if last_ts is not None:
+                    if ts <= last_ts:
+                        duplicates += 1
+                        continue
+                    if ts - last_ts > candle_interval_ms:
+                        gaps.append((last_ts + candle_interval_ms, ts))
+                last_ts = ts
+                
+                # kline 배열 파싱
                 out.append({
-                    "timestamp": int(k[0]),
+                    "timestamp": ts,
                     "open": float(k[1]),
                     "high": float(k[2]),
                     "low": float(k[3]),
                     "close": float(k[4]),
                     "volume": float(k[5]),
                 })
-            
-            # 다음 페이지
-            last_open_time = int(data[-1][0])
-            next_start_ms = last_open_time + 1
-            
-            # 진행률 콜백
-            if progress_callback:
-                progress = min(100, int(len(out) / estimated_total * 100))
-                msg = f"{symbol} {len(out):,}개 수집 중..."
-                progress_callback(len(out), estimated_total, msg)
-            
-            time.sleep(sleep_sec)
+        
+        self.last_fetch_report = {
+            "symbol": symbol,
+            "pages": len(pages),
+            "candles": len(out),
+            "duplicates": duplicates,
+            "gaps": gaps,
+        }
+        if gaps:
+            print(f"⚠️ {symbol} 누락 구간 {len(gaps)}개 (거래소 데이터 없음 가능): "
+                  f"{datetime.fromtimestamp(gaps[0][0] / 1000, tz=timezone.utc)} ...")
         
         return out
     
+    def _request_page(self, url: str, params: Dict, weight: int, timeout: int, max_retries: int,
+                      pacer: Optional[RequestPacer] = None) -> list:
+        """단일 페이지 요청 (rate limit + 재시도/지수 백오프)"""
+        last_err = None
+        
+        for attempt in range(1, max_retries + 1):
+            if pacer is not None:
+                pacer.wait()
+            self.rate_limiter.acquire(weight)
+            try:
+                r = self.session.get(url, params=params, timeout=timeout)
+                self.rate_limiter.observe_used_weight(r.headers.get("X-MBX-USED-WEIGHT-1M"))
+                if r.status_code == 200:
+                    return r.json()
+                
+                last_err = RuntimeError(f"HTTP {r.status_code}: {r.text[:200]}")
+                wait = min(2 ** attempt, 30)
+                
+                # 429/418: 서버가 알려준 시간만큼 전체 요청 중지
+                if r.status_code in (418, 429):
+                    retry_after = r.headers.get("Retry-After")
+                    if retry_after and retry_after.isdigit():
+                        wait = int(retry_after)
+                    self.rate_limiter.pause(wait)
+                    continue
+                
+                time.sleep(wait)
+                
+            except requests.RequestException as e:
+                last_err = e
+                time.sleep(min(2 ** attempt, 30))
+        
+        raise RuntimeError(f"요청 실패: {last_err}")
+    
     def fetch_data(
         self,
         symbol: str = "BTCUSDT",
@@ -185,35 +360,89 @@ class DataFetcher:
         if end_date is None:
             end_date = datetime(2026, 1, 31, 23, 59, 59, tzinfo=timezone.utc)
         
-        # 캐시 확인
-        cache_path = self.get_cache_path(symbol, start_date, end_date)
-        if use_cache and cache_path.exists():
-            if progress_callback:
-                progress_callback(100, 100, f"캐시에서 로드: {cache_path.name}")
-            return self.load_from_cache(str(cache_path))
-        
-        # API에서 데이터 수집
-        rows = self.fetch_klines_30m(
-            symbol=symbol,
-            start_dt_utc=start_date,
-            end_dt_utc=end_date,
-            progress_callback=progress_callback,
-        )
-        
-        if not rows:
-            raise ValueError("데이터를 가져오지 못했습니다.")
+        if not use_cache:
+            rows = self.fetch_klines_30m(
+                symbol=symbol,
+                start_dt_utc=start_date,
+                end_dt_utc=end_date,
+                progress_callback=progress_callback,
+            )
+            if not rows:
+                raise ValueError("데이터를 가져오지 못했습니다.")
+            df = pd.DataFrame(rows)
+            df["datetime_utc"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+            return df
+        
+        self.import_csv_cache()
+        
+        # 요청 구간 [start, end] 중 저장소에 없는 부분만 수집
+        interval_ms = INTERVAL_MS["30m"]
+        start_ms = self.dt_to_ms_utc(start_date)
+        end_ms = self.dt_to_ms_utc(end_date) + 1
         
-        df = pd.DataFrame(rows)
-        df["datetime_utc"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
+        # 아직 마감되지 않은 봉은 저장하지 않음
+        now_ms = self.dt_to_ms_utc(datetime.now(timezone.utc))
+        closed_end_ms = min(end_ms, now_ms // interval_ms * interval_ms)
         
-        # 캐시 저장
-        if use_cache:
-            self.save_to_cache(df, str(cache_path))
-            if progress_callback:
-                progress_callback(100, 100, f"캐시 저장 완료: {cache_path.name}")
+        gaps = self.store.missing_ranges(symbol, "30m", start_ms, closed_end_ms)
+        for gap_start, gap_end in gaps:
+            rows = self.fetch_klines_30m(
+                symbol=symbol,
+                start_dt_utc=datetime.fromtimestamp(gap_start / 1000, tz=timezone.utc),
+                end_dt_utc=datetime.fromtimestamp((gap_end - 1) / 1000, tz=timezone.utc),
+                progress_callback=progress_callback,
+            )
+            self.store.append(symbol, "30m", rows, gap_start, gap_end)
+        
+        df = self.store.read(symbol, "30m", start_ms, closed_end_ms)
+        
+        # 진행 중인 봉까지 요청한 경우 해당 구간은 저장 없이 바로 수집
+        if closed_end_ms < end_ms:
+            rows = self.fetch_klines_30m(
+                symbol=symbol,
+                start_dt_utc=datetime.fromtimestamp(closed_end_ms / 1000, tz=timezone.utc),
+                end_dt_utc=end_date,
+            )
+            if rows:
+                live = pd.DataFrame(rows)
+                live["datetime_utc"] = pd.to_datetime(live["timestamp"], unit="ms", utc=True)
+                df = pd.concat([df, live], ignore_index=True)
+        
+        if df.empty:
+            raise ValueError("데이터를 가져오지 못했습니다.")
+        
+        if progress_callback:
+            source = f"{len(gaps)}개 구간 추가 수집" if gaps else "저장소에서 로드"
+            progress_callback(100, 100, f"{symbol} {len(df):,}개 ({source})")
         
         return df
     
+    def import_csv_cache(self, force: bool = False) -> int:
+        """
+        cache_dir의 기존 CSV 캐시를 바이너리 저장소로 가져오기
+        
+        Args:
+            force: 이미 가져왔어도 다시 실행
+        
+        Returns:
+            가져온 파일 수
+        """
+        if self._csv_imported and not force:
+            return 0
+        self._csv_imported = True
+        
+        imported = 0
+        for path in sorted(self.cache_dir.glob("*.csv")):
+            # 가져온 목록은 저장소 안에 있으므로 저장소를 지우면 다시 가져옴
+            if not force and self.store.is_imported(str(path)):
+                continue
+            try:
+                if self.store.import_csv(str(path)) is not None:
+                    imported += 1
+            except Exception as e:
+                print(f"CSV 캐시 가져오기 실패 ({path.name}): {e}")
+        return imported
+    
     def load_from_cache(self, filepath: str) -> pd.DataFrame:
         """캐시 파일에서 데이터 로드"""
         df = pd.read_csv(filepath)
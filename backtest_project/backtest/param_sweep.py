@@ -0,0 +1,243 @@
+# backtest/param_sweep.py
+"""
+파라미터 스윕 (그리드 서치) 모듈
+- Params 범위 조합을 ProcessPoolExecutor로 병렬 백테스트
+- EMA는 서로 다른 기간마다 한 번만 계산해 모든 조합이 공유
+- 조합별 실행은 summary_only 모드 (봉마다 자산곡선/객체를 기록하지 않음)
+- 완료되는 대로 결과 스트리밍, 최종 결과는 순위 테이블(DataFrame)
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, fields, replace
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .backtest_engine import BacktestEngine, Params, EMA_PERIOD_FIELDS, build_ema_cache
+
+
+# 결과 테이블 지표 컬럼
+METRIC_COLUMNS = [
+    "real_roi", "mdd_real", "profit_factor", "r2v_switches", "v2r_switches",
+    "total_trades", "win_rate", "virtual_roi", "final_real_capital",
+]
+
+# (fast, slow) 쌍 - fast >= slow 조합은 의미가 없으므로 기본적으로 제외
+_FAST_SLOW_PAIRS = [
+    ("trend_fast", "trend_slow"),
+    ("entry_fast", "entry_slow"),
+    ("long_exit_fast", "long_exit_slow"),
+    ("short_exit_fast", "short_exit_slow"),
+]
+
+
+# =========================
+# 워커 프로세스
+# =========================
+# 워커마다 initializer로 한 번만 전달받는 공유 데이터
+_worker_df: Optional[pd.DataFrame] = None
+_worker_ema_cache: Optional[Dict[int, np.ndarray]] = None
+_worker_initial_capital: float = 10000.0
+
+
+def _init_worker(df: pd.DataFrame, ema_cache: Dict[int, np.ndarray], initial_capital: float):
+    global _worker_df, _worker_ema_cache, _worker_initial_capital
+    _worker_df = df
+    _worker_ema_cache = ema_cache
+    _worker_initial_capital = initial_capital
+
+
+def _run_one(params: Params) -> Dict[str, Any]:
+    """단일 조합 백테스트 → 요약 지표 (자산곡선/거래 객체를 만들지 않는 summary_only 실행)"""
+    engine = BacktestEngine(params=params, initial_capital=_worker_initial_capital)
+    result = engine.run(_worker_df, ema_cache=_worker_ema_cache, summary_only=True)
+    return {
+        "real_roi": result.real_roi,
+        "mdd_real": result.mdd_real,
+        "profit_factor": result.profit_factor,
+        "r2v_switches": result.r2v_switches,
+        "v2r_switches": result.v2r_switches,
+        "total_trades": result.total_trades,
+        "win_rate": result.win_rate,
+        "virtual_roi": result.virtual_roi,
+        "final_real_capital": result.final_real_capital,
+    }
+
+
+def _run_chunk(chunk: List[Dict[str, Any]], base_params: Params) -> List[Dict[str, Any]]:
+    """조합 묶음 실행 (IPC 횟수를 줄이기 위해 여러 조합을 한 작업으로 처리)"""
+    rows = []
+    for overrides in chunk:
+        row = dict(overrides)
+        row.update(_run_one(replace(base_params, **overrides)))
+        rows.append(row)
+    return rows
+
+
+# =========================
+# 스윕 실행기
+# =========================
+class ParamSweep:
+    """
+    EMA 듀얼 모드 전략 파라미터 스윕
+    
+    사용법:
+        sweep = ParamSweep(df, max_workers=8)
+        table = sweep.run({
+            "entry_fast": [10, 20, 30],
+            "entry_slow": [50, 100],
+            "trailing_stop_long": [0.05, 0.10],
+        })
+    """
+    
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        base_params: Params = None,
+        initial_capital: float = 10000.0,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 16,
+    ):
+        """
+        Args:
+            df: OHLC 데이터 (BacktestEngine.run과 동일한 형식)
+            base_params: 범위에 포함되지 않은 파라미터의 기본값
+            initial_capital: 초기 자본
+            max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+            chunk_size: 워커 작업 하나에 묶을 조합 수
+        """
+        self.base_params = base_params or Params()
+        self.initial_capital = initial_capital
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        
+        # 워커로 보낼 데이터는 엔진이 사용하는 컬럼만
+        cols = [c for c in ("timestamp", "datetime_utc", "close") if c in df.columns]
+        self.df = df[cols].reset_index(drop=True)
+    
+    @staticmethod
+    def grid(
+        ranges: Dict[str, Iterable],
+        skip_invalid: bool = True,
+        base_params: Params = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        파라미터 범위 → 조합 목록 (Params 오버라이드 딕셔너리)
+        
+        Args:
+            ranges: {Params 필드명: 값 목록}
+            skip_invalid: fast >= slow인 EMA 쌍 조합 제외
+            base_params: 범위에 없는 필드의 기본값 (유효성 검사용)
+        """
+        valid = {f.name for f in fields(Params)}
+        unknown = [k for k in ranges if k not in valid]
+        if unknown:
+            raise ValueError(f"알 수 없는 파라미터: {unknown}")
+        
+        keys = list(ranges.keys())
+        values = [list(v) for v in ranges.values()]
+        
+        combos = []
+        for combo in itertools.product(*values):
+            overrides = dict(zip(keys, combo))
+            if skip_invalid and not ParamSweep._is_valid(overrides, base_params):
+                continue
+            combos.append(overrides)
+        return combos
+    
+    @staticmethod
+    def _is_valid(overrides: Dict[str, Any], base: Params = None) -> bool:
+        p = asdict(base or Params())
+        p.update(overrides)
+        return all(p[fast] < p[slow] for fast, slow in _FAST_SLOW_PAIRS)
+    
+    def _ema_cache(self, combos: List[Dict[str, Any]]) -> Dict[int, np.ndarray]:
+        """조합 전체에서 쓰이는 서로 다른 EMA 기간만 한 번씩 계산"""
+        periods = set()
+        for overrides in combos:
+            p = replace(self.base_params, **overrides)
+            periods.update(getattr(p, f) for f in EMA_PERIOD_FIELDS)
+        return build_ema_cache(self.df, periods)
+    
+    def iter_results(
+        self,
+        ranges: Dict[str, Iterable],
+        skip_invalid: bool = True,
+        progress_callback=None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        완료되는 순서대로 결과 행 스트리밍
+        
+        Args:
+            ranges: {Params 필드명: 값 목록}
+            skip_invalid: fast >= slow인 EMA 쌍 조합 제외
+            progress_callback: 진행률 콜백 (current, total, message)
+        
+        Yields:
+            {오버라이드 파라미터..., 지표...}
+        """
+        combos = self.grid(ranges, skip_invalid=skip_invalid, base_params=self.base_params)
+        total = len(combos)
+        if total == 0:
+            return
+        
+        ema_cache = self._ema_cache(combos)
+        chunks = [combos[i:i + self.chunk_size] for i in range(0, total, self.chunk_size)]
+        done = 0
+        
+        if self.max_workers == 1:
+            _init_worker(self.df, ema_cache, self.initial_capital)
+            for chunk in chunks:
+                for row in _run_chunk(chunk, self.base_params):
+                    done += 1
+                    yield row
+                if progress_callback:
+                    progress_callback(done, total, f"파라미터 스윕 {done:,}/{total:,}")
+            return
+        
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(self.df, ema_cache, self.initial_capital),
+        ) as executor:
+            futures = [executor.submit(_run_chunk, chunk, self.base_params) for chunk in chunks]
+            for future in as_completed(futures):
+                for row in future.result():
+                    done += 1
+                    yield row
+                if progress_callback:
+                    progress_callback(done, total, f"파라미터 스윕 {done:,}/{total:,}")
+    
+    def run(
+        self,
+        ranges: Dict[str, Iterable],
+        sort_by: str = "real_roi",
+        ascending: bool = False,
+        skip_invalid: bool = True,
+        progress_callback=None,
+    ) -> pd.DataFrame:
+        """
+        스윕 실행 후 순위 테이블 반환
+        
+        Args:
+            ranges: {Params 필드명: 값 목록}
+            sort_by: 정렬 기준 지표 (예: "real_roi", "mdd_real", "profit_factor")
+            ascending: 오름차순 여부 (MDD 기준이면 True)
+            skip_invalid: fast >= slow인 EMA 쌍 조합 제외
+            progress_callback: 진행률 콜백 (current, total, message)
+        
+        Returns:
+            pd.DataFrame: 파라미터 컬럼 + METRIC_COLUMNS, 1부터 시작하는 rank 인덱스
+        """
+        rows = list(self.iter_results(ranges, skip_invalid=skip_invalid, progress_callback=progress_callback))
+        if not rows:
+            return pd.DataFrame(columns=list(ranges.keys()) + METRIC_COLUMNS)
+        
+        table = pd.DataFrame(rows, columns=list(ranges.keys()) + METRIC_COLUMNS)
+        table = table.sort_values(sort_by, ascending=ascending, kind="mergesort").reset_index(drop=True)
+        table.index = table.index + 1
+        table.index.name = "rank"
+        return table
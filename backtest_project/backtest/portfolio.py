@@ -0,0 +1,243 @@
+# backtest/portfolio.py
+"""
+멀티 심볼 포트폴리오 백테스트 모듈
+- 심볼별 과거 데이터를 한 번씩만 로드 (캐시 우선, 스레드 병렬)
+- 심볼별 BacktestEngine 실행을 ProcessPoolExecutor로 병렬 처리
+- 심볼별 자산곡선을 시간축으로 병합해 포트폴리오 곡선과 통합 MDD 계산
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .data_fetcher import DataFetcher
+from .backtest_engine import BacktestEngine, BacktestResult, Params, calc_mdd
+
+
+# 심볼별 요약 테이블 컬럼
+SUMMARY_COLUMNS = [
+    "real_roi", "mdd_real", "profit_factor", "total_trades", "win_rate",
+    "r2v_switches", "v2r_switches", "final_real_capital",
+]
+
+
+def _run_symbol(symbol: str, df: pd.DataFrame, params: Params, initial_capital: float) -> BacktestResult:
+    """
+    워커 프로세스에서 심볼 하나 백테스트
+    
+    compact 모드로 실행해 프로세스 간 전달량을 줄임
+    (거래는 result.trade_records / result.trade_list(), 자산곡선은 result.equity_series())
+    """
+    engine = BacktestEngine(params=params, initial_capital=initial_capital)
+    return engine.run(df, compact=True)
+
+
+def _equity_series(result: BacktestResult) -> pd.Series:
+    """REAL 자산곡선 → 시간 인덱스 Series (같은 시간은 마지막 값 사용)"""
+    s = result.equity_series("REAL")
+    return s[~s.index.duplicated(keep="last")]
+
+
+@dataclass
+class PortfolioResult:
+    """포트폴리오 백테스트 결과"""
+    initial_capital: float
+    final_capital: float
+    
+    # 심볼별 결과 (compact 모드 - trade_list(), equity_series()로 조회) / 실패 사유
+    results: Dict[str, BacktestResult]
+    errors: Dict[str, str]
+    
+    # 시간 인덱스, 심볼별 컬럼 + "portfolio" 컬럼 (REAL 자본 기준)
+    equity: pd.DataFrame
+    
+    # 포트폴리오 지표
+    roi: float
+    mdd: float
+    
+    # 심볼별 요약 (SUMMARY_COLUMNS)
+    summary: pd.DataFrame = field(default_factory=pd.DataFrame)
+    
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.results.keys())
+
+
+class PortfolioBacktest:
+    """
+    여러 심볼에 같은 전략을 적용하는 포트폴리오 백테스트
+    
+    사용법:
+        runner = PortfolioBacktest(["BTCUSDT", "ETHUSDT", "SOLUSDT"], start, end, max_workers=8)
+        result = runner.run()
+        print(result.summary)
+        result.equity["portfolio"].plot()
+    """
+    
+    def __init__(
+        self,
+        symbols: List[str],
+        start_date: datetime = None,
+        end_date: datetime = None,
+        params: Params = None,
+        initial_capital: float = 10000.0,
+        cache_dir: str = "./cache",
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        fetch_workers: int = 4,
+    ):
+        """
+        Args:
+            symbols: 거래 심볼 목록 (예: ["BTCUSDT", "ETHUSDT"])
+            start_date: 시작일 (UTC)
+            end_date: 종료일 (UTC)
+            params: 전략 파라미터 (모든 심볼 공통)
+            initial_capital: 포트폴리오 총 초기 자본 (심볼 수로 균등 배분)
+            cache_dir: DataFetcher 캐시 디렉토리
+            use_cache: 캐시 사용 여부
+            max_workers: 백테스트 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+            fetch_workers: 데이터 로드 스레드 수 (API 호출 제한을 고려해 작게 유지)
+        """
+        if not symbols:
+            raise ValueError("심볼 목록이 비어 있습니다.")
+        
+        # 중복 제거 (순서 유지)
+        self.symbols = list(dict.fromkeys(symbols))
+        self.start_date = start_date
+        self.end_date = end_date
+        self.params = params or Params()
+        self.initial_capital = initial_capital
+        self.use_cache = use_cache
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.fetch_workers = max(1, fetch_workers)
+        
+        self.fetcher = DataFetcher(cache_dir=cache_dir)
+        self.data: Dict[str, pd.DataFrame] = {}
+    
+    @property
+    def capital_per_symbol(self) -> float:
+        return self.initial_capital / len(self.symbols)
+    
+    def load_data(self, progress_callback=None) -> Dict[str, str]:
+        """
+        심볼별 데이터 로드 (이미 로드된 심볼은 건너뜀)
+        
+        Returns:
+            {심볼: 오류 메시지} - 로드 실패한 심볼
+        """
+        errors: Dict[str, str] = {}
+        pending = [s for s in self.symbols if s not in self.data]
+        if not pending:
+            return errors
+        
+        def _load(symbol: str) -> pd.DataFrame:
+            df = self.fetcher.fetch_data(
+                symbol=symbol,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                use_cache=self.use_cache,
+            )
+            # 엔진이 사용하는 컬럼만 보관 (워커로 보낼 데이터 최소화)
+            cols = [c for c in ("timestamp", "datetime_utc", "close") if c in df.columns]
+            return df[cols].reset_index(drop=True)
+        
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(self.fetch_workers, len(pending))) as executor:
+            futures = {executor.submit(_load, s): s for s in pending}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    self.data[symbol] = future.result()
+                except Exception as e:
+                    errors[symbol] = f"데이터 로드 실패: {e}"
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(pending), f"데이터 로드 {done}/{len(pending)} ({symbol})")
+        
+        return errors
+    
+    def run(self, progress_callback=None) -> PortfolioResult:
+        """
+        전체 심볼 백테스트 실행
+        
+        Args:
+            progress_callback: 진행률 콜백 (current, total, message)
+        
+        Returns:
+            PortfolioResult
+        """
+        errors = self.load_data(progress_callback=progress_callback)
+        targets = [s for s in self.symbols if s in self.data]
+        capital = self.capital_per_symbol
+        results: Dict[str, BacktestResult] = {}
+        
+        def _collect(symbol: str, fn):
+            try:
+                results[symbol] = fn()
+            except Exception as e:
+                errors[symbol] = f"백테스트 실패: {e}"
+            if progress_callback:
+                done = len(results) + len(errors)
+                progress_callback(done, len(self.symbols), f"백테스트 {done}/{len(self.symbols)} ({symbol})")
+        
+        if self.max_workers == 1 or len(targets) <= 1:
+            for symbol in targets:
+                _collect(symbol, lambda: _run_symbol(symbol, self.data[symbol], self.params, capital))
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(targets))) as executor:
+                futures = {
+                    executor.submit(_run_symbol, s, self.data[s], self.params, capital): s
+                    for s in targets
+                }
+                for future in as_completed(futures):
+                    _collect(futures[future], future.result)
+        
+        # 입력 순서대로 정렬
+        results = {s: results[s] for s in self.symbols if s in results}
+        errors = {s: errors[s] for s in self.symbols if s in errors}
+        return self._build_result(results, errors)
+    
+    def _build_result(self, results: Dict[str, BacktestResult], errors: Dict[str, str]) -> PortfolioResult:
+        """심볼별 자산곡선 병합 → 포트폴리오 곡선/지표"""
+        capital = self.capital_per_symbol
+        
+        curves = {s: _equity_series(r) for s, r in results.items()}
+        if curves:
+            equity = pd.concat(curves, axis=1, sort=True)
+            # 곡선 시작 전에는 초기 자본, 이후 빈 구간은 직전 값 유지
+            equity = equity.ffill().fillna(capital)
+        else:
+            equity = pd.DataFrame()
+        
+        # 실패한 심볼의 배분 자본은 현금으로 보유한 것으로 간주
+        idle_capital = capital * len(errors)
+        if len(equity):
+            equity["portfolio"] = equity.sum(axis=1) + idle_capital
+            final_capital = float(equity["portfolio"].iloc[-1])
+            mdd = calc_mdd(equity["portfolio"].tolist()) * 100
+        else:
+            final_capital = self.initial_capital
+            mdd = 0.0
+        
+        roi = (final_capital - self.initial_capital) / self.initial_capital * 100
+        
+        summary = pd.DataFrame(
+            [[getattr(r, c) for c in SUMMARY_COLUMNS] for r in results.values()],
+            index=pd.Index(list(results.keys()), name="symbol"),
+            columns=SUMMARY_COLUMNS,
+        )
+        
+        return PortfolioResult(
+            initial_capital=self.initial_capital,
+            final_capital=final_capital,
+            results=results,
+            errors=errors,
+            equity=equity,
+            roi=roi,
+            mdd=mdd,
+            summary=summary,
+        )
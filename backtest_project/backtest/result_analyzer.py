@@ -1,17 +1,28 @@
 # backtest/result_analyzer.py
 """
 백테스트 결과 분석 모듈
-- 통계 계산
+- 통계 계산 (거래/자산곡선을 컬럼형 NumPy 배열로 보관, 모드별 1회 벡터 연산)
+- 롤링 Sharpe/Sortino, 수중(underwater) 곡선, 포지션 노출 시간
+- 거래/자산곡선 추가 시 증분 갱신 (라이브/리플레이 실행 중 사용)
 - 보고서 생성
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from .backtest_engine import BacktestResult, Trade
 
 
+MODES = ("ALL", "REAL", "VIRTUAL")
+
+# 30분봉 기준 연간 봉 수 (롤링 지표 연율화)
+BARS_PER_YEAR_30M = 365 * 24 * 2
+
+_BAR_SECONDS = 30 * 60
+
+
 @dataclass
 class TradeStats:
     """거래 통계"""
@@ -36,25 +47,109 @@ class TradeStats:
     max_consecutive_losses: int
 
 
-class ResultAnalyzer:
-    """백테스트 결과 분석기"""
+class _GrowableArray:
+    """용량을 2배씩 늘리는 추가 전용 1차원 배열"""
     
-    def __init__(self, result: BacktestResult):
-        self.result = result
+    def __init__(self, dtype, capacity: int = 64):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
     
-    def calculate_trade_stats(self, mode: str = "ALL") -> TradeStats:
-        """
-        거래 통계 계산
+    def __len__(self) -> int:
+        return self._size
+    
+    def extend(self, values: np.ndarray):
+        n = len(values)
+        if self._size + n > len(self._data):
+            capacity = max(len(self._data) * 2, self._size + n)
+            data = np.empty(capacity, dtype=self._data.dtype)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+        self._data[self._size:self._size + n] = values
+        self._size += n
+    
+    @property
+    def values(self) -> np.ndarray:
+        """현재 값 (복사 없는 뷰)"""
+        return self._data[:self._size]
+
+
+def _run_lengths(flags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """불리언 배열의 연속 구간 (구간 값, 구간 길이)"""
+    change = np.flatnonzero(flags[1:] != flags[:-1]) + 1
+    starts = np.concatenate(([0], change))
+    lengths = np.diff(np.append(starts, len(flags)))
+    return flags[starts], lengths
+
+
+def _to_ns(times) -> np.ndarray:
+    """시간 목록 → UTC epoch 나노초 (변환 불가 값은 NaT 정수)"""
+    if len(times) == 0:
+        return np.empty(0, dtype=np.int64)
+    dt = pd.to_datetime(pd.Series(list(times)), errors="coerce", utc=True)
+    return dt.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+_NAT = np.iinfo(np.int64).min
+
+
+class _ModeAccumulator:
+    """
+    모드 하나의 누적 거래 통계
+    
+    거래 묶음(배열)을 받을 때마다 합계/최대/연속 승패를 이어서 갱신하므로
+    전체 거래를 다시 훑지 않음
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.wins = 0
+        self.total_pnl = 0.0
+        self.total_fees = 0.0
+        self.net_pnl = 0.0
+        self.gross_profit = 0.0
+        self.loss_sum = 0.0
+        self.max_profit = 0.0
+        self.max_loss = 0.0
+        self.holding_bars = 0.0
+        self.holding_seconds = 0.0
+        self.max_wins = 0
+        self.max_losses = 0
+        self.streak = 0  # 현재 연속 (+: 승, -: 패)
+    
+    def update(self, net: np.ndarray, pnl: np.ndarray, fee: np.ndarray, bars: np.ndarray, seconds: np.ndarray):
+        n = len(net)
+        if n == 0:
+            return
+        win = net > 0
         
-        Args:
-            mode: "ALL", "REAL", "VIRTUAL"
-        """
-        trades = self.result.trades
+        if self.count == 0:
+            self.max_profit, self.max_loss = float(net.max()), float(net.min())
+        else:
+            self.max_profit = max(self.max_profit, float(net.max()))
+            self.max_loss = min(self.max_loss, float(net.min()))
         
-        if mode != "ALL":
-            trades = [t for t in trades if t.mode == mode]
+        self.count += n
+        self.wins += int(win.sum())
+        self.total_pnl += float(pnl.sum())
+        self.total_fees += float(fee.sum())
+        self.net_pnl += float(net.sum())
+        self.gross_profit += float(net[win].sum())
+        self.loss_sum += float(net[~win].sum())
+        self.holding_bars += float(bars.sum())
+        self.holding_seconds += float(seconds.sum())
         
-        if not trades:
+        # 연속 승/패 - 묶음 첫 구간은 직전 연속 기록과 이어짐
+        values, lengths = _run_lengths(win)
+        if self.streak > 0 and values[0]:
+            lengths[0] += self.streak
+        elif self.streak < 0 and not values[0]:
+            lengths[0] -= self.streak
+        self.max_wins = max(self.max_wins, int(lengths[values].max(initial=0)))
+        self.max_losses = max(self.max_losses, int(lengths[~values].max(initial=0)))
+        self.streak = int(lengths[-1]) if values[-1] else -int(lengths[-1])
+    
+    def to_stats(self) -> TradeStats:
+        if self.count == 0:
             return TradeStats(
                 total_trades=0, winning_trades=0, losing_trades=0, win_rate=0,
                 total_pnl=0, total_fees=0, net_pnl=0,
@@ -63,105 +158,333 @@ class ResultAnalyzer:
                 avg_holding_bars=0, max_consecutive_wins=0, max_consecutive_losses=0
             )
         
-        winning = [t for t in trades if t.net_pnl > 0]
-        losing = [t for t in trades if t.net_pnl <= 0]
+        losses = self.count - self.wins
+        gross_loss = abs(self.loss_sum)
+        return TradeStats(
+            total_trades=self.count,
+            winning_trades=self.wins,
+            losing_trades=losses,
+            win_rate=self.wins / self.count * 100,
+            total_pnl=self.total_pnl,
+            total_fees=self.total_fees,
+            net_pnl=self.net_pnl,
+            avg_profit=self.gross_profit / self.wins if self.wins else 0,
+            avg_loss=self.loss_sum / losses if losses else 0,
+            profit_factor=self.gross_profit / gross_loss if gross_loss > 0 else float('inf'),
+            max_profit=self.max_profit,
+            max_loss=self.max_loss,
+            avg_holding_bars=self.holding_bars / self.count,
+            max_consecutive_wins=self.max_wins,
+            max_consecutive_losses=self.max_losses,
+        )
+
+
+class ResultAnalyzer:
+    """
+    백테스트 결과 분석기
+    
+    사용법:
+        analyzer = ResultAnalyzer(result)
+        stats = analyzer.calculate_trade_stats("REAL")
+    
+    result의 trades / equity_curve_*에 거래가 계속 추가되는 경우(리플레이 등)
+    sync()로 새로 추가된 부분만 반영:
+        analyzer = ResultAnalyzer(result)
+        ...
+        analyzer.sync()
+    """
+    
+    def __init__(self, result: BacktestResult = None):
+        self.result = result
+        self._reset()
+        if result is not None:
+            self.sync()
+    
+    def _reset(self):
+        # 거래 컬럼
+        self._trades: List[Trade] = []
+        self._net_pnl = _GrowableArray(np.float64)
+        self._pnl = _GrowableArray(np.float64)
+        self._fee = _GrowableArray(np.float64)
+        self._is_real = _GrowableArray(bool)
+        self._is_long = _GrowableArray(bool)
+        self._entry_ns = _GrowableArray(np.int64)
+        self._exit_ns = _GrowableArray(np.int64)
+        self._holding_bars = _GrowableArray(np.float64)
+        self._acc: Dict[str, _ModeAccumulator] = {m: _ModeAccumulator() for m in MODES}
         
-        total_pnl = sum(t.pnl for t in trades)
-        total_fees = sum(t.fee for t in trades)
-        net_pnl = sum(t.net_pnl for t in trades)
+        # 자산곡선 컬럼
+        self._eq_times: List[Any] = []
+        self._eq_ns = _GrowableArray(np.int64)
+        self._eq_real = _GrowableArray(np.float64)
+        self._eq_virtual = _GrowableArray(np.float64)
+        self._eq_tz_aware = False
         
-        avg_profit = sum(t.net_pnl for t in winning) / len(winning) if winning else 0
-        avg_loss = sum(t.net_pnl for t in losing) / len(losing) if losing else 0
+        # sync()로 반영한 원본 목록과 길이
+        self._synced_sources: Tuple = (None, None, None)
+        self._synced_counts = (0, 0)
+    
+    # =========================
+    # 증분 갱신
+    # =========================
+    def sync(self) -> int:
+        """
+        result에 새로 추가된 거래/자산곡선만 반영
         
-        gross_profit = sum(t.net_pnl for t in winning)
-        gross_loss = abs(sum(t.net_pnl for t in losing))
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else float('inf')
+        원본 목록이 교체되면 처음부터 다시 계산
         
-        max_profit = max((t.net_pnl for t in trades), default=0)
-        max_loss = min((t.net_pnl for t in trades), default=0)
+        Returns:
+            새로 반영한 거래 수
+        """
+        src = self.result
+        if src is None:
+            return 0
         
-        # 연속 승/패
-        max_cons_wins, max_cons_losses = self._calculate_consecutive(trades)
+        if getattr(src, "trade_records", None) is not None:
+            return self._sync_compact(src)
         
-        # 평균 보유 기간
-        avg_holding = sum(t.holding_bars for t in trades) / len(trades)
+        trades = src.trades
+        eq_real, eq_virtual = src.equity_curve_real, src.equity_curve_virtual
+        n_trades, n_eq = self._synced_counts
         
-        return TradeStats(
-            total_trades=len(trades),
-            winning_trades=len(winning),
-            losing_trades=len(losing),
-            win_rate=len(winning) / len(trades) * 100 if trades else 0,
-            total_pnl=total_pnl,
-            total_fees=total_fees,
-            net_pnl=net_pnl,
-            avg_profit=avg_profit,
-            avg_loss=avg_loss,
-            profit_factor=profit_factor,
-            max_profit=max_profit,
-            max_loss=max_loss,
-            avg_holding_bars=avg_holding,
-            max_consecutive_wins=max_cons_wins,
-            max_consecutive_losses=max_cons_losses,
+        replaced = any(a is not b for a, b in zip((trades, eq_real, eq_virtual), self._synced_sources))
+        if self._synced_sources[0] is not None and (replaced or len(trades) < n_trades or len(eq_real) < n_eq):
+            self._reset()
+            n_trades = n_eq = 0
+        
+        new_trades = trades[n_trades:]
+        self.append_trades(new_trades)
+        
+        n_new_eq = min(len(eq_real), len(eq_virtual)) - n_eq
+        if n_new_eq > 0:
+            self._append_equity_points(eq_real[n_eq:n_eq + n_new_eq], eq_virtual[n_eq:n_eq + n_new_eq])
+        
+        self._synced_sources = (trades, eq_real, eq_virtual)
+        self._synced_counts = (len(trades), n_eq + max(0, n_new_eq))
+        return len(new_trades)
+    
+    def _sync_compact(self, result: BacktestResult) -> int:
+        """압축 결과(BacktestEngine.run(compact=True)) 반영 - 완료된 결과이므로 한 번만 읽음"""
+        if self._synced_sources[0] is result.trade_records:
+            return 0
+        self._reset()
+        
+        trades = result.trade_list()
+        self.append_trades(trades)
+        if result.equity_real is not None and len(result.equity_real):
+            times = pd.to_datetime(result.equity_times, utc=True)
+            self._eq_tz_aware = True
+            self._eq_times.extend(times)
+            self._eq_ns.extend(times.asi8)
+            self._eq_real.extend(result.equity_real)
+            self._eq_virtual.extend(result.equity_virtual)
+        
+        self._synced_sources = (result.trade_records, None, None)
+        return len(trades)
+    
+    def append_trade(self, trade: Trade):
+        """완료된 거래 1건 추가"""
+        self.append_trades([trade])
+    
+    def append_trades(self, trades: Iterable[Trade]):
+        """완료된 거래 여러 건 추가 (묶음 단위로 벡터 연산)"""
+        trades = list(trades)
+        n = len(trades)
+        if n == 0:
+            return
+        
+        net = np.fromiter((t.net_pnl for t in trades), dtype=np.float64, count=n)
+        pnl = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=n)
+        fee = np.fromiter((t.fee for t in trades), dtype=np.float64, count=n)
+        is_real = np.fromiter((t.mode == "REAL" for t in trades), dtype=bool, count=n)
+        is_long = np.fromiter((t.side == "LONG" for t in trades), dtype=bool, count=n)
+        entry_ns = _to_ns([t.entry_time for t in trades])
+        exit_ns = _to_ns([t.exit_time for t in trades])
+        
+        # 보유 기간 - 봉 개수는 Trade.holding_bars와 동일하게 양쪽 시간이
+        # pd.Timestamp일 때만 계산하고 나머지(문자열 등)는 1봉
+        valid = (entry_ns != _NAT) & (exit_ns != _NAT)
+        seconds = np.where(valid, (exit_ns - entry_ns) / 1e9, 0.0)
+        is_ts = np.fromiter(
+            (isinstance(t.entry_time, pd.Timestamp) and isinstance(t.exit_time, pd.Timestamp) for t in trades),
+            dtype=bool, count=n,
         )
+        bars = np.where(valid & is_ts, np.maximum(1, np.floor(seconds / _BAR_SECONDS)), 1.0)
+        
+        self._trades.extend(trades)
+        self._net_pnl.extend(net)
+        self._pnl.extend(pnl)
+        self._fee.extend(fee)
+        self._is_real.extend(is_real)
+        self._is_long.extend(is_long)
+        self._entry_ns.extend(entry_ns)
+        self._exit_ns.extend(exit_ns)
+        self._holding_bars.extend(bars)
+        
+        self._acc["ALL"].update(net, pnl, fee, bars, seconds)
+        for mode, mask in (("REAL", is_real), ("VIRTUAL", ~is_real)):
+            self._acc[mode].update(net[mask], pnl[mask], fee[mask], bars[mask], seconds[mask])
     
-    def _calculate_consecutive(self, trades: List[Trade]) -> tuple:
-        """연속 승/패 계산"""
-        if not trades:
-            return 0, 0
+    def append_equity(self, time: Any, real_capital: float, virtual_capital: float):
+        """자산곡선 1개 지점 추가"""
+        self._append_equity_points([(time, real_capital)], [(time, virtual_capital)])
+    
+    def _append_equity_points(self, real_points, virtual_points):
+        times, real_values = zip(*real_points)
+        virtual_values = [v for _, v in virtual_points]
         
-        max_wins = 0
-        max_losses = 0
-        curr_wins = 0
-        curr_losses = 0
+        if not self._eq_times:
+            self._eq_tz_aware = getattr(times[0], "tzinfo", None) is not None
+        self._eq_times.extend(times)
+        self._eq_ns.extend(_to_ns(times))
+        self._eq_real.extend(np.asarray(real_values, dtype=np.float64))
+        self._eq_virtual.extend(np.asarray(virtual_values, dtype=np.float64))
+    
+    # =========================
+    # 거래 통계
+    # =========================
+    def calculate_trade_stats(self, mode: str = "ALL") -> TradeStats:
+        """
+        거래 통계 계산
         
-        for t in trades:
-            if t.net_pnl > 0:
-                curr_wins += 1
-                curr_losses = 0
-                max_wins = max(max_wins, curr_wins)
-            else:
-                curr_losses += 1
-                curr_wins = 0
-                max_losses = max(max_losses, curr_losses)
+        Args:
+            mode: "ALL", "REAL", "VIRTUAL"
+        """
+        acc = self._acc.get(mode)
+        if acc is None:
+            raise ValueError(f"알 수 없는 모드: {mode}")
+        return acc.to_stats()
+    
+    def exposure(self, mode: str = "ALL") -> float:
+        """
+        포지션 노출 시간 비율 (%)
+        
+        자산곡선 전체 기간(없으면 첫 진입~마지막 청산) 중 포지션을 보유한 시간
+        """
+        acc = self._acc.get(mode)
+        if acc is None:
+            raise ValueError(f"알 수 없는 모드: {mode}")
+        
+        eq_ns = self._eq_ns.values
+        eq_ns = eq_ns[eq_ns != _NAT]
+        if len(eq_ns) >= 2:
+            span = (eq_ns.max() - eq_ns.min()) / 1e9
+        else:
+            entry, exit_ = self._entry_ns.values, self._exit_ns.values
+            valid = (entry != _NAT) & (exit_ != _NAT)
+            span = (exit_[valid].max() - entry[valid].min()) / 1e9 if valid.any() else 0.0
+        
+        return min(100.0, acc.holding_seconds / span * 100) if span > 0 else 0.0
+    
+    # =========================
+    # 자산곡선 지표
+    # =========================
+    def _equity_index(self) -> pd.DatetimeIndex:
+        ns = self._eq_ns.values
+        if self._eq_tz_aware:
+            return pd.DatetimeIndex(pd.to_datetime(ns, utc=True), name="time")
+        return pd.DatetimeIndex(pd.to_datetime(ns), name="time")
+    
+    def _equity_values(self, mode: str) -> np.ndarray:
+        if mode == "REAL":
+            return self._eq_real.values
+        if mode == "VIRTUAL":
+            return self._eq_virtual.values
+        raise ValueError(f"자산곡선 모드는 REAL/VIRTUAL만 지원: {mode}")
+    
+    def equity_returns(self, mode: str = "REAL") -> pd.Series:
+        """봉 단위 수익률"""
+        values = self._equity_values(mode)
+        returns = np.zeros(len(values))
+        if len(values) > 1:
+            prev = values[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns[1:] = np.where(prev > 0, values[1:] / prev - 1, 0.0)
+        return pd.Series(returns, index=self._equity_index(), name=mode.lower())
+    
+    def rolling_sharpe(self, window: int = 48 * 30, mode: str = "REAL",
+                       periods_per_year: int = BARS_PER_YEAR_30M) -> pd.Series:
+        """
+        롤링 Sharpe (무위험 수익률 0, 연율화)
         
-        return max_wins, max_losses
+        Args:
+            window: 롤링 봉 수 (기본 30분봉 30일)
+            mode: "REAL", "VIRTUAL"
+            periods_per_year: 연간 봉 수
+        """
+        returns = self.equity_returns(mode)
+        roll = returns.rolling(window, min_periods=2)
+        std = roll.std(ddof=0)
+        sharpe = roll.mean() / std.where(std > 0) * np.sqrt(periods_per_year)
+        return sharpe.rename(f"sharpe_{mode.lower()}")
+    
+    def rolling_sortino(self, window: int = 48 * 30, mode: str = "REAL",
+                        periods_per_year: int = BARS_PER_YEAR_30M) -> pd.Series:
+        """롤링 Sortino (하방 편차 기준, 연율화)"""
+        returns = self.equity_returns(mode)
+        downside = np.sqrt((np.minimum(returns, 0.0) ** 2).rolling(window, min_periods=2).mean())
+        mean = returns.rolling(window, min_periods=2).mean()
+        sortino = mean / downside.where(downside > 0) * np.sqrt(periods_per_year)
+        return sortino.rename(f"sortino_{mode.lower()}")
+    
+    def underwater_curve(self, mode: str = "REAL") -> pd.Series:
+        """수중 곡선 - 직전 최고점 대비 낙폭 (%; 0 이하)"""
+        values = self._equity_values(mode)
+        peak = np.maximum.accumulate(values) if len(values) else values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = np.where(peak > 0, values / peak - 1, 0.0) * 100
+        return pd.Series(dd, index=self._equity_index(), name=f"underwater_{mode.lower()}")
     
+    def _total_ratio(self, mode: str, periods_per_year: int, downside: bool) -> float:
+        returns = self.equity_returns(mode).to_numpy()[1:]
+        if len(returns) < 2:
+            return 0.0
+        dev = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2)) if downside else returns.std()
+        return float(returns.mean() / dev * np.sqrt(periods_per_year)) if dev > 0 else 0.0
+    
+    def sharpe(self, mode: str = "REAL", periods_per_year: int = BARS_PER_YEAR_30M) -> float:
+        """전체 기간 Sharpe"""
+        return self._total_ratio(mode, periods_per_year, downside=False)
+    
+    def sortino(self, mode: str = "REAL", periods_per_year: int = BARS_PER_YEAR_30M) -> float:
+        """전체 기간 Sortino"""
+        return self._total_ratio(mode, periods_per_year, downside=True)
+    
+    # =========================
+    # DataFrame / 보고서
+    # =========================
     def get_trades_dataframe(self) -> pd.DataFrame:
         """거래 내역을 DataFrame으로 반환"""
-        if not self.result.trades:
+        trades = self._trades
+        if not trades:
             return pd.DataFrame()
         
-        data = []
-        for i, t in enumerate(self.result.trades, 1):
-            data.append({
-                "#": i,
-                "방향": t.side,
-                "모드": t.mode,
-                "진입시간": t.entry_time,
-                "청산시간": t.exit_time,
-                "진입가": t.entry_price,
-                "청산가": t.exit_price,
-                "수익률(%)": t.pnl_percentage,
-                "순손익": t.net_pnl,
-                "수수료": t.fee,
-                "청산사유": t.reason_exit,
-            })
-        
-        return pd.DataFrame(data)
+        net = self._net_pnl.values
+        capital = np.fromiter((t.entry_capital for t in trades), dtype=np.float64, count=len(trades))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_pct = np.where(capital > 0, net / capital * 100, 0.0)
+        
+        return pd.DataFrame({
+            "#": np.arange(1, len(trades) + 1),
+            "방향": np.where(self._is_long.values, "LONG", "SHORT"),
+            "모드": np.where(self._is_real.values, "REAL", "VIRTUAL"),
+            "진입시간": [t.entry_time for t in trades],
+            "청산시간": [t.exit_time for t in trades],
+            "진입가": [t.entry_price for t in trades],
+            "청산가": [t.exit_price for t in trades],
+            "수익률(%)": pnl_pct,
+            "순손익": net.copy(),
+            "수수료": self._fee.values.copy(),
+            "청산사유": [t.reason_exit for t in trades],
+        })
     
     def get_equity_dataframe(self) -> pd.DataFrame:
         """자산곡선을 DataFrame으로 반환"""
-        data = []
-        for (t_r, v_r), (t_v, v_v) in zip(
-            self.result.equity_curve_real, 
-            self.result.equity_curve_virtual
-        ):
-            data.append({
-                "time": t_r,
-                "real_capital": v_r,
-                "virtual_capital": v_v,
-            })
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            "time": list(self._eq_times),
+            "real_capital": self._eq_real.values.copy(),
+            "virtual_capital": self._eq_virtual.values.copy(),
+        })
     
     def generate_summary_text(self) -> str:
         """요약 텍스트 생성"""
@@ -184,6 +507,8 @@ class ResultAnalyzer:
             f"VIRTUAL ROI: {r.virtual_roi:+.2f}%",
             f"REAL MDD: -{r.mdd_real:.2f}%",
             f"VIRTUAL MDD: -{r.mdd_virtual:.2f}%",
+            f"REAL Sharpe: {self.sharpe('REAL'):.2f}, Sortino: {self.sortino('REAL'):.2f}",
+            f"노출 시간: {self.exposure('ALL'):.1f}% (REAL: {self.exposure('REAL'):.1f}%)",
             "",
             "--- 거래 통계 ---",
             f"총 거래 수: {stats_all.total_trades} (REAL: {stats_real.total_trades}, VIRTUAL: {stats_virtual.total_trades})",
@@ -243,4 +568,7 @@ class ResultAnalyzer:
             "max_consecutive_wins": stats.max_consecutive_wins,
             "max_consecutive_losses": stats.max_consecutive_losses,
             "has_open_position": r.has_open_position,
+            "sharpe_real": self.sharpe("REAL"),
+            "sortino_real": self.sortino("REAL"),
+            "exposure": self.exposure("ALL"),
         }
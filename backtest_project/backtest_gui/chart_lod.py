@@ -0,0 +1,195 @@
+# backtest_gui/chart_lod.py
+"""
+차트 LOD(Level of Detail) 데이터
+- 봉 데이터를 2배씩 묶은 여러 줌 레벨로 미리 집계
+- 보이는 x 구간과 픽셀 폭에 맞는 레벨만 잘라서 반환
+- OHLC는 (첫 open, 최대 high, 최소 low, 마지막 close)로, 라인은 구간 min/max 쌍으로 집계해
+  축소해도 급등락(스파이크)이 사라지지 않음
+
+matplotlib/Qt에 의존하지 않는 순수 NumPy 모듈
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class LODSeries:
+    """
+    x축을 공유하는 시계열 묶음의 줌 레벨 피라미드
+    
+    사용법:
+        lod = LODSeries(x, ohlc=(o, h, l, c), lines={"ema20": e20})
+        view = lod.view(x0, x1, max_buckets=800)
+        view.x, view.ohlc, view.lines["ema20"]
+    """
+    
+    def __init__(
+        self,
+        x: np.ndarray,
+        ohlc: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None,
+        lines: Optional[Dict[str, np.ndarray]] = None,
+        min_buckets: int = 64,
+    ):
+        """
+        Args:
+            x: 봉 시각 (오름차순 float, matplotlib date num)
+            ohlc: (open, high, low, close) 배열 (없으면 None)
+            lines: {이름: 값 배열} 라인 시리즈 (close, EMA 등)
+            min_buckets: 가장 거친 레벨의 최소 봉 수
+        """
+        self.x = np.asarray(x, dtype=np.float64)
+        self.n = len(self.x)
+        self.bar_width = float(np.median(np.diff(self.x))) if self.n > 1 else 1.0
+        
+        base_ohlc = None
+        if ohlc is not None:
+            base_ohlc = tuple(np.asarray(a, dtype=np.float64) for a in ohlc)
+        base_lines = {k: np.asarray(v, dtype=np.float64) for k, v in (lines or {}).items()}
+        
+        # 레벨 0 = 원본, 레벨 k = 2^k 봉씩 집계
+        self.factors: List[int] = [1]
+        self._ohlc_levels = [base_ohlc]
+        self._line_levels: List[Dict[str, Tuple[np.ndarray, np.ndarray]]] = [
+            {k: (v, v) for k, v in base_lines.items()}
+        ]
+        
+        factor = 2
+        while self.n // factor >= min_buckets:
+            starts = np.arange(0, self.n, factor)
+            self.factors.append(factor)
+            self._ohlc_levels.append(self._aggregate_ohlc(base_ohlc, starts))
+            self._line_levels.append({k: self._aggregate_minmax(v, starts) for k, v in base_lines.items()})
+            factor *= 2
+    
+    def has_line(self, name: str) -> bool:
+        return name in self._line_levels[0]
+    
+    @staticmethod
+    def _aggregate_ohlc(ohlc, starts: np.ndarray):
+        if ohlc is None:
+            return None
+        o, h, l, c = ohlc
+        ends = np.append(starts[1:], len(o)) - 1
+        return (
+            o[starts],
+            np.fmax.reduceat(h, starts),
+            np.fmin.reduceat(l, starts),
+            c[ends],
+        )
+    
+    @staticmethod
+    def _aggregate_minmax(values: np.ndarray, starts: np.ndarray):
+        return np.fmin.reduceat(values, starts), np.fmax.reduceat(values, starts)
+    
+    def level_for(self, x0: float, x1: float, max_buckets: int) -> int:
+        """보이는 구간의 봉 수가 max_buckets 이하가 되는 가장 세밀한 레벨"""
+        if self.n == 0:
+            return 0
+        i0, i1 = np.searchsorted(self.x, [x0, x1])
+        visible = max(1, i1 - i0)
+        for level, factor in enumerate(self.factors):
+            if visible / factor <= max_buckets:
+                return level
+        return len(self.factors) - 1
+    
+    def view(self, x0: float, x1: float, max_buckets: int) -> "LODView":
+        """
+        [x0, x1] 구간을 그리기 위한 데이터 (앞뒤로 한 버킷씩 여유)
+        
+        Args:
+            x0, x1: 보이는 x 범위
+            max_buckets: 그릴 최대 버킷 수 (보통 축 픽셀 폭)
+        """
+        level = self.level_for(x0, x1, max(1, max_buckets))
+        factor = self.factors[level]
+        
+        i0 = max(0, int(np.searchsorted(self.x, x0)) - factor)
+        i1 = min(self.n, int(np.searchsorted(self.x, x1)) + factor)
+        b0, b1 = i0 // factor, -(-i1 // factor)
+        
+        xs = self.x[::factor][b0:b1] if factor > 1 else self.x[b0:b1]
+        
+        ohlc = self._ohlc_levels[level]
+        if ohlc is not None:
+            ohlc = tuple(a[b0:b1] for a in ohlc)
+        
+        lines = {}
+        for name, (lo, hi) in self._line_levels[level].items():
+            lo, hi = lo[b0:b1], hi[b0:b1]
+            if factor == 1:
+                lines[name] = (xs, lo)
+            else:
+                # 버킷마다 (min, max) 두 점으로 그려 봉 안의 변동폭 유지
+                half = self.bar_width * factor / 2
+                lx = np.empty(len(xs) * 2)
+                ly = np.empty(len(xs) * 2)
+                lx[0::2], lx[1::2] = xs, xs + half
+                ly[0::2], ly[1::2] = lo, hi
+                lines[name] = (lx, ly)
+        
+        centers = xs + self.bar_width * (factor - 1) / 2
+        return LODView(level=level, factor=factor, width=self.bar_width * factor, x=xs,
+                       centers=centers, ohlc=ohlc, lines=lines)
+    
+    def y_range(self, x0: float, x1: float) -> Optional[Tuple[float, float]]:
+        """보이는 구간의 y 최소/최대 (OHLC 우선, 없으면 라인)"""
+        i0, i1 = np.searchsorted(self.x, [x0, x1])
+        i1 = max(i1, i0 + 1)
+        ohlc = self._ohlc_levels[0]
+        if ohlc is not None:
+            lo, hi = ohlc[2][i0:i1], ohlc[1][i0:i1]
+        else:
+            cols = [v[0][i0:i1] for v in self._line_levels[0].values()]
+            if not cols:
+                return None
+            lo = hi = np.concatenate(cols)
+        if len(lo) == 0 or np.all(np.isnan(lo)):
+            return None
+        return float(np.nanmin(lo)), float(np.nanmax(hi))
+
+
+class LODView:
+    """LODSeries.view() 결과"""
+    
+    __slots__ = ("level", "factor", "width", "x", "centers", "ohlc", "lines")
+    
+    def __init__(self, level, factor, width, x, centers, ohlc, lines):
+        self.level = level
+        self.factor = factor
+        self.width = width
+        self.x = x              # 버킷 시작 시각
+        self.centers = centers  # 버킷 중앙 시각 (캔들 위치)
+        self.ohlc = ohlc
+        self.lines = lines
+
+
+def candle_geometry(x: np.ndarray, o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray, width: float):
+    """
+    캔들 몸통 사각형 / 꼬리 선분 좌표 (PolyCollection / LineCollection용)
+    
+    Returns:
+        (up_bodies, up_wicks, down_bodies, down_wicks)
+        bodies: (k, 4, 2) 꼭짓점 배열, wicks: (k, 2, 2) 선분 배열
+    """
+    up = c >= o
+    half = width * 0.4
+    
+    def _bodies(mask):
+        xs, bottom, top = x[mask], np.minimum(o, c)[mask], np.maximum(o, c)[mask]
+        verts = np.empty((len(xs), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = xs - half
+        verts[:, 2, 0] = verts[:, 3, 0] = xs + half
+        verts[:, 0, 1] = verts[:, 3, 1] = bottom
+        verts[:, 1, 1] = verts[:, 2, 1] = top
+        return verts
+    
+    def _wicks(mask):
+        xs = x[mask]
+        segs = np.empty((len(xs), 2, 2))
+        segs[:, 0, 0] = segs[:, 1, 0] = xs
+        segs[:, 0, 1] = l[mask]
+        segs[:, 1, 1] = h[mask]
+        return segs
+    
+    return _bodies(up), _wicks(up), _bodies(~up), _wicks(~up)
@@ -4,10 +4,11 @@
 - matplotlib 기반 캔들스틱/라인 차트
 - EMA 라인 표시
 - 진입/청산 마커 표시
+- 줌 레벨별로 미리 집계한 데이터 중 보이는 구간/픽셀 폭에 맞는 것만 그림 (chart_lod)
+- 아티스트를 한 번 만들고 데이터만 교체 (ax.clear() 없음)
 """
 
 from typing import List, Dict, Optional
-from datetime import datetime
 
 import pandas as pd
 import numpy as np
@@ -24,6 +25,31 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.patches import Rectangle
+
+from .chart_lod import LODSeries, candle_geometry
+
+
+# EMA 표시 설정: 체크박스 키 → (데이터 컬럼, 색상, 범례)
+EMA_CONFIG = {
+    'ema20': ('ema_e20', '#FF6B6B', 'EMA 20'),
+    'ema50': ('ema_e50', '#4ECDC4', 'EMA 50'),
+    'ema100': ('ema_lx_slow', '#45B7D1', 'EMA 100'),
+    'ema150': ('ema_trend_fast', '#96CEB4', 'EMA 150'),
+    'ema200': ('ema_trend_slow', '#FFEAA7', 'EMA 200'),
+}
+
+UP_COLOR = '#26a69a'
+DOWN_COLOR = '#ef5350'
+
+
+def _to_num(t) -> float:
+    """시간 값 → matplotlib date num (tz 있는 값은 UTC 기준)"""
+    ts = pd.Timestamp(t)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return float(mdates.date2num(ts.to_datetime64()))
 
 
 class BacktestChartWidget(QWidget):
@@ -45,7 +71,20 @@ class BacktestChartWidget(QWidget):
         }
         self._pending_redraw = False
         
+        # LOD 데이터 / 지속 아티스트
+        self.lod: Optional[LODSeries] = None
+        self._artists_ready = False
+        self._in_update = False
+        self._full_xlim = None
+        self._full_ylim = None
+        
         self._setup_ui()
+        
+        # 줌/팬 후 보이는 구간만 다시 계산 (연속 이벤트는 한 번으로 묶음)
+        self._view_timer = QTimer(self)
+        self._view_timer.setSingleShot(True)
+        self._view_timer.setInterval(30)
+        self._view_timer.timeout.connect(self._update_view)
     
     def _setup_ui(self):
         """UI 구성"""
@@ -152,31 +191,128 @@ class BacktestChartWidget(QWidget):
             else:
                 self.df['datetime'] = pd.date_range(start='2026-01-01', periods=len(self.df), freq='30min')
         
+        self._build_lod()
+        
         # 위젯이 표시된 상태면 바로 그리기, 아니면 대기
         if self.isVisible() and self.canvas.width() > 0:
             self._redraw()
         else:
             self._pending_redraw = True
     
+    def _build_lod(self):
+        """줌 레벨 피라미드 생성 (데이터가 바뀔 때 한 번)"""
+        self.lod = None
+        df = self.df
+        if df is None or len(df) < 2 or 'close' not in df.columns:
+            return
+        
+        dt = pd.to_datetime(df['datetime'])
+        if dt.dt.tz is not None:
+            dt = dt.dt.tz_convert('UTC').dt.tz_localize(None)
+        x = mdates.date2num(dt.to_numpy(dtype='datetime64[ns]'))
+        
+        ohlc = None
+        if all(col in df.columns for col in ('open', 'high', 'low', 'close')):
+            ohlc = tuple(df[col].to_numpy(dtype=np.float64) for col in ('open', 'high', 'low', 'close'))
+        
+        lines = {'close': df['close'].to_numpy(dtype=np.float64)}
+        for key, (col, _, _) in EMA_CONFIG.items():
+            if col in df.columns:
+                lines[key] = df[col].to_numpy(dtype=np.float64)
+        
+        self.lod = LODSeries(x, ohlc=ohlc, lines=lines)
+        
+        self._full_xlim = (float(x[0]), float(x[-1]))
+        y = self.lod.y_range(x[0], x[-1])
+        if y is not None:
+            margin = (y[1] - y[0]) * 0.05
+            self._full_ylim = (y[0] - margin, y[1] + margin)
+    
     def set_markers(self, markers: List[Dict]):
         """진입/청산 마커 설정"""
         self.markers = markers
-        if self.isVisible() and self.canvas.width() > 0:
+        if self._artists_ready:
+            self._update_markers()
+            self.canvas.draw_idle()
+        elif self.isVisible() and self.canvas.width() > 0:
             self._redraw()
     
     def _on_chart_type_changed(self, index):
-        self._redraw()
+        if not self._artists_ready:
+            self._redraw()
+            return
+        self._update_legend()
+        self._update_view()
     
     def _on_ema_toggle(self, key: str, state: int):
         self.ema_visible[key] = (state == Qt.Checked)
-        self._redraw()
+        if not self._artists_ready:
+            self._redraw()
+            return
+        self._update_view()
+        self._update_legend()
+        self.canvas.draw_idle()
     
     def _reset_view(self):
         self.toolbar.home()
-        self._redraw()
+        self._clear_highlight()
+        if self._full_xlim and self._full_ylim:
+            self.ax.set_xlim(*self._full_xlim)
+            self.ax.set_ylim(*self._full_ylim)
+        self._update_view()
+    
+    def _on_xlim_changed(self, ax):
+        if not self._in_update:
+            self._view_timer.start()
+    
+    # ==================== 아티스트 ====================
+    
+    def _create_artists(self):
+        """지속 아티스트 생성 (처음 한 번만)"""
+        ax = self.ax
+        
+        self._price_line, = ax.plot([], [], color='#00d4aa', linewidth=1.2, label='Close')
+        
+        self._candle_artists = {}
+        for name, color in (('up', UP_COLOR), ('down', DOWN_COLOR)):
+            wicks = LineCollection([], colors=color, linewidths=0.8)
+            bodies = PolyCollection([], facecolors=color, edgecolors=color, linewidths=0.5)
+            ax.add_collection(wicks)
+            ax.add_collection(bodies)
+            self._candle_artists[name] = (bodies, wicks)
+        
+        self._ema_lines = {}
+        for key, (_, color, label) in EMA_CONFIG.items():
+            line, = ax.plot([], [], color=color, linewidth=1, label=label, alpha=0.7)
+            self._ema_lines[key] = line
+        
+        # 마커 (모양별 scatter 하나씩)
+        self._marker_artists = {
+            style: ax.scatter([], [], marker=style, s=size, edgecolors='white', linewidths=0.5, zorder=10)
+            for style, size in (('^', 100), ('v', 100), ('o', 80))
+        }
+        
+        # 거래 하이라이트
+        # x는 데이터 좌표, y는 축 전체 높이 (axvspan과 같은 좌표계)
+        self._highlight_span = Rectangle((0, 0), 1, 1, transform=ax.get_xaxis_transform(),
+                                         alpha=0.3, color='#00ff8833', visible=False)
+        ax.add_patch(self._highlight_span)
+        self._highlight_entry = ax.axhline(y=0, color='#00ff88', linestyle='--', linewidth=1, alpha=0.5, visible=False)
+        self._highlight_exit = ax.axhline(y=0, color='#ffaa00', linestyle='--', linewidth=1, alpha=0.5, visible=False)
+        
+        # X축 포맷
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        
+        # X축 레이블 회전 (줌할 때 새로 생기는 레이블에도 적용)
+        ax.tick_params(axis='x', labelrotation=45)
+        
+        ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        self._artists_ready = True
     
     def _redraw(self):
-        """차트 다시 그리기"""
+        """차트 다시 그리기 (데이터 교체 시 전체 범위로)"""
         if self.df is None or self.df.empty:
             return
         
@@ -191,105 +327,93 @@ class BacktestChartWidget(QWidget):
             self._pending_redraw = True
             return
         
-        self.ax.clear()
-        self._style_axis()
+        if self.lod is None:
+            self._build_lod()
+            if self.lod is None:
+                return
         
-        df = self.df
+        if not self._artists_ready:
+            self._create_artists()
         
-        # 차트 그리기
-        if self.chart_type_combo.currentIndex() == 0:
-            self._draw_line_chart(df)
-        else:
-            self._draw_candlestick(df)
+        self._clear_highlight()
         
-        self._draw_ema_lines(df)
-        self._draw_markers()
+        self._in_update = True
+        try:
+            self.ax.set_xlim(*self._full_xlim)
+            if self._full_ylim:
+                self.ax.set_ylim(*self._full_ylim)
+        finally:
+            self._in_update = False
         
-        # X축 포맷
-        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        self.ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        # 툴바 홈 위치를 새 데이터 범위로
+        self.toolbar.update()
         
-        # X축 레이블 회전
-        for label in self.ax.get_xticklabels():
-            label.set_rotation(45)
-            label.set_ha('right')
-        
-        # 범례
-        handles, labels = self.ax.get_legend_handles_labels()
-        if handles:
-            self.ax.legend(loc='upper left', facecolor='#2b2b2b', 
-                          edgecolor='#3a3a3a', labelcolor='white', fontsize=8)
+        self._update_markers()
+        self._update_legend()
+        self._update_view()
         
         # 여백 재조정 (tight_layout 대신)
         self.figure.subplots_adjust(left=0.08, right=0.95, top=0.95, bottom=0.18)
-        
-        self.canvas.draw_idle()
     
-    def _draw_line_chart(self, df: pd.DataFrame):
-        """라인 차트"""
-        self.ax.plot(df['datetime'], df['close'], color='#00d4aa', 
-                    linewidth=1.2, label='Close')
-        
-        # 축 범위
-        y_min, y_max = df['close'].min(), df['close'].max()
-        margin = (y_max - y_min) * 0.05
-        self.ax.set_ylim(y_min - margin, y_max + margin)
-    
-    def _draw_candlestick(self, df: pd.DataFrame):
-        """캔들스틱 차트"""
-        required = ['open', 'high', 'low', 'close']
-        if not all(col in df.columns for col in required):
-            self._draw_line_chart(df)
+    def _update_view(self):
+        """보이는 x 구간에 맞는 레벨의 데이터로 아티스트 갱신"""
+        if self.lod is None or not self._artists_ready:
             return
         
-        # 캔들 너비 계산
-        if len(df) > 1:
-            time_diff = (df['datetime'].iloc[1] - df['datetime'].iloc[0]).total_seconds()
-            width = time_diff / 86400 * 0.8  # 80% 너비
+        x0, x1 = self.ax.get_xlim()
+        max_buckets = max(50, int(self.ax.bbox.width))
+        view = self.lod.view(x0, x1, max_buckets)
+        
+        candle_mode = self.chart_type_combo.currentIndex() == 1 and view.ohlc is not None
+        
+        # 가격 (라인 / 캔들스틱)
+        if candle_mode:
+            self._price_line.set_visible(False)
+            up_bodies, up_wicks, down_bodies, down_wicks = candle_geometry(view.centers, *view.ohlc, view.width)
+            for name, bodies_v, wicks_v in (('up', up_bodies, up_wicks), ('down', down_bodies, down_wicks)):
+                bodies, wicks = self._candle_artists[name]
+                bodies.set_verts(bodies_v)
+                wicks.set_segments(wicks_v)
+                bodies.set_visible(True)
+                wicks.set_visible(True)
         else:
-            width = 0.02
-        
-        up = df[df['close'] >= df['open']]
-        down = df[df['close'] < df['open']]
-        
-        # 상승 캔들 (녹색)
-        if not up.empty:
-            self.ax.bar(up['datetime'], up['close'] - up['open'], width,
-                       bottom=up['open'], color='#26a69a', edgecolor='#26a69a')
-            self.ax.vlines(up['datetime'], up['low'], up['high'], color='#26a69a', linewidth=0.8)
-        
-        # 하락 캔들 (빨강)
-        if not down.empty:
-            self.ax.bar(down['datetime'], down['open'] - down['close'], width,
-                       bottom=down['close'], color='#ef5350', edgecolor='#ef5350')
-            self.ax.vlines(down['datetime'], down['low'], down['high'], color='#ef5350', linewidth=0.8)
-        
-        # 축 범위
-        y_min, y_max = df['low'].min(), df['high'].max()
-        margin = (y_max - y_min) * 0.05
-        self.ax.set_ylim(y_min - margin, y_max + margin)
-    
-    def _draw_ema_lines(self, df: pd.DataFrame):
-        """EMA 라인"""
-        ema_config = {
-            'ema20': ('ema_e20', '#FF6B6B', 'EMA 20'),
-            'ema50': ('ema_e50', '#4ECDC4', 'EMA 50'),
-            'ema100': ('ema_lx_slow', '#45B7D1', 'EMA 100'),
-            'ema150': ('ema_trend_fast', '#96CEB4', 'EMA 150'),
-            'ema200': ('ema_trend_slow', '#FFEAA7', 'EMA 200'),
-        }
+            for bodies, wicks in self._candle_artists.values():
+                bodies.set_visible(False)
+                wicks.set_visible(False)
+            self._price_line.set_data(*view.lines['close'])
+            self._price_line.set_visible(True)
+        
+        # EMA
+        for key, line in self._ema_lines.items():
+            if key in view.lines and self.ema_visible.get(key, True):
+                line.set_data(*view.lines[key])
+                line.set_visible(True)
+            else:
+                line.set_visible(False)
         
-        for key, (col, color, label) in ema_config.items():
-            if self.ema_visible.get(key, True) and col in df.columns:
-                self.ax.plot(df['datetime'], df[col], color=color, 
-                            linewidth=1, label=label, alpha=0.7)
+        self.canvas.draw_idle()
+    
+    def _update_legend(self):
+        handles = [self._price_line] if self.chart_type_combo.currentIndex() == 0 else []
+        handles += [
+            line for key, line in self._ema_lines.items()
+            if self.ema_visible.get(key, True) and self.lod is not None and self.lod.has_line(key)
+        ]
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if handles:
+            self.ax.legend(handles=handles, loc='upper left', facecolor='#2b2b2b',
+                          edgecolor='#3a3a3a', labelcolor='white', fontsize=8)
     
-    def _draw_markers(self):
-        """진입/청산 마커"""
-        if not self.markers:
+    def _update_markers(self):
+        """진입/청산 마커 (모양별로 한 번에 설정)"""
+        if not self._artists_ready:
             return
         
-        for marker in self.markers:
+        groups = {style: ([], [], []) for style in self._marker_artists}
+        
+        for marker in self.markers or []:
             dt = marker.get('time')
             price = marker.get('price')
             event_type = marker.get('type')
@@ -299,57 +423,71 @@ class BacktestChartWidget(QWidget):
             if dt is None or price is None:
                 continue
             
-            # datetime 변환 (문자열인 경우 처리)
-            if isinstance(dt, str):
-                dt = pd.to_datetime(dt)
-            elif not isinstance(dt, (datetime, pd.Timestamp)):
-                dt = pd.to_datetime(dt)
-            
             if event_type == "ENTRY":
                 if side == "LONG":
                     m_style, color = '^', '#00ff88' if mode == "REAL" else '#00ff8888'
                 else:
                     m_style, color = 'v', '#ff6b6b' if mode == "REAL" else '#ff6b6b88'
-                size = 100
             elif event_type == "EXIT":
                 m_style, color = 'o', '#ffaa00' if mode == "REAL" else '#ffaa0088'
-                size = 80
             else:
                 continue
             
-            self.ax.scatter(dt, price, marker=m_style, s=size, 
-                           c=color, edgecolors='white', linewidths=0.5, zorder=10)
+            xs, ys, colors = groups[m_style]
+            xs.append(_to_num(dt))
+            ys.append(price)
+            colors.append(color)
+        
+        for style, artist in self._marker_artists.items():
+            xs, ys, colors = groups[style]
+            artist.set_offsets(np.column_stack([xs, ys]) if xs else np.empty((0, 2)))
+            artist.set_facecolors(colors if colors else 'none')
+    
+    def _clear_highlight(self):
+        if not self._artists_ready:
+            return
+        for artist in (self._highlight_span, self._highlight_entry, self._highlight_exit):
+            artist.set_visible(False)
     
     def highlight_trade(self, entry_time, exit_time, entry_price, exit_price, side):
         """특정 거래 구간 하이라이트"""
         if self.df is None:
             return
         
-        self._redraw()
-        
-        color = '#00ff8833' if side == "LONG" else '#ff6b6b33'
-        self.ax.axvspan(entry_time, exit_time, alpha=0.3, color=color)
-        self.ax.axhline(y=entry_price, color='#00ff88', linestyle='--', linewidth=1, alpha=0.5)
-        self.ax.axhline(y=exit_price, color='#ffaa00', linestyle='--', linewidth=1, alpha=0.5)
+        if not self._artists_ready:
+            self._redraw()
+            if not self._artists_ready:
+                return
+        
+        x0, x1 = _to_num(entry_time), _to_num(exit_time)
+        self._highlight_span.set_x(min(x0, x1))
+        self._highlight_span.set_width(abs(x1 - x0))
+        self._highlight_span.set_color('#00ff8833' if side == "LONG" else '#ff6b6b33')
+        self._highlight_entry.set_ydata([entry_price, entry_price])
+        self._highlight_exit.set_ydata([exit_price, exit_price])
+        for artist in (self._highlight_span, self._highlight_entry, self._highlight_exit):
+            artist.set_visible(True)
         
         self.canvas.draw_idle()
     
     def zoom_to_range(self, start_time, end_time, padding_ratio=0.1):
         """특정 기간으로 줌"""
-        if self.df is None:
+        if self.df is None or self.lod is None:
             return
         
-        duration = (end_time - start_time).total_seconds()
-        padding = pd.Timedelta(seconds=duration * padding_ratio)
+        start, end = _to_num(start_time), _to_num(end_time)
+        padding = (end - start) * padding_ratio
+        view_start, view_end = start - padding, end + padding
         
-        view_start = start_time - padding
-        view_end = end_time + padding
-        
-        mask = (self.df['datetime'] >= view_start) & (self.df['datetime'] <= view_end)
-        subset = self.df[mask]
+        y = self.lod.y_range(view_start, view_end)
+        if y is None:
+            return
         
-        if not subset.empty:
+        # set_xlim이 xlim_changed를 발생시키므로 여기서 한 번만 갱신
+        self._in_update = True
+        try:
             self.ax.set_xlim(view_start, view_end)
-            if 'low' in subset.columns and 'high' in subset.columns:
-                self.ax.set_ylim(subset['low'].min() * 0.998, subset['high'].max() * 1.002)
-            self.canvas.draw_idle()
+            self.ax.set_ylim(y[0] * 0.998, y[1] * 1.002)
+        finally:
+            self._in_update = False
+        self._update_view()
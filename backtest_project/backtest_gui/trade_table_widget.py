@@ -1,16 +1,23 @@
 # gui/trade_table_widget.py
 """
 거래 내역 테이블 위젯
-- 거래 목록 표시
+- 거래 목록 표시 (QAbstractTableModel - 보이는 셀만 포맷)
+- 모드/방향/청산사유 필터, 컬럼 정렬
 - 행 선택 시 차트 연동
 """
 
 from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView, QComboBox,
     QHeaderView, QAbstractItemView, QLabel, QFrame, QHBoxLayout
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt5.QtGui import QColor, QBrush
 
 import sys
@@ -20,10 +27,265 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backtest.backtest_engine import Trade
 
 
+COLUMNS = [
+    "#", "방향", "모드", "진입시간", "청산시간",
+    "진입가", "청산가", "수익률(%)", "순손익", "청산사유"
+]
+
+REASON_MAP = {
+    'ema_dead_cross': 'EMA 데드크로스',
+    'ema_golden_cross': 'EMA 골든크로스',
+    'trailing_stop': '트레일링 스탑',
+    'reverse_to_short': '숏 전환',
+    'reverse_to_long': '롱 전환',
+}
+
+# 셀 색상 (모든 셀이 공유)
+_GREEN = QBrush(QColor("#00ff88"))
+_RED = QBrush(QColor("#ff6b6b"))
+_TEAL = QBrush(QColor("#00d4aa"))
+_GRAY = QBrush(QColor("#888888"))
+
+_CENTER = int(Qt.AlignCenter)
+_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+
+def format_time(t) -> str:
+    """시간 포맷"""
+    try:
+        if hasattr(t, 'strftime'):
+            return t.strftime("%m-%d %H:%M")
+        return str(t)
+    except:
+        return str(t)
+
+
+def format_reason(reason: str) -> str:
+    """청산 사유 포맷"""
+    return REASON_MAP.get(reason, reason)
+
+
+class TradeTableModel(QAbstractTableModel):
+    """
+    거래 내역 모델
+    
+    거래 목록을 컬럼별 NumPy 배열로 보관하고,
+    셀 문자열/색상은 뷰가 요청하는 (화면에 보이는) 셀만 data()에서 생성.
+    정렬은 행 순서(순열)만 argsort로 바꾸고 데이터는 그대로 둠
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.trades: List[Trade] = []
+        self._set_columns([])
+    
+    def _set_columns(self, trades: List[Trade]):
+        n = len(trades)
+        self.side = np.array([t.side for t in trades], dtype=object)
+        self.mode = np.array([t.mode for t in trades], dtype=object)
+        self.reason = np.array([t.reason_exit for t in trades], dtype=object)
+        self.entry_time = [t.entry_time for t in trades]
+        self.exit_time = [t.exit_time for t in trades]
+        self.entry_price = np.fromiter((t.entry_price for t in trades), dtype=np.float64, count=n)
+        self.exit_price = np.fromiter((t.exit_price for t in trades), dtype=np.float64, count=n)
+        self.net_pnl = np.fromiter((t.net_pnl for t in trades), dtype=np.float64, count=n)
+        
+        entry_capital = np.fromiter((t.entry_capital for t in trades), dtype=np.float64, count=n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.pnl_pct = np.where(entry_capital > 0, self.net_pnl / entry_capital * 100, 0.0)
+        
+        # 행 → 거래 인덱스 순열과 그 역순열
+        self._order = np.arange(n)
+        self._rank = np.arange(n)
+    
+    @staticmethod
+    def _time_keys(times) -> np.ndarray:
+        """시간 정렬 키 (epoch 초, 변환 불가 값은 NaN)"""
+        if not times:
+            return np.empty(0)
+        dt = pd.to_datetime(pd.Series(times), errors='coerce', utc=True)
+        keys = dt.astype('int64').to_numpy(dtype=np.float64) / 1e9
+        keys[dt.isna().to_numpy()] = np.nan
+        return keys
+    
+    def _sort_keys(self, column: int) -> np.ndarray:
+        if column == 1:
+            return self.side.astype(str)
+        if column == 2:
+            return self.mode.astype(str)
+        if column == 3:
+            return self._time_keys(self.entry_time)
+        if column == 4:
+            return self._time_keys(self.exit_time)
+        if column == 5:
+            return self.entry_price
+        if column == 6:
+            return self.exit_price
+        if column == 7:
+            return self.pnl_pct
+        if column == 8:
+            return self.net_pnl
+        if column == 9:
+            return np.array([format_reason(r) for r in self.reason], dtype=str)
+        return np.arange(len(self.trades))
+    
+    def set_trades(self, trades: List[Trade]):
+        self.beginResetModel()
+        self.trades = list(trades)
+        self._set_columns(self.trades)
+        self.endResetModel()
+    
+    def trade_index(self, row: int) -> int:
+        """모델 행 → 원본 거래 인덱스"""
+        return int(self._order[row])
+    
+    def row_of(self, trade_idx: int) -> int:
+        """원본 거래 인덱스 → 모델 행"""
+        return int(self._rank[trade_idx])
+    
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """컬럼 정렬 (행 순열만 교체, 동일 값은 거래 순서 유지)"""
+        if not self.trades:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_trades = [self.trade_index(i.row()) for i in old_indexes]
+        
+        new_order = np.argsort(self._sort_keys(column), kind='stable')
+        if order == Qt.DescendingOrder:
+            new_order = new_order[::-1].copy()
+        self._order = new_order
+        self._rank = np.empty_like(new_order)
+        self._rank[new_order] = np.arange(len(new_order))
+        
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(self.row_of(t), i.column()) for t, i in zip(old_trades, old_indexes)],
+        )
+        self.layoutChanged.emit()
+    
+    def filter_mask(self, mode: Optional[str], side: Optional[str], reason: Optional[str]) -> np.ndarray:
+        """거래 인덱스 기준 필터 통과 여부"""
+        mask = np.ones(len(self.trades), dtype=bool)
+        if mode:
+            mask &= self.mode == mode
+        if side:
+            mask &= self.side == side
+        if reason:
+            mask &= self.reason == reason
+        return mask
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.trades)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i, col = self._order[index.row()], index.column()
+        
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(i + 1)
+            if col == 1:
+                return self.side[i]
+            if col == 2:
+                return self.mode[i]
+            if col == 3:
+                return format_time(self.entry_time[i])
+            if col == 4:
+                return format_time(self.exit_time[i])
+            if col == 5:
+                return f"${self.entry_price[i]:,.2f}"
+            if col == 6:
+                return f"${self.exit_price[i]:,.2f}"
+            if col == 7:
+                return f"{self.pnl_pct[i]:+.2f}%"
+            if col == 8:
+                return f"${self.net_pnl[i]:+,.2f}"
+            if col == 9:
+                return format_reason(self.reason[i])
+        
+        elif role == Qt.ForegroundRole:
+            if col == 1:
+                return _GREEN if self.side[i] == "LONG" else _RED
+            if col == 2:
+                return _TEAL if self.mode[i] == "REAL" else _GRAY
+            if col in (7, 8):
+                value = self.pnl_pct[i] if col == 7 else self.net_pnl[i]
+                if value > 0:
+                    return _GREEN
+                if value < 0:
+                    return _RED
+        
+        elif role == Qt.TextAlignmentRole:
+            if col in (0, 1, 2):
+                return _CENTER
+            if col in (5, 6, 7, 8):
+                return _RIGHT
+        
+        return None
+
+
+class TradeFilterProxyModel(QSortFilterProxyModel):
+    """
+    모드/방향/청산사유 필터 프록시
+    
+    필터는 NumPy 마스크로 한 번에 계산하고, 정렬은 원본 모델의 순열 정렬에 위임
+    (행마다 Python lessThan을 호출하지 않음)
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mode_filter: Optional[str] = None
+        self.side_filter: Optional[str] = None
+        self.reason_filter: Optional[str] = None
+        self._mask: Optional[np.ndarray] = None
+    
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._reset_mask)
+    
+    def _reset_mask(self):
+        self._mask = None
+    
+    def set_filters(self, mode: Optional[str] = None, side: Optional[str] = None, reason: Optional[str] = None):
+        """필터 설정 (None이면 전체)"""
+        self.mode_filter = mode
+        self.side_filter = side
+        self.reason_filter = reason
+        self._mask = None
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self._mask is None:
+            self._mask = model.filter_mask(self.mode_filter, self.side_filter, self.reason_filter)
+        return bool(self._mask[model.trade_index(source_row)])
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+    
+    def trade_index(self, proxy_index) -> int:
+        """프록시 인덱스 → 원본 거래 인덱스"""
+        return self.sourceModel().trade_index(self.mapToSource(proxy_index).row())
+    
+    def index_of_trade(self, trade_idx: int):
+        """원본 거래 인덱스 → 프록시 인덱스 (필터로 숨겨졌으면 invalid)"""
+        model = self.sourceModel()
+        return self.mapFromSource(model.index(model.row_of(trade_idx), 0))
+
+
 class TradeTableWidget(QWidget):
     """거래 내역 테이블 위젯"""
     
-    # 거래 선택 시그널 (trade_index)
+    # 거래 선택 시그널 (trade_index - 원본 거래 목록 기준)
     trade_selected = pyqtSignal(int)
     
     def __init__(self, parent=None):
@@ -39,7 +301,7 @@ class TradeTableWidget(QWidget):
         
         # 헤더
         header_frame = QFrame()
-        header_frame.setMaximumHeight(30)
+        header_frame.setMaximumHeight(36)
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(5, 5, 5, 5)
         
@@ -48,28 +310,47 @@ class TradeTableWidget(QWidget):
         header_layout.addWidget(self.title_label)
         header_layout.addStretch()
         
+        # 필터
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("모드: 전체", None)
+        self.mode_combo.addItem("REAL", "REAL")
+        self.mode_combo.addItem("VIRTUAL", "VIRTUAL")
+        
+        self.side_combo = QComboBox()
+        self.side_combo.addItem("방향: 전체", None)
+        self.side_combo.addItem("LONG", "LONG")
+        self.side_combo.addItem("SHORT", "SHORT")
+        
+        self.reason_combo = QComboBox()
+        self.reason_combo.addItem("사유: 전체", None)
+        
+        for combo in (self.mode_combo, self.side_combo, self.reason_combo):
+            combo.currentIndexChanged.connect(self._on_filter_changed)
+            header_layout.addWidget(combo)
+        
         layout.addWidget(header_frame)
         
+        # 모델 / 프록시
+        self.model = TradeTableModel(self)
+        self.proxy = TradeFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        
         # 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "#", "방향", "모드", "진입시간", "청산시간", 
-            "진입가", "청산가", "수익률(%)", "순손익", "청산사유"
-        ])
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         
         # 스타일
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 color: white;
                 gridline-color: #3a3a3a;
                 border: none;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
             }
             QHeaderView::section {
@@ -86,8 +367,14 @@ class TradeTableWidget(QWidget):
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(0, Qt.AscendingOrder)
         self.table.verticalHeader().setVisible(False)
         
+        # 행 높이 고정 (행마다 크기 계산하지 않음)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        
         # 컬럼 너비
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed)  # #
@@ -110,123 +397,78 @@ class TradeTableWidget(QWidget):
         self.table.setColumnWidth(8, 80)
         
         # 시그널 연결
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
         
         layout.addWidget(self.table)
     
     def set_trades(self, trades: List[Trade]):
         """거래 목록 설정"""
         self.trades = trades
-        self._populate_table()
-        self.title_label.setText(f"📋 거래 내역 ({len(trades)}건)")
-    
-    def _populate_table(self):
-        """테이블 채우기"""
-        self.table.setRowCount(len(self.trades))
-        
-        for row, trade in enumerate(self.trades):
-            # # (번호)
-            item = QTableWidgetItem(str(row + 1))
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 0, item)
-            
-            # 방향
-            side_item = QTableWidgetItem(trade.side)
-            side_item.setTextAlignment(Qt.AlignCenter)
-            if trade.side == "LONG":
-                side_item.setForeground(QBrush(QColor("#00ff88")))
-            else:
-                side_item.setForeground(QBrush(QColor("#ff6b6b")))
-            self.table.setItem(row, 1, side_item)
-            
-            # 모드
-            mode_item = QTableWidgetItem(trade.mode)
-            mode_item.setTextAlignment(Qt.AlignCenter)
-            if trade.mode == "REAL":
-                mode_item.setForeground(QBrush(QColor("#00d4aa")))
-            else:
-                mode_item.setForeground(QBrush(QColor("#888888")))
-            self.table.setItem(row, 2, mode_item)
-            
-            # 진입시간
-            entry_time_str = self._format_time(trade.entry_time)
-            self.table.setItem(row, 3, QTableWidgetItem(entry_time_str))
-            
-            # 청산시간
-            exit_time_str = self._format_time(trade.exit_time)
-            self.table.setItem(row, 4, QTableWidgetItem(exit_time_str))
-            
-            # 진입가
-            entry_item = QTableWidgetItem(f"${trade.entry_price:,.2f}")
-            entry_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, 5, entry_item)
-            
-            # 청산가
-            exit_item = QTableWidgetItem(f"${trade.exit_price:,.2f}")
-            exit_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, 6, exit_item)
-            
-            # 수익률
-            pnl_pct = trade.pnl_percentage
-            pnl_item = QTableWidgetItem(f"{pnl_pct:+.2f}%")
-            pnl_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if pnl_pct > 0:
-                pnl_item.setForeground(QBrush(QColor("#00ff88")))
-            elif pnl_pct < 0:
-                pnl_item.setForeground(QBrush(QColor("#ff6b6b")))
-            self.table.setItem(row, 7, pnl_item)
-            
-            # 순손익
-            net_pnl_item = QTableWidgetItem(f"${trade.net_pnl:+,.2f}")
-            net_pnl_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if trade.net_pnl > 0:
-                net_pnl_item.setForeground(QBrush(QColor("#00ff88")))
-            elif trade.net_pnl < 0:
-                net_pnl_item.setForeground(QBrush(QColor("#ff6b6b")))
-            self.table.setItem(row, 8, net_pnl_item)
-            
-            # 청산사유
-            reason_item = QTableWidgetItem(self._format_reason(trade.reason_exit))
-            self.table.setItem(row, 9, reason_item)
+        self.model.set_trades(trades)
+        self._update_reason_filter()
+        self._update_title()
+    
+    def _update_reason_filter(self):
+        """데이터에 있는 청산 사유로 필터 목록 갱신"""
+        current = self.reason_combo.currentData()
+        reasons = sorted(set(self.model.reason.tolist()))
+        
+        self.reason_combo.blockSignals(True)
+        self.reason_combo.clear()
+        self.reason_combo.addItem("사유: 전체", None)
+        for reason in reasons:
+            self.reason_combo.addItem(format_reason(reason), reason)
+        idx = self.reason_combo.findData(current) if current else 0
+        self.reason_combo.setCurrentIndex(max(0, idx))
+        self.reason_combo.blockSignals(False)
+        
+        self._on_filter_changed()
+    
+    def _on_filter_changed(self, *_):
+        self.proxy.set_filters(
+            mode=self.mode_combo.currentData(),
+            side=self.side_combo.currentData(),
+            reason=self.reason_combo.currentData(),
+        )
+        self._update_title()
+    
+    def _update_title(self):
+        total = self.model.rowCount()
+        shown = self.proxy.rowCount()
+        if shown == total:
+            self.title_label.setText(f"📋 거래 내역 ({total}건)")
+        else:
+            self.title_label.setText(f"📋 거래 내역 ({shown}/{total}건)")
     
     def _format_time(self, t) -> str:
         """시간 포맷"""
-        try:
-            if hasattr(t, 'strftime'):
-                return t.strftime("%m-%d %H:%M")
-            return str(t)
-        except:
-            return str(t)
+        return format_time(t)
     
     def _format_reason(self, reason: str) -> str:
         """청산 사유 포맷"""
-        reason_map = {
-            'ema_dead_cross': 'EMA 데드크로스',
-            'ema_golden_cross': 'EMA 골든크로스',
-            'trailing_stop': '트레일링 스탑',
-            'reverse_to_short': '숏 전환',
-            'reverse_to_long': '롱 전환',
-        }
-        return reason_map.get(reason, reason)
-    
-    def _on_selection_changed(self):
-        """선택 변경 처리"""
-        selected = self.table.selectedItems()
-        if selected:
-            row = selected[0].row()
-            self.trade_selected.emit(row)
+        return format_reason(reason)
+    
+    def _on_current_row_changed(self, current, previous):
+        """선택 변경 처리 (정렬/필터와 무관하게 원본 거래 인덱스 전달)"""
+        if not current.isValid():
+            return
+        self.trade_selected.emit(self.proxy.trade_index(current))
     
     def highlight_row(self, row_idx: int):
-        """특정 행 하이라이트"""
-        if 0 <= row_idx < self.table.rowCount():
-            self.table.selectRow(row_idx)
-            self.table.scrollToItem(self.table.item(row_idx, 0))
+        """특정 거래(원본 인덱스) 행 하이라이트"""
+        if not 0 <= row_idx < self.model.rowCount():
+            return
+        index = self.proxy.index_of_trade(row_idx)
+        if not index.isValid():
+            return  # 필터로 숨겨진 거래
+        self.table.selectRow(index.row())
+        self.table.scrollTo(index)
     
     def get_selected_trade(self) -> Optional[Trade]:
         """선택된 거래 반환"""
-        selected = self.table.selectedItems()
-        if selected:
-            row = selected[0].row()
+        rows = self.table.selectionModel().selectedRows()
+        if rows:
+            row = self.proxy.trade_index(rows[0])
             if 0 <= row < len(self.trades):
                 return self.trades[row]
         return None
@@ -234,5 +476,5 @@ class TradeTableWidget(QWidget):
     def clear(self):
         """테이블 초기화"""
         self.trades = []
-        self.table.setRowCount(0)
-        self.title_label.setText("📋 거래 내역 (0건)")
+        self.model.set_trades([])
+        self._update_reason_filter()
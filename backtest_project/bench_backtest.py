@@ -0,0 +1,115 @@
+# bench_backtest.py
+"""
+백테스트 엔진 벤치마크
+- cache/ 의 CSV로 기존 iloc 루프와 배열 기반 fast path 비교
+- 두 경로의 거래/마커/자산곡선이 완전히 같은지 검증
+
+사용법:
+    python backtest_project/bench_backtest.py
+    python backtest_project/bench_backtest.py --cache-dir ./cache --repeat 5
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+if _current_dir not in sys.path:
+    sys.path.insert(0, _current_dir)
+
+from backtest.data_fetcher import DataFetcher
+from backtest.backtest_engine import BacktestEngine, Params
+
+
+# 비교할 파라미터 조합 (기본값 + 거래가 자주 발생하는 조합)
+BENCH_PARAMS = {
+    "long_only": Params(),
+    "long_short": Params(long_only=False),
+    "fast_ema": Params(
+        trend_fast=50, trend_slow=100, entry_fast=5, entry_slow=20,
+        long_exit_fast=5, long_exit_slow=30, short_exit_fast=10, short_exit_slow=40,
+        trailing_stop_long=0.02, long_only=False,
+    ),
+}
+
+
+def load_frames(cache_dir: Path) -> dict:
+    """캐시 CSV 로드 (개별 파일 + 전체 병합)"""
+    fetcher = DataFetcher(cache_dir=str(cache_dir))
+    frames = {}
+    for path in sorted(cache_dir.glob("*.csv")):
+        frames[path.name] = fetcher.load_from_cache(str(path))
+
+    if len(frames) > 1:
+        merged = pd.concat(frames.values(), ignore_index=True)
+        merged = merged.drop_duplicates(subset="timestamp").sort_values("timestamp").reset_index(drop=True)
+        frames["(merged)"] = merged
+    return frames
+
+
+def time_run(params: Params, df: pd.DataFrame, use_fast_path: bool, repeat: int):
+    """최소 실행 시간과 마지막 결과 반환"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        engine = BacktestEngine(params=params)
+        t0 = time.perf_counter()
+        result = engine.run(df, use_fast_path=use_fast_path)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def same_result(a, b) -> bool:
+    return (
+        a.trades == b.trades
+        and a.markers == b.markers
+        and a.equity_curve_real == b.equity_curve_real
+        and a.equity_curve_virtual == b.equity_curve_virtual
+        and a.final_real_capital == b.final_real_capital
+        and a.final_virtual_capital == b.final_virtual_capital
+    )
+
+
+def main():
+    default_cache = Path(_current_dir).parent / "cache"
+
+    parser = argparse.ArgumentParser(description="BacktestEngine 루프 벤치마크")
+    parser.add_argument("--cache-dir", default=str(default_cache), help="CSV 캐시 디렉토리")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    frames = load_frames(Path(args.cache_dir))
+    if not frames:
+        print(f"CSV 파일이 없습니다: {args.cache_dir}")
+        return 1
+
+    print(f"{'data':<40} {'params':<12} {'bars':>6} {'trades':>6} {'iloc(ms)':>10} {'fast(ms)':>10} {'speedup':>8}  match")
+    print("-" * 104)
+
+    all_match = True
+    for name, df in frames.items():
+        for label, params in BENCH_PARAMS.items():
+            try:
+                slow_sec, slow_res = time_run(params, df, False, args.repeat)
+                fast_sec, fast_res = time_run(params, df, True, args.repeat)
+            except ValueError as e:
+                print(f"{name:<40} {label:<12} 건너뜀: {e}")
+                continue
+
+            match = same_result(slow_res, fast_res)
+            all_match = all_match and match
+            speedup = slow_sec / fast_sec if fast_sec > 0 else float("inf")
+            print(
+                f"{name:<40} {label:<12} {len(df):>6} {fast_res.total_trades:>6} "
+                f"{slow_sec * 1000:>10.1f} {fast_sec * 1000:>10.1f} {speedup:>7.1f}x  {'OK' if match else 'MISMATCH'}"
+            )
+
+    return 0 if all_match else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# tests/test_candle_store.py
+"""
+CandleStore CSV 가져오기 테스트
+
+- 가져온 CSV는 저장소 안 manifest에 기록되어 다시 가져오지 않음
+- 저장소를 지우면 manifest도 함께 지워져 다시 가져옴
+"""
+
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtest.data_fetcher import DataFetcher  # noqa: E402
+
+
+INTERVAL_MS = 30 * 60 * 1000
+START_MS = 1767225600000  # 2026-01-01 00:00 UTC
+
+
+def write_csv(cache_dir, count=48):
+    ts = [START_MS + i * INTERVAL_MS for i in range(count)]
+    df = pd.DataFrame({
+        "timestamp": ts,
+        "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1.0,
+    })
+    path = cache_dir / "BTCUSDT_30m_20260101_to_20260101.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_import_recorded_in_store(tmp_path):
+    write_csv(tmp_path)
+    fetcher = DataFetcher(cache_dir=str(tmp_path))
+
+    assert fetcher.import_csv_cache() == 1
+    assert "BTCUSDT_30m_20260101_to_20260101.csv" in fetcher.store.imported_sources("BTCUSDT", "30m")
+    assert (tmp_path / "store" / "BTCUSDT" / "30m" / "imported.json").is_file()
+
+    # 새 인스턴스도 manifest를 보고 건너뜀
+    assert DataFetcher(cache_dir=str(tmp_path)).import_csv_cache() == 0
+
+
+def test_reimport_after_store_deleted(tmp_path):
+    write_csv(tmp_path)
+    assert DataFetcher(cache_dir=str(tmp_path)).import_csv_cache() == 1
+
+    shutil.rmtree(tmp_path / "store")
+
+    fetcher = DataFetcher(cache_dir=str(tmp_path))
+    assert fetcher.import_csv_cache() == 1
+    assert fetcher.store.coverage("BTCUSDT", "30m") == [(START_MS, START_MS + 48 * INTERVAL_MS)]
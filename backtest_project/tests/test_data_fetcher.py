@@ -0,0 +1,164 @@
+# tests/test_data_fetcher.py
+"""
+DataFetcher.fetch_klines_30m 테스트 (로컬 스텁 HTTP 서버)
+
+- 동시 요청한 페이지가 시간순으로 재조립되는지
+- 429 + Retry-After 시 모든 스레드가 대기 후 재시도하는지
+- 중복/누락 캔들이 last_fetch_report에 기록되는지
+- sleep_sec가 공유 rate limiter 설정을 바꾸지 않는지
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtest.data_fetcher import DataFetcher  # noqa: E402
+
+
+INTERVAL_MS = 30 * 60 * 1000
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class StubBinance:
+    """/api/v3/klines 스텁 (누락/중복/429 주입)"""
+
+    def __init__(self):
+        self.missing = set()          # 응답에서 뺄 캔들 시각 (ms)
+        self.duplicate_pages = set()  # 직전 캔들을 한 개 더 붙여 줄 페이지 시작 시각 (ms)
+        self.throttle_once = set()    # 처음 한 번 429를 줄 페이지 시작 시각 (ms)
+        self.retry_after = 1
+        self.requests = []            # (monotonic 시각, startTime, status)
+        self._lock = threading.Lock()
+
+    def handle(self, params):
+        start = int(params["startTime"])
+        end = int(params["endTime"])
+        limit = int(params["limit"])
+
+        with self._lock:
+            throttled = start in self.throttle_once
+            self.throttle_once.discard(start)
+            self.requests.append((time.monotonic(), start, 429 if throttled else 200))
+        if throttled:
+            return 429, {"Retry-After": str(self.retry_after)}, {"code": -1003, "msg": "Too many requests"}
+
+        ts = start
+        if start in self.duplicate_pages:
+            # 이전 페이지의 마지막 캔들을 한 개 더 (limit 밖)
+            ts -= INTERVAL_MS
+            limit += 1
+        rows = []
+        while ts <= end and len(rows) < limit:
+            if ts not in self.missing:
+                price = 100.0 + ts / INTERVAL_MS % 50
+                rows.append([ts, str(price), str(price + 1), str(price - 1), str(price + 0.5), "10.0"])
+            ts += INTERVAL_MS
+        return 200, {"X-MBX-USED-WEIGHT-1M": "1"}, rows
+
+
+@pytest.fixture
+def stub():
+    state = StubBinance()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+            status, headers, body = state.handle(query)
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def make_fetcher(stub, tmp_path, concurrency=4):
+    fetcher = DataFetcher(cache_dir=str(tmp_path), concurrency=concurrency)
+    fetcher.BINANCE_SPOT_BASE_URL = stub.url
+    return fetcher
+
+
+def page_start(index, limit):
+    return int(START.timestamp() * 1000) + index * limit * INTERVAL_MS
+
+
+def test_pages_reassembled_in_order(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path)
+    end = START + timedelta(minutes=30 * 95)
+
+    rows = fetcher.fetch_klines_30m("BTCUSDT", START, end, limit=10)
+
+    timestamps = [r["timestamp"] for r in rows]
+    assert len(stub.requests) == 10
+    assert timestamps == sorted(timestamps)
+    assert len(rows) == 96
+    assert timestamps[1] - timestamps[0] == INTERVAL_MS
+    assert fetcher.last_fetch_report["pages"] == 10
+    assert fetcher.last_fetch_report["duplicates"] == 0
+    assert fetcher.last_fetch_report["gaps"] == []
+
+
+def test_retry_after_pauses_and_retries(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path)
+    throttled = page_start(2, 10)
+    stub.throttle_once.add(throttled)
+    end = START + timedelta(minutes=30 * 59)
+
+    rows = fetcher.fetch_klines_30m("BTCUSDT", START, end, limit=10, max_retries=3)
+
+    assert len(rows) == 60
+    statuses = [(t, start, status) for t, start, status in stub.requests if start == throttled]
+    assert [s for _, _, s in statuses] == [429, 200]
+    # 재시도는 Retry-After(1초) 이후
+    assert statuses[1][0] - statuses[0][0] >= stub.retry_after * 0.9
+
+
+def test_gaps_and_duplicates_reported(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path)
+    missing = page_start(1, 10) + 3 * INTERVAL_MS
+    stub.missing.add(missing)
+    stub.duplicate_pages.add(page_start(3, 10))
+    end = START + timedelta(minutes=30 * 49)
+
+    rows = fetcher.fetch_klines_30m("BTCUSDT", START, end, limit=10)
+
+    timestamps = [r["timestamp"] for r in rows]
+    assert len(timestamps) == len(set(timestamps)) == 49
+    report = fetcher.last_fetch_report
+    assert report["duplicates"] == 1
+    assert report["gaps"] == [(missing, missing + INTERVAL_MS)]
+
+
+def test_sleep_sec_does_not_change_shared_limiter(stub, tmp_path):
+    fetcher = make_fetcher(stub, tmp_path)
+    before = fetcher.rate_limiter.max_requests_per_sec
+    end = START + timedelta(minutes=30 * 29)
+
+    started = time.monotonic()
+    fetcher.fetch_klines_30m("BTCUSDT", START, end, limit=10, sleep_sec=0.2)
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.4  # 3페이지 → 요청 간격 0.2초 두 번
+    assert fetcher.rate_limiter.max_requests_per_sec == before
@@ -81,6 +81,13 @@ from .backtest_v2 import (
     calc_profit_factor,
 )
 
+# Walk-forward
+from .walk_forward import (
+    WalkForwardV2,
+    WalkForwardWindow,
+    WalkForwardResult,
+)
+
 # Realtime
 from .realtime_trader_v2 import (
     RealtimeTraderV2,
@@ -143,6 +150,11 @@ __all__ = [
     "calc_win_rate",
     "calc_profit_factor",
     
+    # Walk-forward
+    "WalkForwardV2",
+    "WalkForwardWindow",
+    "WalkForwardResult",
+    
     # Realtime
     "RealtimeTraderV2",
     "RealtimeSimulator",
@@ -208,30 +208,41 @@ class BacktestV2:
             print(f"   - 초기 자본: ${self.initial_capital:,.2f}")
             print(f"   - 테스트 봉 수: {len(df) - start_idx}")
         
+        # 컬럼을 한 번만 파이썬 리스트로 추출 (봉마다 iloc 행 생성 비용 제거)
+        timestamps = df["timestamp"].tolist()
+        cols = {
+            name: df[name].astype(float).tolist()
+            for name in ("open", "high", "low", "close",
+                         "ema_trend_fast", "ema_trend_slow", "ema_entry_fast",
+                         "ema_entry_slow", "ema_exit_fast", "ema_exit_slow")
+        }
+        o, h, l, c = cols["open"], cols["high"], cols["low"], cols["close"]
+        trend_fast, trend_slow = cols["ema_trend_fast"], cols["ema_trend_slow"]
+        entry_fast, entry_slow = cols["ema_entry_fast"], cols["ema_entry_slow"]
+        exit_fast, exit_slow = cols["ema_exit_fast"], cols["ema_exit_slow"]
+        on_bar = self.engine.on_bar
+        
         # 메인 루프
         for i in range(start_idx, len(df)):
-            prev = df.iloc[i - 1]
-            row = df.iloc[i]
-            
             bar_data = BarData(
-                timestamp=row["timestamp"],
-                open=float(row["open"]),
-                high=float(row["high"]),
-                low=float(row["low"]),
-                close=float(row["close"]),
-                ema_trend_fast=float(row["ema_trend_fast"]),
-                ema_trend_slow=float(row["ema_trend_slow"]),
-                ema_entry_fast=float(row["ema_entry_fast"]),
-                ema_entry_slow=float(row["ema_entry_slow"]),
-                ema_exit_fast=float(row["ema_exit_fast"]),
-                ema_exit_slow=float(row["ema_exit_slow"]),
-                prev_entry_fast=float(prev["ema_entry_fast"]),
-                prev_entry_slow=float(prev["ema_entry_slow"]),
-                prev_exit_fast=float(prev["ema_exit_fast"]),
-                prev_exit_slow=float(prev["ema_exit_slow"]),
+                timestamp=timestamps[i],
+                open=o[i],
+                high=h[i],
+                low=l[i],
+                close=c[i],
+                ema_trend_fast=trend_fast[i],
+                ema_trend_slow=trend_slow[i],
+                ema_entry_fast=entry_fast[i],
+                ema_entry_slow=entry_slow[i],
+                ema_exit_fast=exit_fast[i],
+                ema_exit_slow=exit_slow[i],
+                prev_entry_fast=entry_fast[i - 1],
+                prev_entry_slow=entry_slow[i - 1],
+                prev_exit_fast=exit_fast[i - 1],
+                prev_exit_slow=exit_slow[i - 1],
             )
             
-            self.engine.on_bar(bar_data)
+            on_bar(bar_data)
         
         self.results = self._calculate_results()
         
@@ -9,7 +9,6 @@ CoinTrading v2 실시간 트레이딩 모듈
 from __future__ import annotations
 from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime
-from collections import deque
 import threading
 import time
 import json
@@ -18,6 +17,7 @@ from config_v2 import ParamsV2, EmailConfig, DEFAULT_EMAIL_CONFIG
 from models import BarData
 from trading_engine_v2 import TradingEngineV2
 from email_notifier import EmailNotifier
+from utils.price_buffer import PriceBuffer as CandleRingBuffer
 
 
 def ema_update(prev_ema: float, new_value: float, period: int) -> float:
@@ -33,8 +33,8 @@ class PriceBuffer:
         self.params = params
         self.max_candles = max_candles
         
-        # 캔들 데이터
-        self.candles: deque = deque(maxlen=max_candles)
+        # 캔들 데이터 (컬럼형 링 버퍼)
+        self.candles = CandleRingBuffer(maxlen=max_candles)
         
         # 현재 EMA 값들
         self.ema_trend_fast: float = 0.0
@@ -58,15 +58,14 @@ class PriceBuffer:
         import pandas as pd
         
         for c in candles:
-            self.candles.append(c)
+            self.candles.add_candle(c)
         
         if len(self.candles) < self.params.trend_slow + 10:
             print(f"⚠️ 캔들 부족: {len(self.candles)}개 (최소 {self.params.trend_slow + 10}개 필요)")
             return
         
-        # DataFrame으로 EMA 계산
-        df = pd.DataFrame(list(self.candles))
-        close = df['close'].astype(float)
+        # 종가 배열 뷰로 EMA 계산 (행 단위 DataFrame 생성 없음)
+        close = pd.Series(self.candles.view('close'))
         
         # EMA 계산
         def calc_ema(series, period):
@@ -87,7 +86,7 @@ class PriceBuffer:
             self.prev_exit_slow = calc_ema(close, self.params.exit_slow).iloc[-2]
         
         self.is_initialized = True
-        self.last_candle_time = df['timestamp'].iloc[-1] if 'timestamp' in df.columns else None
+        self.last_candle_time = self.candles.last_timestamp
         
         print(f"✅ 버퍼 초기화 완료: {len(self.candles)}개 캔들")
         print(f"   - 트렌드 EMA: {self.ema_trend_fast:.2f} / {self.ema_trend_slow:.2f}")
@@ -95,7 +94,7 @@ class PriceBuffer:
     def update_with_new_candle(self, candle: Dict):
         """새 캔들로 EMA 업데이트"""
         if not self.is_initialized:
-            self.candles.append(candle)
+            self.candles.add_candle(candle)
             return
         
         close = float(candle['close'])
@@ -114,7 +113,7 @@ class PriceBuffer:
         self.ema_exit_fast = ema_update(self.ema_exit_fast, close, self.params.exit_fast)
         self.ema_exit_slow = ema_update(self.ema_exit_slow, close, self.params.exit_slow)
         
-        self.candles.append(candle)
+        self.candles.add_candle(candle)
         self.last_candle_time = candle.get('timestamp')
     
     def get_bar_data(self, candle: Dict) -> Optional[BarData]:
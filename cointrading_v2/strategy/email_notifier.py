@@ -8,11 +8,15 @@
 - 오류 발생
 """
 
+import atexit
 import smtplib
+import threading
+import time
+from collections import deque
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 
 import sys
 import os
@@ -43,23 +47,48 @@ except ImportError:
     DEFAULT_EMAIL_CONFIG = EmailConfig()
 
 
+# 알림 우선순위 - 큐가 가득 차면 LOW부터 버림
+PRIORITY_HIGH = 0   # 진입/청산/오류
+PRIORITY_LOW = 1    # 모드 전환 등 참고용 알림
+
+
 class EmailNotifier:
     """
     이메일 알림 발송 클래스
     
     SMTP를 통해 거래 알림 이메일 발송
+    
+    - async_send=True (기본): send_*()는 알림을 제한된 크기의 큐에 넣고 즉시 반환
+      → 느린 메일 서버가 진입/청산 처리 흐름을 막지 않음
+    - 백그라운드 워커가 SMTP 세션 하나를 유지하며, 끊기면 다음 발송 시 재연결
+    - 짧은 시간에 몰린 알림은 다이제스트 메일 한 통으로 묶어서 발송
+    - 큐가 가득 차면 LOW 우선순위 알림부터 버림 (dropped 카운터로 확인)
     """
     
-    def __init__(self, config: EmailConfig = None):
+    def __init__(self, config: EmailConfig = None, async_send: bool = True,
+                 queue_size: int = 100, digest_linger: float = 1.0,
+                 max_digest: int = 20, idle_timeout: float = 120.0):
         """
         Args:
             config: 이메일 설정 (None이면 기본값 사용)
+            async_send: 백그라운드 큐로 발송할지 여부 (False면 호출 스레드에서 즉시 발송)
+            queue_size: 대기 큐 최대 크기
+            digest_linger: 첫 알림 이후 다이제스트로 묶기 위해 추가로 기다리는 시간 (초)
+            max_digest: 다이제스트 한 통에 묶을 최대 알림 수
+            idle_timeout: 이 시간 동안 발송이 없으면 SMTP 세션 종료 (초)
         """
         self.config = config or DEFAULT_EMAIL_CONFIG
         self.enabled = self.config.is_configured
         self.send_count = 0
         self.last_error: Optional[str] = None
         
+        self.async_send = async_send
+        self.queue_size = queue_size
+        self.digest_linger = digest_linger
+        self.max_digest = max_digest
+        self.idle_timeout = idle_timeout
+        self._init_dispatcher()
+        
         if self.enabled:
             print(f"✅ [Email] 알림 활성화: {self.config.recipient_email}")
         else:
@@ -81,7 +110,7 @@ class EmailNotifier:
                 - timestamp: 시간
         
         Returns:
-            발송 성공 여부
+            발송 성공 여부 (비동기 모드에서는 큐 등록 여부)
         """
         if not self.enabled or not self.config.notify_on_entry:
             return False
@@ -90,7 +119,7 @@ class EmailNotifier:
         
         body = self._format_entry_body(details)
         
-        return self._send(subject, body, details)
+        return self._dispatch(subject, body, details, PRIORITY_HIGH)
     
     def send_exit_alert(self, details: Dict[str, Any]) -> bool:
         """
@@ -119,7 +148,7 @@ class EmailNotifier:
         
         body = self._format_exit_body(details)
         
-        return self._send(subject, body, details)
+        return self._dispatch(subject, body, details, PRIORITY_HIGH)
     
     def send_mode_switch_alert(self, details: Dict[str, Any]) -> bool:
         """
@@ -146,7 +175,7 @@ class EmailNotifier:
         
         body = self._format_mode_switch_body(details)
         
-        return self._send(subject, body, details)
+        return self._dispatch(subject, body, details, PRIORITY_LOW)
     
     def send_error_alert(self, details: Dict[str, Any]) -> bool:
         """
@@ -169,7 +198,7 @@ class EmailNotifier:
         
         body = self._format_error_body(details)
         
-        return self._send(subject, body, details)
+        return self._dispatch(subject, body, details, PRIORITY_HIGH)
     
     def _format_entry_body(self, details: Dict[str, Any]) -> str:
         """진입 알림 본문 포맷"""
@@ -242,6 +271,178 @@ class EmailNotifier:
 즉시 확인이 필요합니다.
 """
     
+    # ==================== 비동기 디스패처 ====================
+    
+    def _init_dispatcher(self):
+        """발송 큐 / 워커 상태 초기화"""
+        self._cond = threading.Condition()
+        self._queues: Dict[int, deque] = {PRIORITY_HIGH: deque(), PRIORITY_LOW: deque()}
+        self._worker: Optional[threading.Thread] = None
+        self._stopping = False
+        self._in_flight = 0
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_sent_at = 0.0
+        
+        self.dropped_count = 0
+        self.digest_count = 0
+    
+    def _queue_depth(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+    
+    def _dispatch(self, subject: str, body: str, details: Dict, priority: int) -> bool:
+        """동기 모드면 즉시 발송, 비동기 모드면 큐에 등록"""
+        if not self.async_send:
+            return self._send(subject, body, details)
+        
+        item = (subject, body, details)
+        with self._cond:
+            if self._stopping:
+                return False
+            
+            if self._queue_depth() >= self.queue_size:
+                low = self._queues[PRIORITY_LOW]
+                if priority == PRIORITY_LOW or not low:
+                    # 백프레셔: 새 LOW 알림은 버리고, HIGH만 가득 찬 경우에도 대기하지 않음
+                    self.dropped_count += 1
+                    print(f"⚠️ [Email] 큐 가득 참 - 알림 버림: {subject}")
+                    return False
+                low.popleft()
+                self.dropped_count += 1
+            
+            self._queues[priority].append(item)
+            self._ensure_worker()
+            self._cond.notify()
+        return True
+    
+    def _ensure_worker(self):
+        """워커 스레드 지연 시작 (_cond 보유 상태에서 호출)"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._worker_loop, name="EmailNotifier", daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+    
+    def _take_batch(self) -> List[Tuple[str, str, Dict]]:
+        """우선순위 순으로 최대 max_digest개 꺼내기 (_cond 보유 상태에서 호출)"""
+        batch = []
+        for priority in (PRIORITY_HIGH, PRIORITY_LOW):
+            q = self._queues[priority]
+            while q and len(batch) < self.max_digest:
+                batch.append(q.popleft())
+        return batch
+    
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                while not self._queue_depth() and not self._stopping:
+                    if not self._cond.wait(timeout=self.idle_timeout) and self._is_smtp_idle():
+                        break
+                if self._stopping and not self._queue_depth():
+                    break
+                
+                batch = []
+                if self._queue_depth():
+                    # 몰려오는 알림을 다이제스트로 묶기 위해 잠시 대기
+                    if self.digest_linger > 0 and not self._stopping:
+                        deadline = time.monotonic() + self.digest_linger
+                        while self._queue_depth() < self.max_digest and not self._stopping:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            self._cond.wait(timeout=remaining)
+                    
+                    batch = self._take_batch()
+                    self._in_flight = len(batch)
+            
+            if not batch:
+                # 유휴 세션 종료 - quit()는 최대 30초 걸릴 수 있으므로 잠금 밖에서 (_dispatch를 막지 않도록)
+                self._close_smtp()
+                continue
+            
+            try:
+                if len(batch) == 1:
+                    self._send(*batch[0])
+                elif batch:
+                    self._send_digest(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+        
+        self._close_smtp()
+    
+    def _send_digest(self, batch: List[Tuple[str, str, Dict]]) -> bool:
+        """여러 알림을 한 통의 다이제스트 메일로 발송"""
+        subject = f"📬 알림 {len(batch)}건: " + " / ".join(item[0] for item in batch[:3])
+        if len(batch) > 3:
+            subject += " ..."
+        
+        parts = [f"[{i}] {item[0]}\n{item[1]}" for i, item in enumerate(batch, 1)]
+        body = "\n".join(parts)
+        
+        ok = self._send(subject, body, {'digest': [item[2] for item in batch]})
+        if ok:
+            self.digest_count += 1
+        return ok
+    
+    def flush(self, timeout: float = 30.0) -> bool:
+        """큐가 빌 때까지 대기 (테스트/종료용)"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue_depth() or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining)
+        return True
+    
+    def close(self, timeout: float = 10.0):
+        """남은 알림을 발송하고 워커 종료"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is None:
+            # 동기 모드: 호출 스레드가 세션 소유
+            self._close_smtp()
+            return
+        if worker is not threading.current_thread():
+            worker.join(timeout=timeout)
+            if worker.is_alive():
+                # 워커가 아직 세션을 쓰는 중 - 세션은 워커가 종료하면서 닫음
+                print(f"⚠️ [Email] 워커 종료 대기 시간 초과 ({timeout}초) - 남은 알림은 백그라운드에서 발송")
+    
+    # ==================== SMTP 세션 ====================
+    
+    def _connect_smtp(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port, timeout=30)
+        server.starttls()
+        server.login(self.config.sender_email, self.config.sender_password)
+        return server
+    
+    def _close_smtp(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+    
+    def _is_smtp_idle(self) -> bool:
+        return self._smtp is not None and time.monotonic() - self._last_sent_at >= self.idle_timeout
+    
+    def _deliver(self, msg: MIMEMultipart):
+        """유지 중인 SMTP 세션으로 발송 (세션이 없거나 끊겼으면 한 번 재연결)"""
+        if self._smtp is None:
+            self._smtp = self._connect_smtp()
+        try:
+            self._smtp.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPSenderRefused, OSError):
+            self._close_smtp()
+            self._smtp = self._connect_smtp()
+            self._smtp.send_message(msg)
+        self._last_sent_at = time.monotonic()
+    
     def _send(self, subject: str, body: str, details: Dict = None) -> bool:
         """
         실제 이메일 발송
@@ -262,16 +463,13 @@ class EmailNotifier:
             
             msg.attach(MIMEText(body, 'plain', 'utf-8'))
             
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                server.starttls()
-                server.login(self.config.sender_email, self.config.sender_password)
-                server.send_message(msg)
+            self._deliver(msg)
             
             self.send_count += 1
             self.last_error = None
             print(f"📧 [Email #{self.send_count}] {subject}")
             return True
-            
+        
         except Exception as e:
             self.last_error = str(e)
             print(f"❌ [Email] 발송 실패: {e}")
@@ -289,6 +487,10 @@ class EmailNotifier:
             'send_count': self.send_count,
             'last_error': self.last_error,
             'recipient': self.config.recipient_email if self.enabled else None,
+            'async': self.async_send,
+            'queue_depth': self._queue_depth(),
+            'dropped': self.dropped_count,
+            'digests': self.digest_count,
         }
 
 
@@ -299,8 +501,13 @@ class MockEmailNotifier(EmailNotifier):
     실제 이메일 발송 없이 콘솔에 로그만 출력
     """
     
-    def __init__(self):
-        """Mock 초기화 - 항상 활성화"""
+    def __init__(self, async_send: bool = False):
+        """
+        Mock 초기화 - 항상 활성화
+        
+        Args:
+            async_send: True면 실제 구현과 같은 큐/워커 경로로 발송 (기본은 즉시 기록)
+        """
         self.config = EmailConfig()
         self.config.notify_on_entry = True
         self.config.notify_on_exit = True
@@ -312,6 +519,13 @@ class MockEmailNotifier(EmailNotifier):
         self.last_error = None
         self.sent_messages: list = []  # 발송된 메시지 저장
         
+        self.async_send = async_send
+        self.queue_size = 100
+        self.digest_linger = 0.0
+        self.max_digest = 20
+        self.idle_timeout = 120.0
+        self._init_dispatcher()
+        
         print(f"📧 [MockEmail] 테스트 모드 활성화")
     
     def _send(self, subject: str, body: str, details: Dict = None) -> bool:
@@ -2,29 +2,86 @@
 """
 가격 데이터 버퍼
 
-실시간 캔들 데이터를 저장하고 DataFrame으로 변환
+실시간 캔들 데이터를 컬럼형 링 버퍼(NumPy 배열)에 저장하고
+필요할 때만 DataFrame으로 변환
 """
 
-from collections import deque
+from datetime import datetime
 from typing import Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
 
+# 저장하는 가격 컬럼 (timestamp는 int64 ms로 별도 저장)
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _to_ms(ts) -> int:
+    """다양한 타임스탬프 형식을 unix ms로 변환"""
+    if ts is None:
+        return 0
+    if isinstance(ts, pd.Timestamp):
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert('UTC').tz_localize(None)
+        return int(ts.value // 1_000_000)
+    if isinstance(ts, datetime):
+        return _to_ms(pd.Timestamp(ts))
+    if isinstance(ts, np.datetime64):
+        return int(ts.astype('datetime64[ms]').astype(np.int64))
+    try:
+        return int(float(ts))
+    except (TypeError, ValueError):
+        return _to_ms(pd.Timestamp(ts))
+
+
 class PriceBuffer:
     """
     가격 데이터 버퍼
     
     실시간으로 들어오는 캔들 데이터를 저장하고
     EMA 계산을 위한 DataFrame으로 변환
+    
+    - OHLCV는 float64, timestamp는 int64(ms) 배열에 미리 할당해 저장
+    - 용량 2 * maxlen 배열에 이어 쓰고 끝에 닿으면 최근 데이터만 앞으로 옮김
+      → 유효 구간이 항상 연속이므로 view()는 복사 없는 배열 뷰 반환
+    - to_dataframe()은 데이터가 바뀐 경우에만 새로 생성 (그 외에는 캐시 반환)
     """
     
-    def __init__(self, maxlen: int = 300):
+    def __init__(self, maxlen: int = 300, index_col: Optional[str] = None):
         """
         Args:
             maxlen: 최대 저장 개수 (EMA 200 + 여유)
+            index_col: to_dataframe()에서 인덱스로 설정할 컬럼 (예: 'timestamp')
         """
         self.maxlen = maxlen
-        self.candles = deque(maxlen=maxlen)
+        self.index_col = index_col
+        
+        self._capacity = max(2 * maxlen, 2)
+        self._timestamps = np.zeros(self._capacity, dtype=np.int64)
+        self._columns = {f: np.full(self._capacity, np.nan) for f in PRICE_FIELDS}
+        self._start = 0
+        self._end = 0
+        
+        # 입력 타임스탬프가 datetime 계열이면 DataFrame 변환 시 복원
+        self._ts_is_datetime = False
+        self._ts_tz = None
+        
+        # DataFrame 지연 생성 캐시
+        self._version = 0
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_version = -1
+        
+        self.last_timestamp = None
+    
+    def _compact(self):
+        """배열 끝에 도달하면 최근 maxlen - 1개를 앞으로 이동"""
+        keep = min(self.maxlen - 1, self._end - self._start)
+        src = slice(self._end - keep, self._end)
+        self._timestamps[:keep] = self._timestamps[src]
+        for arr in self._columns.values():
+            arr[:keep] = arr[src]
+        self._start = 0
+        self._end = keep
     
     def add_candle(self, candle: Dict[str, Any]):
         """
@@ -32,26 +89,131 @@ class PriceBuffer:
         
         Args:
             candle: 캔들 데이터 딕셔너리
-                - timestamp: 시간
+                - timestamp: 시간 (ms 정수, 문자열, datetime/Timestamp)
                 - open: 시가
                 - high: 고가
                 - low: 저가
                 - close: 종가
                 - volume: 거래량 (옵션)
         """
-        self.candles.append(candle)
+        if self._end == self._capacity:
+            self._compact()
+        
+        ts = candle.get('timestamp')
+        if isinstance(ts, (datetime, np.datetime64)):
+            self._ts_is_datetime = True
+            self._ts_tz = getattr(ts, 'tzinfo', None)
+        
+        i = self._end
+        self._timestamps[i] = _to_ms(ts)
+        for f, arr in self._columns.items():
+            value = candle.get(f)
+            arr[i] = float(value) if value is not None else np.nan
+        
+        self._end += 1
+        if self._end - self._start > self.maxlen:
+            self._start += 1
+        
+        self.last_timestamp = ts
+        self._version += 1
+    
+    def load_dataframe(self, df: pd.DataFrame):
+        """DataFrame 일괄 추가 (초기 로드용, 행 단위 dict 변환 없음)"""
+        if df is None or len(df) == 0:
+            return
+        
+        df = df.iloc[-self.maxlen:]
+        n = len(df)
+        if self._end + n > self._capacity:
+            self._compact()
+        
+        ts = df['timestamp']
+        if pd.api.types.is_datetime64_any_dtype(ts):
+            self._ts_is_datetime = True
+            self._ts_tz = getattr(ts.dt, 'tz', None)
+            ts_ms = ts.dt.tz_convert('UTC').dt.tz_localize(None) if self._ts_tz is not None else ts
+            ts_ms = ts_ms.to_numpy(dtype='datetime64[ms]').astype(np.int64)
+        else:
+            ts_ms = pd.to_numeric(ts).to_numpy(dtype=np.int64)
+        
+        dst = slice(self._end, self._end + n)
+        self._timestamps[dst] = ts_ms
+        for f, arr in self._columns.items():
+            arr[dst] = df[f].to_numpy(dtype=np.float64) if f in df.columns else np.nan
+        
+        self._end += n
+        self._start = max(self._start, self._end - self.maxlen)
+        
+        self.last_timestamp = ts.iloc[-1]
+        self._version += 1
+    
+    def update_last(self, close: float, high: float = None, low: float = None):
+        """
+        마지막 캔들 업데이트 (배열 제자리 갱신)
+        
+        Args:
+            close: 종가
+            high: 고가 (옵션)
+            low: 저가 (옵션)
+        """
+        if self._end == self._start:
+            return
+        
+        i = self._end - 1
+        self._columns['close'][i] = close
+        if high is not None:
+            cur = self._columns['high'][i]
+            self._columns['high'][i] = high if np.isnan(cur) else max(cur, high)
+        if low is not None:
+            cur = self._columns['low'][i]
+            self._columns['low'][i] = low if np.isnan(cur) else min(cur, low)
+        self._version += 1
+    
+    def view(self, field: str) -> np.ndarray:
+        """
+        컬럼 배열 뷰 (복사 없음, 읽기 전용)
+        
+        Args:
+            field: 'timestamp', 'open', 'high', 'low', 'close', 'volume'
+        """
+        arr = self._timestamps if field == 'timestamp' else self._columns[field]
+        v = arr[self._start:self._end]
+        v.flags.writeable = False
+        return v
     
     def to_dataframe(self) -> Optional[pd.DataFrame]:
         """
         DataFrame으로 변환
         
+        데이터가 바뀌지 않았으면 이전에 만든 DataFrame을 그대로 반환하므로
+        호출자는 결과를 수정하지 말고 읽기 전용으로 사용해야 함
+        
         Returns:
             캔들 데이터 DataFrame
         """
-        if not self.candles:
+        if self._end == self._start:
             return None
         
-        return pd.DataFrame(list(self.candles))
+        if self._df_version == self._version and self._df_cache is not None:
+            return self._df_cache
+        
+        ts = self._timestamps[self._start:self._end]
+        if self._ts_is_datetime:
+            ts = pd.to_datetime(ts, unit='ms', utc=self._ts_tz is not None)
+            if self._ts_tz is not None:
+                ts = ts.tz_convert(self._ts_tz)
+        
+        data = {'timestamp': ts}
+        for f, arr in self._columns.items():
+            data[f] = arr[self._start:self._end]
+        
+        df = pd.DataFrame(data)
+        if self.index_col:
+            df.set_index(self.index_col, inplace=True)
+        
+        self._df_cache = df
+        self._df_version = self._version
+        return df
     
     def get_latest(self) -> Optional[Dict[str, Any]]:
         """
@@ -60,9 +222,14 @@ class PriceBuffer:
         Returns:
             최신 캔들 딕셔너리
         """
-        if not self.candles:
+        if self._end == self._start:
             return None
-        return self.candles[-1]
+        
+        i = self._end - 1
+        latest = {'timestamp': self.last_timestamp}
+        for f, arr in self._columns.items():
+            latest[f] = float(arr[i])
+        return latest
     
     def get_latest_close(self) -> Optional[float]:
         """
@@ -71,14 +238,18 @@ class PriceBuffer:
         Returns:
             최신 종가
         """
-        latest = self.get_latest()
-        if latest:
-            return float(latest.get('close', 0))
-        return None
+        if self._end == self._start:
+            return None
+        return float(self._columns['close'][self._end - 1])
+    
+    @property
+    def version(self) -> int:
+        """데이터가 바뀔 때마다 증가하는 번호 (파생 지표 재계산 여부 판단용)"""
+        return self._version
     
     def __len__(self) -> int:
         """버퍼 크기"""
-        return len(self.candles)
+        return self._end - self._start
     
     def is_ready(self, min_length: int = 200) -> bool:
         """
@@ -90,8 +261,12 @@ class PriceBuffer:
         Returns:
             계산 가능 여부
         """
-        return len(self.candles) >= min_length
+        return len(self) >= min_length
     
     def clear(self):
         """버퍼 초기화"""
-        self.candles.clear()
+        self._start = 0
+        self._end = 0
+        self._version += 1
+        self._df_cache = None
+        self.last_timestamp = None
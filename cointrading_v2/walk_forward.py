@@ -0,0 +1,466 @@
+# walk_forward.py
+"""
+CoinTrading v2 워크포워드 최적화 모듈
+- 전체 기간을 (in-sample, out-of-sample) 롤링 윈도우로 분할
+- 각 in-sample 구간에서 ParamsV2 후보 조합을 ProcessPoolExecutor로 병렬 백테스트해 최적 파라미터 선택
+- 선택된 파라미터로 바로 다음 out-of-sample 구간 평가
+- OOS 자산곡선을 이어 붙여 워크포워드 전체 성과 계산
+- 후보 EMA 기간은 전체 기간에 대해 한 번만 계산하고 윈도우마다 잘라서 사용
+"""
+
+from __future__ import annotations
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, replace, asdict
+from typing import Optional, List, Dict, Any, Tuple, Iterable
+import pandas as pd
+import numpy as np
+
+from config_v2 import ParamsV2
+from backtest_v2 import BacktestV2, ema, calc_mdd
+
+
+# ===== 상수 =====
+
+EMA_PERIOD_FIELDS_V2 = (
+    "trend_fast", "trend_slow", "entry_fast", "entry_slow", "exit_fast", "exit_slow",
+)
+
+# ParamsV2 필드 → BacktestV2가 읽는 EMA 컬럼
+_EMA_COLUMNS = {
+    "trend_fast": "ema_trend_fast",
+    "trend_slow": "ema_trend_slow",
+    "entry_fast": "ema_entry_fast",
+    "entry_slow": "ema_entry_slow",
+    "exit_fast": "ema_exit_fast",
+    "exit_slow": "ema_exit_slow",
+}
+
+# (fast, slow) 쌍 - fast >= slow 조합은 기본적으로 제외
+_FAST_SLOW_PAIRS = [
+    ("trend_fast", "trend_slow"),
+    ("entry_fast", "entry_slow"),
+    ("exit_fast", "exit_slow"),
+]
+
+# 윈도우 요약 지표
+METRIC_KEYS = [
+    "real_roi_pct", "real_mdd_pct", "real_profit_factor", "real_win_rate_pct",
+    "real_trade_count", "total_trade_count", "mode_switch_r2v", "mode_switch_v2r",
+]
+
+
+# ===== 유틸리티 함수 =====
+
+def build_ema_cache(df: pd.DataFrame, periods: Iterable[int]) -> Dict[int, np.ndarray]:
+    """기간별 EMA를 전체 기간에 대해 한 번씩만 계산"""
+    close = df["close"].astype(float)
+    return {int(p): ema(close, int(p)).to_numpy() for p in sorted(set(periods))}
+
+
+def warmup_bars(params: ParamsV2) -> int:
+    """BacktestV2.run이 평가를 시작하는 인덱스 (이전 봉은 워밍업)"""
+    return max(params.trend_slow, params.entry_slow, params.exit_slow) + 2
+
+
+def slice_window(df: pd.DataFrame, ema_cache: Dict[int, np.ndarray], params: ParamsV2,
+                 start: int, end: int) -> pd.DataFrame:
+    """
+    [start, end) 구간 평가용 DataFrame
+    
+    앞쪽에 워밍업 봉을 붙여 BacktestV2.run이 정확히 start 봉부터 평가하도록 하고,
+    EMA는 전체 기간 캐시를 잘라서 사용 (윈도우마다 재계산하지 않음)
+    """
+    lo = start - warmup_bars(params)
+    if lo < 0:
+        raise ValueError(f"워밍업 봉 부족: start={start}, 필요={warmup_bars(params)}")
+    
+    window = df.iloc[lo:end].reset_index(drop=True)
+    for name, col in _EMA_COLUMNS.items():
+        window[col] = ema_cache[getattr(params, name)][lo:end]
+    return window
+
+
+def _metrics(results: Dict[str, Any]) -> Dict[str, Any]:
+    m = {k: results[k] for k in METRIC_KEYS}
+    # ROI / MDD 비율 (MDD가 매우 작을 때 폭주하지 않도록 1% 하한)
+    m["roi_mdd_ratio"] = results["real_roi_pct"] / max(results["real_mdd_pct"], 1.0)
+    return m
+
+
+# ===== 워커 프로세스 =====
+
+# 워커마다 initializer로 한 번만 전달받는 공유 데이터
+_worker_df: Optional[pd.DataFrame] = None
+_worker_ema_cache: Optional[Dict[int, np.ndarray]] = None
+_worker_initial_capital: float = 10000.0
+_worker_symbol: str = "BTC-USDT-SWAP"
+
+
+def _init_worker(df: pd.DataFrame, ema_cache: Dict[int, np.ndarray], initial_capital: float, symbol: str):
+    global _worker_df, _worker_ema_cache, _worker_initial_capital, _worker_symbol
+    _worker_df = df
+    _worker_ema_cache = ema_cache
+    _worker_initial_capital = initial_capital
+    _worker_symbol = symbol
+
+
+def _evaluate(params: ParamsV2, start: int, end: int, with_equity: bool = False) -> Dict[str, Any]:
+    """[start, end) 구간 백테스트 → 지표 (with_equity면 봉별 REAL 자산 포함)"""
+    window = slice_window(_worker_df, _worker_ema_cache, params, start, end)
+    # 이메일 알림기 없이 실행 (후보마다 Mock 알림 출력이 쌓이지 않도록)
+    bt = BacktestV2(params=params, initial_capital=_worker_initial_capital,
+                    symbol=_worker_symbol, use_mock_email=False)
+    results = bt.run(df=window, quiet=True)
+    
+    out = _metrics(results)
+    if with_equity:
+        # equity_history_real[0]은 초기 자본, 이후 봉마다 1개
+        out["equity"] = results["equity_history_real"][1:]
+    return out
+
+
+def _run_tasks(tasks: List[Tuple], base_params: ParamsV2) -> List[Tuple]:
+    """
+    작업 묶음 실행 (IPC 횟수를 줄이기 위해 여러 작업을 한 번에 처리)
+    
+    Args:
+        tasks: [(윈도우 번호, 오버라이드, start, end, with_equity), ...]
+    """
+    out = []
+    for window_idx, overrides, start, end, with_equity in tasks:
+        params = replace(base_params, **overrides, enable_debug_logging=False)
+        try:
+            metrics = _evaluate(params, start, end, with_equity)
+        except Exception as e:
+            metrics = {"error": str(e)}
+        out.append((window_idx, overrides, metrics))
+    return out
+
+
+# ===== 결과 =====
+
+@dataclass
+class WalkForwardWindow:
+    """워크포워드 윈도우 하나의 결과"""
+    index: int
+    is_range: Tuple[int, int]        # in-sample [start, end) 봉 인덱스
+    oos_range: Tuple[int, int]       # out-of-sample [start, end) 봉 인덱스
+    is_period: Tuple[Any, Any]       # in-sample 시작/마지막 봉 시각
+    oos_period: Tuple[Any, Any]      # out-of-sample 시작/마지막 봉 시각
+    
+    params: Dict[str, Any]           # 선택된 파라미터 (ranges 필드만)
+    is_metrics: Dict[str, Any]       # 선택된 파라미터의 in-sample 지표
+    oos_metrics: Dict[str, Any]      # out-of-sample 지표
+    candidates: int = 0              # 평가한 후보 수
+    eligible: int = 0                # 선택 조건(min_trades)을 만족한 후보 수
+
+
+@dataclass
+class WalkForwardResult:
+    """워크포워드 최적화 결과"""
+    initial_capital: float
+    final_capital: float
+    roi_pct: float
+    mdd_pct: float
+    
+    windows: List[WalkForwardWindow]
+    
+    # 이어 붙인 OOS REAL 자산곡선 (시간 인덱스)
+    equity: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))
+    
+    @property
+    def summary(self) -> pd.DataFrame:
+        """윈도우별 요약 (선택 파라미터 + IS/OOS 지표)"""
+        rows = []
+        for w in self.windows:
+            row = {"window": w.index, "oos_start": w.oos_period[0], "oos_end": w.oos_period[1]}
+            row.update(w.params)
+            row.update({f"is_{k}": v for k, v in w.is_metrics.items()})
+            row.update({f"oos_{k}": v for k, v in w.oos_metrics.items() if k != "equity"})
+            rows.append(row)
+        return pd.DataFrame(rows).set_index("window") if rows else pd.DataFrame()
+
+
+# ===== 워크포워드 실행기 =====
+
+class WalkForwardV2:
+    """
+    ParamsV2 워크포워드 최적화
+    
+    사용법:
+        df = load_ohlc_csv("BTCUSDT_30m.csv")
+        wf = WalkForwardV2(df, in_sample_bars=48 * 60, out_of_sample_bars=48 * 14, max_workers=8)
+        result = wf.run({
+            "entry_fast": [10, 20, 30],
+            "entry_slow": [50, 100],
+            "trailing_stop": [0.05, 0.10],
+        })
+        print(result.summary)
+        result.equity.plot()
+    """
+    
+    def __init__(self,
+                 df: pd.DataFrame,
+                 in_sample_bars: int,
+                 out_of_sample_bars: int,
+                 base_params: ParamsV2 = None,
+                 initial_capital: float = 10000.0,
+                 symbol: str = "BTC-USDT-SWAP",
+                 anchored: bool = False,
+                 max_workers: Optional[int] = None,
+                 chunk_size: int = 8):
+        """
+        Args:
+            df: OHLC 데이터 (load_ohlc_csv 형식, EMA 컬럼 불필요)
+            in_sample_bars: 최적화 구간 길이 (봉 수)
+            out_of_sample_bars: 검증 구간 길이 (봉 수, 윈도우 이동 간격)
+            base_params: 범위에 포함되지 않은 파라미터의 기본값
+            initial_capital: 초기 자본
+            symbol: 거래 심볼
+            anchored: True면 in-sample 시작을 고정하고 구간을 늘려감 (expanding window)
+            max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+            chunk_size: 워커 작업 하나에 묶을 백테스트 수
+        """
+        if in_sample_bars <= 0 or out_of_sample_bars <= 0:
+            raise ValueError("in_sample_bars / out_of_sample_bars는 0보다 커야 합니다.")
+        
+        self.base_params = base_params or ParamsV2()
+        self.in_sample_bars = int(in_sample_bars)
+        self.out_of_sample_bars = int(out_of_sample_bars)
+        self.initial_capital = initial_capital
+        self.symbol = symbol
+        self.anchored = anchored
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        
+        # 워커로 보낼 데이터는 BacktestV2가 사용하는 컬럼만
+        cols = [c for c in ("timestamp", "open", "high", "low", "close") if c in df.columns]
+        self.df = df[cols].reset_index(drop=True)
+    
+    @staticmethod
+    def grid(ranges: Dict[str, Iterable], skip_invalid: bool = True,
+             base_params: ParamsV2 = None) -> List[Dict[str, Any]]:
+        """
+        파라미터 범위 → 조합 목록 (ParamsV2 오버라이드 딕셔너리)
+        
+        Args:
+            ranges: {ParamsV2 필드명: 값 목록}
+            skip_invalid: fast >= slow인 EMA 쌍 조합 제외
+            base_params: 범위에 없는 필드의 기본값 (유효성 검사용)
+        """
+        valid = {f.name for f in fields(ParamsV2)}
+        unknown = [k for k in ranges if k not in valid]
+        if unknown:
+            raise ValueError(f"알 수 없는 파라미터: {unknown}")
+        
+        base = asdict(base_params or ParamsV2())
+        keys = list(ranges.keys())
+        combos = []
+        for combo in itertools.product(*[list(v) for v in ranges.values()]):
+            overrides = dict(zip(keys, combo))
+            if skip_invalid:
+                p = dict(base, **overrides)
+                if not all(p[fast] < p[slow] for fast, slow in _FAST_SLOW_PAIRS):
+                    continue
+            combos.append(overrides)
+        return combos
+    
+    def windows(self, warmup: int) -> List[Tuple[int, int, int, int]]:
+        """
+        (is_start, is_end, oos_start, oos_end) 윈도우 목록
+        
+        Args:
+            warmup: 첫 in-sample 시작 전에 필요한 봉 수 (후보 중 최대 워밍업)
+        """
+        out = []
+        n = len(self.df)
+        is_start = warmup
+        k = 0
+        while True:
+            if self.anchored:
+                is_end = warmup + self.in_sample_bars + k * self.out_of_sample_bars
+            else:
+                is_start = warmup + k * self.out_of_sample_bars
+                is_end = is_start + self.in_sample_bars
+            oos_end = min(is_end + self.out_of_sample_bars, n)
+            if oos_end <= is_end:
+                break
+            out.append((is_start, is_end, is_end, oos_end))
+            if oos_end == n:
+                break
+            k += 1
+        return out
+    
+    def _execute(self, tasks: List[Tuple], executor, progress=None) -> List[Tuple]:
+        """작업 목록 실행 (executor가 None이면 현재 프로세스에서 순차 실행)"""
+        chunks = [tasks[i:i + self.chunk_size] for i in range(0, len(tasks), self.chunk_size)]
+        out = []
+        if executor is None:
+            for chunk in chunks:
+                out.extend(_run_tasks(chunk, self.base_params))
+                if progress:
+                    progress(len(chunk))
+            return out
+        
+        futures = [executor.submit(_run_tasks, chunk, self.base_params) for chunk in chunks]
+        for future in as_completed(futures):
+            rows = future.result()
+            out.extend(rows)
+            if progress:
+                progress(len(rows))
+        return out
+    
+    def run(self,
+            ranges: Dict[str, Iterable],
+            objective: str = "real_roi_pct",
+            maximize: bool = True,
+            min_trades: int = 1,
+            skip_invalid: bool = True,
+            progress_callback=None) -> WalkForwardResult:
+        """
+        워크포워드 최적화 실행
+        
+        Args:
+            ranges: {ParamsV2 필드명: 값 목록}
+            objective: in-sample 선택 기준 지표 (METRIC_KEYS 또는 "roi_mdd_ratio")
+            maximize: True면 objective 최대값, False면 최소값 선택
+            min_trades: in-sample REAL 거래가 이보다 적은 후보는 선택하지 않음
+                (조건을 만족하는 후보가 없으면 base_params 사용)
+            skip_invalid: fast >= slow인 EMA 쌍 조합 제외
+            progress_callback: 진행률 콜백 (current, total, message)
+        
+        Returns:
+            WalkForwardResult
+        """
+        if objective not in METRIC_KEYS + ["roi_mdd_ratio"]:
+            raise ValueError(f"알 수 없는 objective: {objective}")
+        
+        combos = self.grid(ranges, skip_invalid=skip_invalid, base_params=self.base_params)
+        if not combos:
+            raise ValueError("평가할 파라미터 조합이 없습니다.")
+        
+        candidates = [replace(self.base_params, **c) for c in combos] + [self.base_params]
+        warmup = max(warmup_bars(p) for p in candidates)
+        windows = self.windows(warmup)
+        if not windows:
+            raise ValueError(
+                f"데이터가 너무 짧습니다. 최소 {warmup + self.in_sample_bars + 1}개 봉 필요 (현재 {len(self.df)})"
+            )
+        
+        # 후보 전체에서 쓰이는 EMA 기간을 전체 기간에 대해 한 번만 계산
+        periods = {getattr(p, f) for p in candidates for f in EMA_PERIOD_FIELDS_V2}
+        ema_cache = build_ema_cache(self.df, periods)
+        
+        total = len(windows) * len(combos) + len(windows)
+        done = 0
+        
+        def _progress(n: int):
+            nonlocal done
+            done += n
+            if progress_callback:
+                progress_callback(done, total, f"워크포워드 {done:,}/{total:,}")
+        
+        executor = None
+        if self.max_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.df, ema_cache, self.initial_capital, self.symbol),
+            )
+        else:
+            _init_worker(self.df, ema_cache, self.initial_capital, self.symbol)
+        
+        try:
+            # 1) 모든 윈도우의 in-sample 후보 평가
+            is_tasks = [
+                (w, overrides, is_start, is_end, False)
+                for w, (is_start, is_end, _, _) in enumerate(windows)
+                for overrides in combos
+            ]
+            is_rows = self._execute(is_tasks, executor, _progress)
+            
+            # 2) 윈도우별 최적 파라미터 선택
+            chosen = self._select(is_rows, len(windows), objective, maximize, min_trades)
+            
+            # 3) 선택된 파라미터로 out-of-sample 평가
+            oos_tasks = [
+                (w, chosen[w][0], oos_start, oos_end, True)
+                for w, (_, _, oos_start, oos_end) in enumerate(windows)
+            ]
+            oos_rows = {w: metrics for w, _, metrics in self._execute(oos_tasks, executor, _progress)}
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return self._build_result(windows, combos, chosen, oos_rows)
+    
+    @staticmethod
+    def _select(is_rows: List[Tuple], n_windows: int, objective: str, maximize: bool,
+                min_trades: int) -> Dict[int, Tuple[Dict[str, Any], Dict[str, Any], int, int]]:
+        """윈도우별 (선택 오버라이드, in-sample 지표, 평가 후보 수, 적격 후보 수)"""
+        by_window: Dict[int, List[Tuple[Dict, Dict]]] = {w: [] for w in range(n_windows)}
+        for w, overrides, metrics in is_rows:
+            by_window[w].append((overrides, metrics))
+        
+        chosen = {}
+        for w, rows in by_window.items():
+            eligible = [
+                (o, m) for o, m in rows
+                if "error" not in m and m["real_trade_count"] >= min_trades and np.isfinite(m[objective])
+            ]
+            if eligible:
+                sign = 1 if maximize else -1
+                overrides, metrics = max(eligible, key=lambda r: sign * r[1][objective])
+            else:
+                overrides, metrics = {}, {}
+            chosen[w] = (overrides, metrics, len(rows), len(eligible))
+        return chosen
+    
+    def _build_result(self, windows, combos, chosen, oos_rows) -> WalkForwardResult:
+        """OOS 자산곡선 연결 → 전체 성과"""
+        timestamps = self.df["timestamp"]
+        keys = list(combos[0].keys())
+        capital = self.initial_capital
+        parts = []
+        results = []
+        
+        for w, (is_start, is_end, oos_start, oos_end) in enumerate(windows):
+            overrides, is_metrics, n_candidates, n_eligible = chosen[w]
+            oos = oos_rows.get(w, {"error": "결과 없음"})
+            
+            equity = oos.pop("equity", None)
+            if equity:
+                # 각 OOS 구간은 초기 자본으로 실행 → 직전 구간 종료 자본 기준으로 비율 환산해 연결
+                # (포지션 크기가 자본 비율(capital_use_ratio)이므로 수익률이 자본 규모와 무관)
+                scaled = np.asarray(equity, dtype=float) * (capital / self.initial_capital)
+                parts.append(pd.Series(scaled, index=pd.Index(timestamps.iloc[oos_start:oos_end])))
+                capital = float(scaled[-1])
+            
+            params = {k: getattr(self.base_params, k) for k in keys}
+            params.update(overrides)
+            results.append(WalkForwardWindow(
+                index=w,
+                is_range=(is_start, is_end),
+                oos_range=(oos_start, oos_end),
+                is_period=(timestamps.iloc[is_start], timestamps.iloc[is_end - 1]),
+                oos_period=(timestamps.iloc[oos_start], timestamps.iloc[oos_end - 1]),
+                params=params,
+                is_metrics=is_metrics,
+                oos_metrics=oos,
+                candidates=n_candidates,
+                eligible=n_eligible,
+            ))
+        
+        equity = pd.concat(parts) if parts else pd.Series(dtype=float)
+        mdd = calc_mdd([self.initial_capital] + equity.tolist()) * 100
+        
+        return WalkForwardResult(
+            initial_capital=self.initial_capital,
+            final_capital=capital,
+            roi_pct=(capital - self.initial_capital) / self.initial_capital * 100,
+            mdd_pct=mdd,
+            windows=results,
+            equity=equity,
+        )
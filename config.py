@@ -17,9 +17,11 @@ import time
 import threading
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 from dataclasses import dataclass
 
+from okx.rate_limiter import get_rate_limiter
+
 
 # =================================================================
 # IPv4 강제 사용 (OKX IP 화이트리스트 호환)
@@ -54,6 +56,9 @@ CONNECTION_CONFIG = {
     "retry_count": 3,
     "retry_delay": 1,
     "max_connections": 5,
+    "pool_connections": 4,    # 호스트별 커넥션 풀 개수
+    "pool_maxsize": 16,       # 풀당 유지할 최대 커넥션 수 (동시 요청 스레드 수 이상 권장)
+    "keep_alive": True,
 }
 
 
@@ -262,11 +267,165 @@ GUI_CONFIG = {
 
 
 # =================================================================
-# Rate Limiting
+# 공유 HTTP 세션 (커넥션 풀 / Keep-Alive)
 # =================================================================
-_api_lock = threading.Lock()
-_last_request_time = 0
-_min_request_interval = 0.1
+class EndpointLatencyStats:
+    """엔드포인트별 요청 지연 히스토그램 (thread-safe)"""
+    
+    # 버킷 상한 (ms) - 마지막 버킷은 그 이상 전부
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+    
+    def record(self, endpoint: str, elapsed_ms: float, ok: bool = True):
+        with self._lock:
+            st = self._stats.get(endpoint)
+            if st is None:
+                st = {
+                    "count": 0, "errors": 0, "total_ms": 0.0,
+                    "min_ms": float("inf"), "max_ms": 0.0,
+                    "buckets": [0] * (len(self.BUCKETS_MS) + 1),
+                }
+                self._stats[endpoint] = st
+            
+            st["count"] += 1
+            if not ok:
+                st["errors"] += 1
+            st["total_ms"] += elapsed_ms
+            st["min_ms"] = min(st["min_ms"], elapsed_ms)
+            st["max_ms"] = max(st["max_ms"], elapsed_ms)
+            
+            idx = len(self.BUCKETS_MS)
+            for i, upper in enumerate(self.BUCKETS_MS):
+                if elapsed_ms <= upper:
+                    idx = i
+                    break
+            st["buckets"][idx] += 1
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 통계 복사본 (평균 및 버킷 라벨 포함)"""
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            result = {}
+            for endpoint, st in self._stats.items():
+                result[endpoint] = {
+                    "count": st["count"],
+                    "errors": st["errors"],
+                    "avg_ms": st["total_ms"] / st["count"] if st["count"] else 0.0,
+                    "min_ms": st["min_ms"] if st["count"] else 0.0,
+                    "max_ms": st["max_ms"],
+                    "histogram": dict(zip(labels, st["buckets"])),
+                }
+            return result
+    
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+api_latency = EndpointLatencyStats()
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _build_http_session(pool_connections: int, pool_maxsize: int, keep_alive: bool) -> requests.Session:
+    session = requests.Session()
+    # 재시도는 호출부에서 처리하므로 어댑터 재시도는 끔
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    프로세스 공유 HTTP 세션 반환
+    
+    OKX REST 호출 전체가 하나의 커넥션 풀을 재사용하므로
+    요청마다 TCP/TLS 핸드셰이크를 반복하지 않는다.
+    urllib3 커넥션 풀은 thread-safe하므로 여러 스레드에서 동시에 사용 가능.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = _build_http_session(
+                    CONNECTION_CONFIG["pool_connections"],
+                    CONNECTION_CONFIG["pool_maxsize"],
+                    CONNECTION_CONFIG["keep_alive"],
+                )
+    return _http_session
+
+
+def configure_http_session(pool_connections: int = None, pool_maxsize: int = None,
+                           keep_alive: bool = None) -> requests.Session:
+    """커넥션 풀 설정 변경 후 공유 세션 재생성"""
+    global _http_session
+    with _http_session_lock:
+        if pool_connections is not None:
+            CONNECTION_CONFIG["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            CONNECTION_CONFIG["pool_maxsize"] = pool_maxsize
+        if keep_alive is not None:
+            CONNECTION_CONFIG["keep_alive"] = keep_alive
+        
+        old = _http_session
+        _http_session = _build_http_session(
+            CONNECTION_CONFIG["pool_connections"],
+            CONNECTION_CONFIG["pool_maxsize"],
+            CONNECTION_CONFIG["keep_alive"],
+        )
+    if old is not None:
+        old.close()
+    return _http_session
+
+
+def http_request(method: str, url: str, priority: int = None, acquire_token: bool = True,
+                 **kwargs) -> requests.Response:
+    """
+    공유 세션으로 HTTP 요청 실행 + 엔드포인트별 지연 기록
+    
+    요청 전에 공유 레이트 리미터에서 엔드포인트 그룹 토큰을 받음
+    (주문 > 계정 > 시세 순으로 우선 통과)
+    
+    서명 요청은 토큰 대기 후에 타임스탬프를 찍어야 하므로(OKX는 30초 지난 요청 거부)
+    호출부가 서명 전에 토큰을 받고 acquire_token=False로 호출
+    
+    Args:
+        method: HTTP 메서드
+        url: 전체 URL (쿼리 스트링은 지연 통계 키에서 제외)
+        priority: 레이트 리미터 우선순위 (None이면 엔드포인트 그룹 기본값)
+        acquire_token: False면 토큰을 받지 않음 (호출부가 이미 받은 경우)
+        **kwargs: requests.Session.request 인자 (headers, params, data, timeout 등)
+    """
+    path = urlsplit(url).path
+    if acquire_token:
+        get_rate_limiter().acquire_for_path(path, priority)
+    
+    endpoint = f"{method.upper()} {path}"
+    start = time.perf_counter()
+    ok = False
+    try:
+        response = get_http_session().request(method.upper(), url, **kwargs)
+        ok = response.status_code < 500
+        return response
+    finally:
+        api_latency.record(endpoint, (time.perf_counter() - start) * 1000, ok)
+
+
+def get_api_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """엔드포인트별 요청 지연 히스토그램 반환"""
+    return api_latency.snapshot()
+
+
+def get_rate_limit_stats() -> Dict[str, Any]:
+    """레이트 리미터 그룹별 남은 토큰 / 대기 통계"""
+    return get_rate_limiter().get_status()
+
 
 _timestamp_lock = threading.Lock()
 _last_timestamp = ""
@@ -351,36 +510,36 @@ def make_api_request(method: str, endpoint: str, params: Dict = None, data: Dict
             if query_string:
                 request_path = endpoint + "?" + query_string
             
-            # 헤더 생성
+            # 토큰 대기 후 서명 (대기 중에 타임스탬프가 오래되지 않도록)
+            get_rate_limiter().acquire_for_path(endpoint)
             headers = get_headers(method.upper(), request_path, body)
             
-            # 요청 실행
+            # 요청 실행 (공유 커넥션 풀)
             if method.upper() == 'GET':
-                if params:
-                    response = requests.get(
-                        base_url, 
-                        headers=headers, 
-                        params=params,
-                        timeout=CONNECTION_CONFIG['request_timeout']
-                    )
-                else:
-                    response = requests.get(
-                        base_url, 
-                        headers=headers, 
-                        timeout=CONNECTION_CONFIG['request_timeout']
-                    )
+                response = http_request(
+                    'GET',
+                    base_url, 
+                    headers=headers, 
+                    params=params or None,
+                    timeout=CONNECTION_CONFIG['request_timeout'],
+                    acquire_token=False
+                )
             elif method.upper() == 'POST':
-                response = requests.post(
+                response = http_request(
+                    'POST',
                     base_url, 
                     headers=headers, 
                     data=body, 
-                    timeout=CONNECTION_CONFIG['request_timeout']
+                    timeout=CONNECTION_CONFIG['request_timeout'],
+                    acquire_token=False
                 )
             elif method.upper() == 'DELETE':
-                response = requests.delete(
+                response = http_request(
+                    'DELETE',
                     base_url, 
                     headers=headers, 
-                    timeout=CONNECTION_CONFIG['request_timeout']
+                    timeout=CONNECTION_CONFIG['request_timeout'],
+                    acquire_token=False
                 )
             else:
                 print(f"❌ 지원하지 않는 HTTP 메서드: {method}")
@@ -479,7 +638,7 @@ def test_api_connection() -> bool:
     """API 연결 테스트"""
     try:
         # Public API 테스트
-        response = requests.get(f"{API_BASE_URL}/api/v5/public/time", timeout=10)
+        response = http_request("GET", f"{API_BASE_URL}/api/v5/public/time", timeout=10)
         if response.status_code != 200:
             print(f"❌ Public API 연결 실패: {response.status_code}")
             return False
@@ -14,7 +14,7 @@ from typing import Dict, Optional
 from PyQt5.QtCore import QThread, pyqtSignal
 
 try:
-    from config import make_api_request
+    from okx.async_client import cached_api_request
     CONFIG_AVAILABLE = True
 except ImportError:
     CONFIG_AVAILABLE = False
@@ -210,7 +210,8 @@ class TradingDataThread(QThread):
         try:
             symbol = 'BTC-USDT-SWAP'
             
-            response = make_api_request(
+            # 엔진/에이전트의 같은 ticker 요청과 병합
+            response = cached_api_request(
                 'GET',
                 '/api/v5/market/ticker',
                 params={'instId': symbol}
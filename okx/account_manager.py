@@ -13,12 +13,11 @@
 """
 
 import json
-import requests
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from config import (
     API_KEY, API_SECRET, PASSPHRASE, API_BASE_URL,
-    make_api_request
+    make_api_request, get_http_session
 )
 
 
@@ -34,13 +33,17 @@ class AccountManager:
         self.secret_key = API_SECRET
         self.passphrase = PASSPHRASE
         self.base_url = API_BASE_URL
-        self.session = requests.Session()
         self.verbose = verbose
         
         # verbose 모드에서만 초기화 로그
         if self.verbose:
             print("✅ 계좌 관리자 초기화 완료")
     
+    @property
+    def session(self):
+        """공유 HTTP 세션 (configure_http_session()으로 교체될 수 있으므로 매번 조회)"""
+        return get_http_session()
+    
     def _log(self, message: str, force: bool = False):
         """로그 출력"""
         if force or self.verbose:
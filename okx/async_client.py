@@ -0,0 +1,309 @@
+# okx/async_client.py
+"""
+비동기 OKX REST 클라이언트 (요청 병합 + 엔드포인트별 TTL 캐시)
+
+GUI, 에이전트 팀, 자동매매 엔진이 한 프로세스에서 같은 시세 엔드포인트를
+각자 폴링하면 동일한 요청이 중복으로 나가므로:
+
+- 진행 중인 동일 GET 요청(메서드 + 엔드포인트 + 파라미터)은 하나로 병합해 결과를 함께 받음
+- 성공 응답은 엔드포인트별 TTL 동안 캐시 (주문/계정 등 TTL이 없는 엔드포인트는 병합만)
+- 실제 HTTP 호출은 config.make_api_request(공유 커넥션 풀, 재시도, 서명)를 스레드 풀에서 실행
+
+기존 동기 호출부는 cached_api_request()를 make_api_request 대신 쓰면 됨
+(백그라운드 스레드의 이벤트 루프에서 처리되므로 여러 스레드의 요청도 병합됨)
+
+캐시된 응답 딕셔너리는 호출부끼리 공유하므로 읽기 전용으로 사용해야 함
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config import make_api_request, CONNECTION_CONFIG
+
+
+# 엔드포인트별 캐시 TTL (초) - 없는 엔드포인트는 캐시하지 않고 병합만
+DEFAULT_TTLS: Dict[str, float] = {
+    "/api/v5/market/ticker": 1.0,
+    "/api/v5/market/tickers": 1.0,
+    "/api/v5/market/books": 0.5,
+    "/api/v5/market/candles": 2.0,
+    "/api/v5/market/history-candles": 60.0,
+    "/api/v5/public/instruments": 3600.0,
+    "/api/v5/public/funding-rate": 30.0,
+}
+
+# 캐시 최대 항목 수 (초과 시 만료 항목 정리)
+MAX_CACHE_ENTRIES = 1024
+
+
+def _request_key(method: str, endpoint: str, params: Optional[Dict]) -> Tuple:
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return method.upper(), endpoint, items
+
+
+class AsyncOKXClient:
+    """
+    asyncio 기반 OKX REST 클라이언트
+    
+    사용법:
+        client = AsyncOKXClient()
+        ticker = await client.request("GET", "/api/v5/market/ticker", params={"instId": "BTC-USDT-SWAP"})
+        price = await client.get_last_price("BTC-USDT-SWAP")
+    """
+    
+    def __init__(self,
+                 ttls: Dict[str, float] = None,
+                 max_workers: int = None,
+                 request_fn: Callable[..., Optional[Dict]] = None):
+        """
+        Args:
+            ttls: 엔드포인트별 캐시 TTL (초), None이면 DEFAULT_TTLS
+            max_workers: HTTP 호출 스레드 수 (None이면 커넥션 풀 크기)
+            request_fn: 실제 요청 함수 (make_api_request와 같은 시그니처)
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._request_fn = request_fn or make_api_request
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or CONNECTION_CONFIG["pool_maxsize"],
+            thread_name_prefix="OKXClient",
+        )
+        
+        # 이벤트 루프 스레드에서만 접근
+        self._cache: Dict[Tuple, Tuple[float, Dict]] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        
+        # 통계
+        self.stats = {"requests": 0, "upstream": 0, "cache_hits": 0, "coalesced": 0, "errors": 0}
+    
+    def _cached(self, key: Tuple) -> Optional[Dict]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires < time.monotonic():
+            del self._cache[key]
+            return None
+        return response
+    
+    def _store(self, key: Tuple, ttl: float, response: Dict):
+        now = time.monotonic()
+        if len(self._cache) >= MAX_CACHE_ENTRIES:
+            for k in [k for k, (exp, _) in self._cache.items() if exp < now]:
+                del self._cache[k]
+            if len(self._cache) >= MAX_CACHE_ENTRIES:
+                self._cache.clear()
+        self._cache[key] = (now + ttl, response)
+    
+    async def request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None,
+                      ttl: float = None) -> Optional[Dict]:
+        """
+        API 요청 (GET은 병합/캐시, 그 외는 바로 실행)
+        
+        Args:
+            method: HTTP 메서드
+            endpoint: API 엔드포인트
+            params: 쿼리 파라미터
+            data: 요청 바디 (POST)
+            ttl: 캐시 TTL (초) - None이면 엔드포인트 기본값, 0이면 캐시하지 않음
+        
+        Returns:
+            API 응답 딕셔너리 (실패 시 None)
+        """
+        self.stats["requests"] += 1
+        loop = asyncio.get_running_loop()
+        call = partial(self._request_fn, method, endpoint, params, data)
+        
+        if method.upper() != "GET":
+            self.stats["upstream"] += 1
+            return await loop.run_in_executor(self._executor, call)
+        
+        key = _request_key(method, endpoint, params)
+        ttl = self.ttls.get(endpoint, 0.0) if ttl is None else ttl
+        
+        if ttl > 0:
+            response = self._cached(key)
+            if response is not None:
+                self.stats["cache_hits"] += 1
+                return response
+        
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            # 대기 중인 쪽이 취소돼도 공유 요청은 계속 진행
+            return await asyncio.shield(future)
+        
+        future = loop.create_future()
+        self._inflight[key] = future
+        self.stats["upstream"] += 1
+        try:
+            response = await loop.run_in_executor(self._executor, call)
+        except asyncio.CancelledError:
+            # 선행 요청이 취소되면 병합 대기자도 함께 풀어 줌
+            future.cancel()
+            raise
+        except Exception as e:
+            self.stats["errors"] += 1
+            future.set_exception(e)
+            # 병합 대기자가 없으면 "예외가 회수되지 않음" 경고가 뜨지 않도록 소비
+            future.exception()
+            raise
+        else:
+            if ttl > 0 and response is not None and response.get("code") == "0":
+                self._store(key, ttl, response)
+            elif response is None:
+                self.stats["errors"] += 1
+            future.set_result(response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+    
+    # ==================== 시세 헬퍼 ====================
+    
+    async def get_ticker(self, inst_id: str) -> Optional[Dict]:
+        """현재가 정보 (OKX ticker 원본 딕셔너리)"""
+        result = await self.request("GET", "/api/v5/market/ticker", params={"instId": inst_id})
+        if result and result.get("code") == "0" and result.get("data"):
+            return result["data"][0]
+        return None
+    
+    async def get_last_price(self, inst_id: str) -> Optional[float]:
+        """현재가"""
+        ticker = await self.get_ticker(inst_id)
+        if ticker:
+            price = float(ticker.get("last", 0) or 0)
+            return price if price > 0 else None
+        return None
+    
+    async def get_candles(self, inst_id: str, bar: str, limit: int = 100) -> Optional[list]:
+        """캔들 원본 목록 (최신순, [ts, o, h, l, c, vol, volCcy, volCcyQuote, confirm])"""
+        result = await self.request(
+            "GET", "/api/v5/market/candles",
+            params={"instId": inst_id, "bar": bar, "limit": str(limit)},
+        )
+        if result and result.get("code") == "0":
+            return result.get("data", [])
+        return None
+    
+    def clear_cache(self):
+        self._cache.clear()
+    
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+class OKXClient:
+    """
+    AsyncOKXClient 동기 파사드
+    
+    전용 이벤트 루프 스레드에서 비동기 클라이언트를 실행하고
+    호출 스레드는 결과를 기다림 → 여러 스레드의 동일 요청이 하나로 병합됨
+    """
+    
+    def __init__(self, ttls: Dict[str, float] = None, max_workers: int = None,
+                 request_fn: Callable[..., Optional[Dict]] = None):
+        self._client_args = (ttls, max_workers, request_fn)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[AsyncOKXClient] = None
+        self._start_lock = threading.Lock()
+    
+    def _ensure_started(self):
+        if self._loop is not None:
+            return
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            
+            def _run():
+                asyncio.set_event_loop(loop)
+                ready.set()
+                loop.run_forever()
+            
+            self._client = AsyncOKXClient(*self._client_args)
+            self._thread = threading.Thread(target=_run, name="OKXClientLoop", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+    
+    @property
+    def client(self) -> AsyncOKXClient:
+        """내부 비동기 클라이언트 (같은 루프에서 await할 때 사용)"""
+        self._ensure_started()
+        return self._client
+    
+    def _call(self, coro, timeout: float = None):
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        # make_api_request 재시도를 모두 기다릴 수 있는 시간
+        if timeout is None:
+            timeout = (CONNECTION_CONFIG["request_timeout"] + CONNECTION_CONFIG["retry_delay"]) \
+                * CONNECTION_CONFIG["max_retries"] + 5
+        return future.result(timeout)
+    
+    def request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None,
+                ttl: float = None) -> Optional[Dict]:
+        """make_api_request와 같은 시그니처/반환값 (GET은 병합/캐시)"""
+        self._ensure_started()
+        return self._call(self._client.request(method, endpoint, params, data, ttl))
+    
+    def get_ticker(self, inst_id: str) -> Optional[Dict]:
+        self._ensure_started()
+        return self._call(self._client.get_ticker(inst_id))
+    
+    def get_last_price(self, inst_id: str) -> Optional[float]:
+        self._ensure_started()
+        return self._call(self._client.get_last_price(inst_id))
+    
+    def get_candles(self, inst_id: str, bar: str, limit: int = 100) -> Optional[list]:
+        self._ensure_started()
+        return self._call(self._client.get_candles(inst_id, bar, limit))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        if self._client is None:
+            return {}
+        return dict(self._client.stats)
+    
+    def clear_cache(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._client.clear_cache)
+    
+    def close(self):
+        """이벤트 루프 스레드 종료"""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._client.close()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+            self._client = None
+
+
+_shared_client: Optional[OKXClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_okx_client() -> OKXClient:
+    """프로세스 공유 OKX 클라이언트"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = OKXClient()
+    return _shared_client
+
+
+def cached_api_request(method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Optional[Dict]:
+    """
+    make_api_request 대체 함수 (공유 클라이언트로 병합/캐시)
+    
+    응답은 다른 호출부와 공유될 수 있으므로 수정하지 말 것
+    """
+    return get_okx_client().request(method, endpoint, params, data)
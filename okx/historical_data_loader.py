@@ -15,12 +15,107 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import pandas as pd
 
+from okx.rate_limiter import get_rate_limiter, PRIORITY_LOW
+
 
 def ema(series: pd.Series, period: int) -> pd.Series:
     """지수이동평균 계산"""
     return series.ewm(span=period, adjust=False).mean()
 
 
+# 타임프레임별 봉 간격 (ms) - 갭 감지용
+TIMEFRAME_MS = {'1m': 60_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+                '1H': 3_600_000, '4H': 14_400_000, '1D': 86_400_000}
+
+
+class IncrementalEMAState:
+    """
+    심볼별 증분 EMA 상태
+    
+    - confirmed: 직전 확정봉까지의 EMA (봉 마감 시에만 갱신)
+    - live: 진행 중인 봉의 잠정 EMA (틱마다 confirmed에서 O(1)로 재계산)
+    - 전체 재계산은 초기 로드 또는 갭 감지 시에만 수행
+    """
+    
+    def __init__(self, periods: Dict[str, int], interval_ms: int):
+        self.periods = periods
+        self.interval_ms = interval_ms
+        self.alphas = {name: 2.0 / (period + 1) for name, period in periods.items()}
+        
+        self.confirmed: Dict[str, float] = {}
+        self.live: Dict[str, float] = {}
+        self.bar: Dict[str, Any] = {}  # 진행 중인 봉 (timestamp, datetime, OHLCV)
+        self.dirty = False             # DataFrame 마지막 행에 아직 반영되지 않은 변경 여부
+    
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, periods: Dict[str, int], interval_ms: int) -> Optional['IncrementalEMAState']:
+        """EMA가 계산된 DataFrame의 마지막 두 행에서 상태 생성"""
+        if df is None or len(df) < 2:
+            return None
+        
+        state = cls(periods, interval_ms)
+        prev = df.iloc[-2]
+        curr = df.iloc[-1]
+        state.confirmed = {name: float(prev[name]) for name in periods}
+        state.live = {name: float(curr[name]) for name in periods}
+        state.bar = {
+            'timestamp': int(curr['timestamp']),
+            'datetime': curr.get('datetime'),
+            'open': float(curr['open']),
+            'high': float(curr['high']),
+            'low': float(curr['low']),
+            'close': float(curr['close']),
+            'volume': float(curr['volume']) if 'volume' in curr else 0.0,
+        }
+        return state
+    
+    @staticmethod
+    def _step(prev_ema: float, alpha: float, price: float) -> float:
+        # pandas ewm(adjust=False)와 같은 연산 순서 (전체 재계산 결과와 비트 단위로 일치)
+        old_wt = 1.0 - alpha
+        return (old_wt * prev_ema + alpha * price) / (old_wt + alpha)
+    
+    def _recalc_live(self):
+        price = self.bar['close']
+        step = self._step
+        self.live = {name: step(self.confirmed[name], alpha, price) for name, alpha in self.alphas.items()}
+        self.dirty = True
+    
+    def is_next_bar(self, timestamp: int) -> bool:
+        return timestamp == self.bar['timestamp'] + self.interval_ms
+    
+    def update_tick(self, price: float):
+        """진행 중인 봉에 틱 반영 (잠정 EMA)"""
+        bar = self.bar
+        bar['close'] = price
+        if price > bar['high']:
+            bar['high'] = price
+        if price < bar['low']:
+            bar['low'] = price
+        self._recalc_live()
+    
+    def update_bar(self, candle: Dict):
+        """같은 타임스탬프의 봉 데이터로 진행 중인 봉 갱신"""
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            if col in candle:
+                self.bar[col] = float(candle[col])
+        self._recalc_live()
+    
+    def commit(self, candle: Dict, dt=None):
+        """진행 중인 봉을 확정하고 다음 봉 시작"""
+        self.confirmed = self.live
+        self.bar = {
+            'timestamp': int(candle['timestamp']),
+            'datetime': dt,
+            'open': float(candle.get('open', candle['close'])),
+            'high': float(candle.get('high', candle['close'])),
+            'low': float(candle.get('low', candle['close'])),
+            'close': float(candle['close']),
+            'volume': float(candle.get('volume', 0.0)),
+        }
+        self._recalc_live()
+
+
 class HistoricalDataLoader:
     """OKX API를 통해 과거 캔들 데이터 로드"""
     
@@ -33,9 +128,23 @@ class HistoricalDataLoader:
         'ema_200': 200,
     }
     
+    # 전략용 별칭 (별칭 컬럼 → 원본 EMA 컬럼)
+    EMA_ALIASES = {
+        'ema_trend_fast': 'ema_150',
+        'ema_trend_slow': 'ema_200',
+        'ema_entry_fast': 'ema_20',
+        'ema_entry_slow': 'ema_50',
+        'ema_exit_fast': 'ema_20',
+        'ema_exit_slow': 'ema_100',
+    }
+    
+    MAX_CACHED_CANDLES = 1000
+    
     def __init__(self, account_manager=None):
         self.account_manager = account_manager
         self.candle_cache: Dict[str, pd.DataFrame] = {}
+        self.ema_states: Dict[str, IncrementalEMAState] = {}
+        self.timeframes: Dict[str, str] = {}
         
     def load_historical_candles_sync(
         self,
@@ -72,7 +181,8 @@ class HistoricalDataLoader:
             df = self._process_dataframe(df)
             df = self.calculate_emas(df)
             
-            self.candle_cache[symbol] = df
+            self.timeframes[symbol] = timeframe
+            self._set_cache(symbol, df)
             print(f"✅ {len(df)}개 캔들 로드 완료 (EMA 계산됨)")
             return df
             
@@ -95,6 +205,8 @@ class HistoricalDataLoader:
                 if after:
                     params['after'] = after
                 
+                # SDK 호출은 http_request를 거치지 않으므로 직접 토큰 획득 (백그라운드 로드 = 낮은 우선순위)
+                get_rate_limiter().acquire("market", PRIORITY_LOW)
                 result = market_api.get_candlesticks(**params)
                 
                 if result and result.get('code') == '0':
@@ -114,7 +226,6 @@ class HistoricalDataLoader:
                     
                     after = data[-1][0]
                     print(f"  로드 중... {len(all_candles)}/{needed_candles}")
-                    time.sleep(0.2)
                 else:
                     print(f"⚠️ API 응답 오류: {result}")
                     break
@@ -180,57 +291,111 @@ class HistoricalDataLoader:
             df[name] = ema(close, period)
         
         # 전략용 별칭
-        df['ema_trend_fast'] = df['ema_150']
-        df['ema_trend_slow'] = df['ema_200']
-        df['ema_entry_fast'] = df['ema_20']
-        df['ema_entry_slow'] = df['ema_50']
-        df['ema_exit_fast'] = df['ema_20']
-        df['ema_exit_slow'] = df['ema_100']
+        for alias, name in self.EMA_ALIASES.items():
+            df[alias] = df[name]
         
         return df
     
+    # ---------- 증분 EMA 상태 ----------
+    def _set_cache(self, symbol: str, df: pd.DataFrame):
+        """전체 재계산된 DataFrame 저장 및 증분 상태 재구성"""
+        self.candle_cache[symbol] = df
+        interval_ms = TIMEFRAME_MS.get(self.timeframes.get(symbol, '30m'), TIMEFRAME_MS['30m'])
+        state = IncrementalEMAState.from_dataframe(df, self.EMA_PERIODS, interval_ms)
+        if state is None:
+            self.ema_states.pop(symbol, None)
+        else:
+            self.ema_states[symbol] = state
+    
+    def _sync_live_row(self, symbol: str):
+        """증분 상태의 진행 중인 봉을 DataFrame 마지막 행에 반영 (읽기 시점에만)"""
+        state = self.ema_states.get(symbol)
+        df = self.candle_cache.get(symbol)
+        if state is None or df is None or not state.dirty:
+            return
+        
+        values = {col: state.bar[col] for col in ('open', 'high', 'low', 'close', 'volume') if col in df.columns}
+        values.update(state.live)
+        for alias, name in self.EMA_ALIASES.items():
+            values[alias] = state.live[name]
+        
+        cols = [df.columns.get_loc(c) for c in values]
+        df.iloc[-1, cols] = list(values.values())
+        state.dirty = False
+    
     def get_latest_strategy_data(self, symbol: str = "BTC-USDT-SWAP") -> Optional[Dict[str, Any]]:
         """캐시된 데이터에서 최신 전략용 데이터 반환"""
-        df = self.candle_cache.get(symbol)
-        if df is None or len(df) < 2:
+        state = self.ema_states.get(symbol)
+        if state is None:
             return None
         
-        curr = df.iloc[-1]
-        prev = df.iloc[-2]
+        curr = state.live
+        prev = state.confirmed
         
         return {
-            'timestamp': curr.get('timestamp'),
-            'datetime': curr.get('datetime'),
-            'close': float(curr['close']),
-            'ema_trend_fast': float(curr['ema_150']),
-            'ema_trend_slow': float(curr['ema_200']),
-            'ema_20': float(curr['ema_20']),
-            'ema_50': float(curr['ema_50']),
-            'ema_100': float(curr['ema_100']),
-            'ema_150': float(curr['ema_150']),
-            'ema_200': float(curr['ema_200']),
-            'curr_entry_fast': float(curr['ema_20']),
-            'curr_entry_slow': float(curr['ema_50']),
-            'prev_entry_fast': float(prev['ema_20']),
-            'prev_entry_slow': float(prev['ema_50']),
-            'curr_exit_fast': float(curr['ema_20']),
-            'curr_exit_slow': float(curr['ema_100']),
-            'prev_exit_fast': float(prev['ema_20']),
-            'prev_exit_slow': float(prev['ema_100']),
+            'timestamp': state.bar['timestamp'],
+            'datetime': state.bar['datetime'],
+            'close': state.bar['close'],
+            'ema_trend_fast': curr['ema_150'],
+            'ema_trend_slow': curr['ema_200'],
+            'ema_20': curr['ema_20'],
+            'ema_50': curr['ema_50'],
+            'ema_100': curr['ema_100'],
+            'ema_150': curr['ema_150'],
+            'ema_200': curr['ema_200'],
+            'curr_entry_fast': curr['ema_20'],
+            'curr_entry_slow': curr['ema_50'],
+            'prev_entry_fast': prev['ema_20'],
+            'prev_entry_slow': prev['ema_50'],
+            'curr_exit_fast': curr['ema_20'],
+            'curr_exit_slow': curr['ema_100'],
+            'prev_exit_fast': prev['ema_20'],
+            'prev_exit_slow': prev['ema_100'],
         }
     
     def add_new_candle(self, symbol: str, candle_data: Dict) -> bool:
-        """새 캔들 추가 및 EMA 재계산"""
+        """
+        새 캔들 추가
+        - 같은 타임스탬프: 진행 중인 봉 갱신 (O(1))
+        - 바로 다음 타임스탬프: 진행 중인 봉 확정 후 새 봉 시작 (O(1) EMA)
+        - 그 외 (갭/역순): EMA 전체 재계산
+        """
         try:
             df = self.candle_cache.get(symbol)
             if df is None:
                 return False
             
+            state = self.ema_states.get(symbol)
+            new_ts = candle_data.get('timestamp')
+            
+            if state is not None and new_ts == state.bar['timestamp']:
+                state.update_bar(candle_data)
+                return True
+            
+            if state is not None and new_ts is not None and state.is_next_bar(int(new_ts)):
+                self._sync_live_row(symbol)
+                dt = pd.to_datetime(new_ts, unit='ms')
+                state.commit(candle_data, dt)
+                
+                new_row = {col: state.bar[col] for col in ('timestamp', 'open', 'high', 'low', 'close', 'volume')}
+                new_row['datetime'] = dt
+                new_row.update(state.live)
+                for alias, name in self.EMA_ALIASES.items():
+                    new_row[alias] = state.live[name]
+                
+                df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+                if len(df) > self.MAX_CACHED_CANDLES:
+                    df = df.iloc[-self.MAX_CACHED_CANDLES:].reset_index(drop=True)
+                self.candle_cache[symbol] = df
+                state.dirty = False
+                return True
+            
+            # 갭 감지 또는 상태 없음 → 전체 재계산
+            self._sync_live_row(symbol)
             new_row = pd.DataFrame([candle_data])
             new_row['datetime'] = pd.to_datetime(new_row['timestamp'], unit='ms')
             
             last_ts = df.iloc[-1]['timestamp']
-            new_ts = candle_data.get('timestamp')
             
             if last_ts == new_ts:
                 for col in ['open', 'high', 'low', 'close', 'volume']:
@@ -239,19 +404,25 @@ class HistoricalDataLoader:
             else:
                 df = pd.concat([df, new_row], ignore_index=True)
             
-            if len(df) > 1000:
-                df = df.iloc[-1000:]
+            if len(df) > self.MAX_CACHED_CANDLES:
+                df = df.iloc[-self.MAX_CACHED_CANDLES:]
             
             df = self.calculate_emas(df)
-            self.candle_cache[symbol] = df
+            self._set_cache(symbol, df)
             return True
         except Exception as e:
             print(f"❌ 캔들 추가 오류: {e}")
             return False
     
     def update_current_price(self, symbol: str, price: float) -> bool:
-        """현재 가격만 업데이트"""
+        """현재 가격만 업데이트 (진행 중인 봉의 잠정 EMA를 O(1)로 갱신)"""
         try:
+            state = self.ema_states.get(symbol)
+            if state is not None:
+                state.update_tick(float(price))
+                return True
+            
+            # 증분 상태가 없으면 (캔들 2개 미만) 전체 재계산
             df = self.candle_cache.get(symbol)
             if df is None or len(df) == 0:
                 return False
@@ -264,7 +435,7 @@ class HistoricalDataLoader:
                 df.iloc[-1, df.columns.get_loc('low')] = price
             
             df = self.calculate_emas(df)
-            self.candle_cache[symbol] = df
+            self._set_cache(symbol, df)
             return True
         except Exception as e:
             print(f"❌ 가격 업데이트 오류: {e}")
@@ -272,6 +443,7 @@ class HistoricalDataLoader:
     
     def get_cached_dataframe(self, symbol: str = "BTC-USDT-SWAP") -> Optional[pd.DataFrame]:
         """캐시된 DataFrame 반환"""
+        self._sync_live_row(symbol)
         return self.candle_cache.get(symbol)
 
 
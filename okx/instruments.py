@@ -0,0 +1,279 @@
+# okx/instruments.py
+"""
+OKX 상품(instrument) 스펙 캐시
+
+lot/tick/ctVal/최대 레버리지 등은 거의 바뀌지 않으므로 /api/v5/public/instruments 결과를
+메모리에 두고 TTL이 지난 항목만 다시 조회 (조회 실패 시 이전 스펙 유지)
+
+- InstrumentSpecCache: 심볼별로 필요할 때 조회
+- InstrumentRegistry: 전체 SWAP 목록을 한 번에 받아 두고 백그라운드 스레드에서 주기적으로 갱신
+  (주문 수량 계산 등은 REST 왕복 없이 메모리에서 응답)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.logger import log_system, log_error
+
+
+# 스펙 유효 시간 (초)
+DEFAULT_SPEC_TTL = 3600.0
+
+# 조회 실패 후 다시 시도하기까지 대기 (초) - 실패할 때마다 REST를 두드리지 않도록
+RETRY_DELAY = 30.0
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    """상품 스펙 (OKX instruments 응답에서 필요한 값만)"""
+    inst_id: str
+    ct_val: float = 1.0          # 계약 가치 (기초자산 수량)
+    ct_mult: float = 1.0         # 계약 승수
+    lot_size: float = 1.0        # 주문 수량 단위 (계약)
+    min_size: float = 1.0        # 최소 주문 수량 (계약)
+    tick_size: float = 0.01      # 가격 단위
+    max_leverage: float = 0.0    # 최대 레버리지 (0이면 알 수 없음)
+    settle_ccy: str = "USDT"
+    state: str = "live"
+    
+    @classmethod
+    def from_okx(cls, raw: Dict) -> "InstrumentSpec":
+        def f(key: str, default: float) -> float:
+            try:
+                return float(raw.get(key) or default)
+            except (TypeError, ValueError):
+                return default
+        
+        return cls(
+            inst_id=raw.get("instId", ""),
+            ct_val=f("ctVal", 1.0),
+            ct_mult=f("ctMult", 1.0),
+            lot_size=f("lotSz", 1.0),
+            min_size=f("minSz", 1.0),
+            tick_size=f("tickSz", 0.01),
+            max_leverage=f("lever", 0.0),
+            settle_ccy=raw.get("settleCcy") or "USDT",
+            state=raw.get("state") or "live",
+        )
+    
+    @property
+    def is_live(self) -> bool:
+        return self.state == "live"
+
+
+def _fetch_instrument(inst_id: str, inst_type: str = "SWAP") -> Optional[Dict]:
+    """/api/v5/public/instruments 단건 조회 (공유 REST 클라이언트)"""
+    from okx.async_client import cached_api_request
+    result = cached_api_request(
+        "GET", "/api/v5/public/instruments",
+        params={"instType": inst_type, "instId": inst_id},
+    )
+    if result and result.get("code") == "0" and result.get("data"):
+        return result["data"][0]
+    return None
+
+
+def _fetch_instruments(inst_type: str = "SWAP") -> Optional[List[Dict]]:
+    """/api/v5/public/instruments 전체 목록 조회 (주기 갱신이므로 응답 캐시는 거치지 않음)"""
+    from okx.async_client import get_okx_client
+    result = get_okx_client().request(
+        "GET", "/api/v5/public/instruments", params={"instType": inst_type}, ttl=0,
+    )
+    if result and result.get("code") == "0":
+        return result.get("data") or None
+    return None
+
+
+class InstrumentSpecCache:
+    """
+    심볼별 스펙 캐시 (만료 시 해당 심볼만 다시 조회)
+    
+    사용법:
+        specs = InstrumentSpecCache()
+        spec = specs.get("BTC-USDT-SWAP")
+    """
+    
+    def __init__(self, ttl: float = DEFAULT_SPEC_TTL,
+                 fetch_fn: Callable[[str], Optional[Dict]] = None):
+        """
+        Args:
+            ttl: 스펙 유효 시간 (초)
+            fetch_fn: inst_id → OKX instruments 원본 딕셔너리 (None이면 REST 조회)
+        """
+        self.ttl = ttl
+        self._fetch_fn = fetch_fn or _fetch_instrument
+        # inst_id → (만료 monotonic 시각, 스펙)
+        self._specs: Dict[str, Tuple[float, InstrumentSpec]] = {}
+        self._retry_at: Dict[str, float] = {}  # 스펙 없이 조회 실패한 심볼 → 재시도 시각
+        self._lock = threading.Lock()
+    
+    def put(self, spec: InstrumentSpec, ttl: float = None):
+        """스펙 직접 등록 (일괄 로드 / 테스트용)"""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._specs[spec.inst_id] = (expires, spec)
+    
+    def get(self, inst_id: str) -> Optional[InstrumentSpec]:
+        """
+        스펙 조회 (유효하면 메모리에서 바로 반환)
+        
+        만료됐으면 다시 조회하고, 실패하면 만료된 스펙이라도 반환
+        """
+        entry = self._specs.get(inst_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        if entry is None and self._retry_at.get(inst_id, 0.0) > time.monotonic():
+            return None
+        return self._refresh(inst_id, entry)
+    
+    def _refresh(self, inst_id: str, stale: Optional[Tuple[float, InstrumentSpec]]) -> Optional[InstrumentSpec]:
+        with self._lock:
+            # 다른 스레드가 먼저 갱신했으면 그대로 사용
+            entry = self._specs.get(inst_id)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            try:
+                raw = self._fetch_fn(inst_id)
+            except Exception:
+                raw = None
+            if raw:
+                spec = InstrumentSpec.from_okx(raw)
+                self.put(spec)
+                self._retry_at.pop(inst_id, None)
+                return spec
+            
+            # 실패: 이전 스펙은 잠시 더 사용, 스펙이 없으면 재시도 시각까지 조회 생략
+            if stale is not None:
+                self.put(stale[1], ttl=RETRY_DELAY)
+                return stale[1]
+            self._retry_at[inst_id] = time.monotonic() + RETRY_DELAY
+            return None
+    
+    def peek(self, inst_id: str) -> Optional[InstrumentSpec]:
+        """만료 여부와 관계없이 캐시된 스펙 (조회하지 않음)"""
+        entry = self._specs.get(inst_id)
+        return entry[1] if entry is not None else None
+    
+    def clear(self):
+        self._specs.clear()
+        self._retry_at.clear()
+
+
+class InstrumentRegistry(InstrumentSpecCache):
+    """
+    상품 스펙 레지스트리 (전체 목록 일괄 로드 + 백그라운드 갱신)
+    
+    만료 전에 전체 목록을 다시 받으므로 정상 상태에서는 get()이 항상 메모리에서 응답.
+    일괄 로드가 안 됐거나 목록에 없는 심볼만 InstrumentSpecCache처럼 단건 조회
+    
+    사용법:
+        registry = InstrumentRegistry()
+        registry.start()                      # 즉시 로드 후 refresh_interval마다 갱신
+        spec = registry.get("BTC-USDT-SWAP")
+    """
+    
+    def __init__(self, inst_type: str = "SWAP", ttl: float = DEFAULT_SPEC_TTL,
+                 refresh_interval: float = None,
+                 fetch_fn: Callable[[str], Optional[Dict]] = None,
+                 fetch_all_fn: Callable[[str], Optional[List[Dict]]] = None):
+        """
+        Args:
+            inst_type: 상품 유형
+            ttl: 스펙 유효 시간 (초)
+            refresh_interval: 전체 목록 갱신 주기 (초, None이면 ttl의 절반)
+            fetch_fn: 단건 조회 함수 (None이면 REST)
+            fetch_all_fn: inst_type → OKX instruments 원본 목록 (None이면 REST)
+        """
+        super().__init__(ttl, fetch_fn)
+        self.inst_type = inst_type
+        self.refresh_interval = refresh_interval or ttl / 2
+        self._fetch_all_fn = fetch_all_fn or _fetch_instruments
+        self._next_load_at = 0.0      # 다음 일괄 로드 허용 시각 (monotonic)
+        self.loaded_count = 0
+        self.last_loaded: Optional[float] = None  # 마지막 일괄 로드 성공 시각 (time.time())
+        
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+    
+    def load_all(self) -> int:
+        """
+        전체 목록 일괄 로드
+        
+        Returns:
+            로드한 상품 수 (실패 시 0, 기존 스펙은 유지)
+        """
+        try:
+            raws = self._fetch_all_fn(self.inst_type)
+        except Exception as e:
+            log_error(f"상품 목록 조회 오류 ({self.inst_type})", e)
+            raws = None
+        
+        now = time.monotonic()
+        if not raws:
+            self._next_load_at = now + RETRY_DELAY
+            return 0
+        
+        expires = now + self.ttl
+        loaded = {}
+        for raw in raws:
+            spec = InstrumentSpec.from_okx(raw)
+            if spec.inst_id:
+                loaded[spec.inst_id] = (expires, spec)
+        self._specs.update(loaded)
+        
+        self._next_load_at = now + self.refresh_interval
+        self.loaded_count = len(loaded)
+        self.last_loaded = time.time()
+        return len(loaded)
+    
+    def _refresh(self, inst_id: str, stale: Optional[Tuple[float, InstrumentSpec]]) -> Optional[InstrumentSpec]:
+        # 일괄 로드가 필요한 시점이면 단건 대신 전체 목록을 받음
+        with self._lock:
+            entry = self._specs.get(inst_id)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            if time.monotonic() >= self._next_load_at and self.load_all():
+                entry = self._specs.get(inst_id)
+                if entry is not None:
+                    return entry[1]
+        return super()._refresh(inst_id, stale)
+    
+    def start(self) -> bool:
+        """백그라운드 갱신 시작 (이미 실행 중이면 False)"""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="InstrumentRegistry", daemon=True)
+        self._thread.start()
+        return True
+    
+    def _refresh_loop(self):
+        while not self._stop_event.is_set():
+            with self._lock:
+                if time.monotonic() >= self._next_load_at:
+                    count = self.load_all()
+                    if count:
+                        log_system(f"상품 스펙 갱신: {self.inst_type} {count}개")
+            wait = max(self._next_load_at - time.monotonic(), 1.0)
+            self._stop_event.wait(wait)
+    
+    def stop(self):
+        """백그라운드 갱신 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    def get_status(self) -> Dict:
+        return {
+            'inst_type': self.inst_type,
+            'instruments': len(self._specs),
+            'loaded_count': self.loaded_count,
+            'last_loaded': self.last_loaded,
+            'background_refresh': self._thread is not None and self._thread.is_alive(),
+        }
+
+
+# 프로세스 공유 인스턴스 (SWAP)
+instrument_specs = InstrumentRegistry()
@@ -0,0 +1,307 @@
+# okx/market_feed.py
+"""
+실시간 시장 데이터 피드 (tick → 전략 이벤트)
+
+- WebSocketMarketFeed: OKX WebSocket tickers / candle 채널 구독 후 이벤트 콜백 호출
+- ReplayMarketFeed: 녹화된 원본 메시지(JSONL)를 재생 (오프라인 테스트용)
+
+이벤트 형식 (dict):
+    {'type': 'ticker', 'symbol', 'price', 'ts', 'recv_ts'}
+    {'type': 'candle', 'symbol', 'bar', 'candle': {...}, 'confirmed', 'ts', 'recv_ts'}
+
+녹화 파일 형식 (한 줄에 하나):
+    {"recv_ts": 1700000000.123, "message": "<WebSocket 원본 메시지>"}
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from okx.price_book import LivePriceBook, price_book
+from utils.logger import log_system, log_error
+
+
+PUBLIC_WS_URL = "wss://ws.okx.com:8443/ws/v5/public"
+BUSINESS_WS_URL = "wss://ws.okx.com:8443/ws/v5/business"  # candle 채널
+
+
+def parse_message(message: str, recv_ts: float = None) -> List[Dict]:
+    """
+    OKX public/business WebSocket 메시지 → 이벤트 목록
+    
+    Args:
+        message: 원본 JSON 문자열
+        recv_ts: 수신 시각 (time.time(), None이면 현재 시각)
+    
+    Returns:
+        이벤트 목록 (구독 응답 등 데이터가 없는 메시지는 빈 목록)
+    """
+    data = json.loads(message)
+    if 'data' not in data:
+        return []
+    
+    recv_ts = recv_ts if recv_ts is not None else time.time()
+    arg = data.get('arg', {})
+    channel = arg.get('channel', '')
+    symbol = arg.get('instId')
+    events = []
+    
+    if channel == 'tickers':
+        for ticker in data['data']:
+            price = float(ticker.get('last', 0) or 0)
+            if price <= 0:
+                continue
+            events.append({
+                'type': 'ticker',
+                'symbol': ticker.get('instId', symbol),
+                'price': price,
+                'ts': int(ticker.get('ts', recv_ts * 1000)),
+                'recv_ts': recv_ts,
+            })
+    
+    elif channel.startswith('candle'):
+        bar = channel[len('candle'):]
+        for raw in data['data']:
+            events.append({
+                'type': 'candle',
+                'symbol': symbol,
+                'bar': bar,
+                'candle': {
+                    'timestamp': pd.to_datetime(int(raw[0]), unit='ms'),
+                    'open': float(raw[1]),
+                    'high': float(raw[2]),
+                    'low': float(raw[3]),
+                    'close': float(raw[4]),
+                    'volume': float(raw[5]),
+                },
+                'confirmed': len(raw) <= 8 or raw[8] == "1",
+                'ts': int(raw[0]),
+                'recv_ts': recv_ts,
+            })
+    
+    return events
+
+
+class WebSocketMarketFeed:
+    """
+    OKX WebSocket 시장 데이터 피드
+    
+    tickers는 public, candle 채널은 business 엔드포인트로 구독하고
+    파싱한 이벤트를 on_event 콜백으로 전달 (수신 스레드에서 호출)
+    """
+    
+    def __init__(
+        self,
+        symbols: List[str],
+        bars: List[str] = None,
+        record_path: str = None,
+        reconnect_delay: float = 5.0,
+    ):
+        """
+        Args:
+            symbols: 구독 심볼 목록
+            bars: 구독할 캔들 주기 (예: ['30m', '1m'])
+            record_path: 지정하면 수신한 원본 메시지를 JSONL로 녹화
+            reconnect_delay: 연결 종료 후 재연결 대기 시간 (초)
+        """
+        self.symbols = list(symbols)
+        self.bars = bars or ['30m', '1m']
+        self.record_path = record_path
+        self.reconnect_delay = reconnect_delay
+        
+        self.on_event: Optional[Callable[[Dict], None]] = None
+        self.is_running = False
+        self.received_messages = 0
+        
+        self._apps = []
+        self._threads: List[threading.Thread] = []
+        self._record_file = None
+        self._record_lock = threading.Lock()
+    
+    def _subscriptions(self) -> Dict[str, List[Dict]]:
+        return {
+            PUBLIC_WS_URL: [{'channel': 'tickers', 'instId': s} for s in self.symbols],
+            BUSINESS_WS_URL: [
+                {'channel': f'candle{bar}', 'instId': s} for s in self.symbols for bar in self.bars
+            ],
+        }
+    
+    def start(self) -> bool:
+        """연결 시작 (URL별 수신 스레드)"""
+        import websocket
+        
+        if self.is_running:
+            return False
+        self.is_running = True
+        
+        if self.record_path:
+            self._record_file = open(self.record_path, 'a', encoding='utf-8')
+        
+        for url, args in self._subscriptions().items():
+            if not args:
+                continue
+            thread = threading.Thread(
+                target=self._run_connection, args=(websocket, url, args),
+                name=f"MarketFeed-{url.rsplit('/', 1)[-1]}", daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        
+        log_system(f"시장 데이터 피드 시작: {self.symbols} | 캔들: {self.bars}")
+        return True
+    
+    def _run_connection(self, websocket, url: str, args: List[Dict]):
+        """연결 유지 루프 (끊기면 재연결 후 재구독)"""
+        def on_open(ws):
+            ws.send(json.dumps({'op': 'subscribe', 'args': args}))
+        
+        def on_message(ws, message):
+            self._handle_message(message)
+        
+        def on_error(ws, error):
+            log_error(f"시장 데이터 피드 오류 ({url})", error)
+        
+        while self.is_running:
+            app = websocket.WebSocketApp(url, on_open=on_open, on_message=on_message, on_error=on_error)
+            self._apps.append(app)
+            app.run_forever(ping_interval=20, ping_timeout=10)
+            self._apps.remove(app)
+            if self.is_running:
+                log_system(f"시장 데이터 피드 재연결 대기: {url}")
+                time.sleep(self.reconnect_delay)
+    
+    def _handle_message(self, message: str):
+        recv_ts = time.time()
+        self.received_messages += 1
+        
+        if self._record_file is not None:
+            with self._record_lock:
+                self._record_file.write(json.dumps({'recv_ts': recv_ts, 'message': message}) + "\n")
+        
+        try:
+            events = parse_message(message, recv_ts)
+        except Exception as e:
+            log_error("시장 데이터 메시지 파싱 오류", e)
+            return
+        
+        for event in events:
+            if event['type'] == 'ticker':
+                price_book.update(event['symbol'], event['price'])
+            if self.on_event:
+                self.on_event(event)
+    
+    def stop(self):
+        """연결 종료"""
+        self.is_running = False
+        for app in list(self._apps):
+            try:
+                app.close()
+            except Exception:
+                pass
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+        
+        if self._record_file is not None:
+            with self._record_lock:
+                self._record_file.close()
+                self._record_file = None
+    
+    def get_status(self) -> Dict:
+        return {
+            'running': self.is_running,
+            'symbols': self.symbols,
+            'bars': self.bars,
+            'messages_received': self.received_messages,
+        }
+
+
+class ReplayMarketFeed:
+    """
+    녹화된 WebSocket 메시지 재생 피드
+    
+    WebSocketMarketFeed(record_path=...)로 녹화한 파일을 그대로 재생.
+    speed=0이면 대기 없이 최대 속도, 1.0이면 녹화 당시 간격 그대로 재생
+    
+    재생 가격은 과거 데이터이므로 프로세스 공유 price_book(주문 검증/현재가 조회용)에
+    쓰지 않고 피드 전용 self.price_book에 기록
+    """
+    
+    def __init__(self, path: str, speed: float = 0.0, book: LivePriceBook = None):
+        """
+        Args:
+            path: 녹화 파일 경로 (JSONL)
+            speed: 재생 배속 (0이면 대기 없음)
+            book: 재생 가격을 기록할 가격 저장소 (None이면 전용 인스턴스)
+        """
+        self.path = path
+        self.speed = speed
+        self.price_book = book if book is not None else LivePriceBook()
+        
+        self.on_event: Optional[Callable[[Dict], None]] = None
+        self.is_running = False
+        self.received_messages = 0
+        self.finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> bool:
+        if self.is_running:
+            return False
+        self.is_running = True
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._replay, name="ReplayMarketFeed", daemon=True)
+        self._thread.start()
+        return True
+    
+    def _replay(self):
+        first_recorded = None
+        started = time.monotonic()
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    if not self.is_running:
+                        break
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                    recorded_ts = record['recv_ts']
+                    
+                    if self.speed > 0:
+                        if first_recorded is None:
+                            first_recorded = recorded_ts
+                        delay = (recorded_ts - first_recorded) / self.speed - (time.monotonic() - started)
+                        if delay > 0:
+                            time.sleep(delay)
+                    
+                    self.received_messages += 1
+                    # 지연 시간 측정이 의미 있도록 재생 시점을 수신 시각으로 사용
+                    for event in parse_message(record['message'], time.time()):
+                        if event['type'] == 'ticker':
+                            self.price_book.update(event['symbol'], event['price'])
+                        if self.on_event:
+                            self.on_event(event)
+        except Exception as e:
+            log_error(f"리플레이 오류 ({self.path})", e)
+        finally:
+            self.is_running = False
+            self.finished.set()
+    
+    def wait(self, timeout: float = None) -> bool:
+        """재생 완료까지 대기"""
+        return self.finished.wait(timeout)
+    
+    def stop(self):
+        self.is_running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+    
+    def get_status(self) -> Dict:
+        return {
+            'running': self.is_running,
+            'path': self.path,
+            'messages_received': self.received_messages,
+        }
@@ -5,10 +5,17 @@
 """
 
 from typing import Dict, Any, Optional, Tuple, List
-from datetime import datetime, timedelta
+from collections import deque
 from okx.account_manager import AccountManager
+from okx.instruments import instrument_specs
+from okx.price_book import price_book, get_last_price, DEFAULT_MAX_AGE
 from utils.logger import log_error, log_system
 import re
+import time
+
+# OKX SWAP 심볼 패턴
+_SYMBOL_PATTERN = re.compile(r'^[A-Z]+-[A-Z]+-SWAP')
+_SIDES = frozenset(('buy', 'sell'))
 
 class OrderValidator:
     def __init__(self):
@@ -27,9 +34,10 @@ class OrderValidator:
             'DEFAULT': {'max_notional': 50000, 'max_leverage': 50}
         }
         
-        # 주문 속도 제한
-        self.order_history = []
+        # 주문 속도 제한 (최근 rate_window초 주문 시각, time.monotonic() 오름차순)
+        self.order_history = deque()
         self.max_orders_per_minute = 30
+        self.rate_window = 60.0
         
         # 안전 설정
         self.max_capital_per_trade = 0.20  # 거래당 최대 20%
@@ -41,8 +49,7 @@ class OrderValidator:
             return False, "심볼이 없습니다"
         
         # OKX SWAP 심볼 패턴 검증
-        pattern = r'^[A-Z]+-[A-Z]+-SWAP'
-        if not re.match(pattern, symbol):
+        if not _SYMBOL_PATTERN.match(symbol):
             return False, f"잘못된 심볼 형식: {symbol} (예: BTC-USDT-SWAP)"
         
         return True, ""
@@ -72,6 +79,11 @@ class OrderValidator:
         
         max_leverage = self.max_position_limits.get(symbol, self.max_position_limits['DEFAULT'])['max_leverage']
         
+        # 거래소 스펙의 최대 레버리지가 더 낮으면 그 값을 사용
+        spec = instrument_specs.get(symbol)
+        if spec is not None and 0 < spec.max_leverage < max_leverage:
+            max_leverage = spec.max_leverage
+        
         if leverage > max_leverage:
             return False, f"최대 레버리지: {max_leverage}, 요청: {leverage}"
         
@@ -85,21 +97,23 @@ class OrderValidator:
             if not balances or 'USDT' not in balances:
                 return False, "USDT 잔고 조회 실패"
             
-            available_balance = balances['USDT']['available']
-            
-            if available_balance < required_margin:
-                return False, f"잔고 부족: 필요 ${required_margin:.2f}, 보유 ${available_balance:.2f}"
-            
-            # 안전 마진 (5% 여유분)
-            safe_margin = required_margin * 1.05
-            if available_balance < safe_margin:
-                return False, f"안전 마진 부족: 권장 ${safe_margin:.2f}, 보유 ${available_balance:.2f}"
-            
-            return True, ""
+            return self._check_margin(required_margin, balances['USDT']['available'])
             
         except Exception as e:
             return False, f"잔고 검증 오류: {str(e)}"
     
+    def _check_margin(self, required_margin: float, available_balance: float) -> Tuple[bool, str]:
+        """필요 증거금 vs 가용 잔고"""
+        if available_balance < required_margin:
+            return False, f"잔고 부족: 필요 ${required_margin:.2f}, 보유 ${available_balance:.2f}"
+        
+        # 안전 마진 (5% 여유분)
+        safe_margin = required_margin * 1.05
+        if available_balance < safe_margin:
+            return False, f"안전 마진 부족: 권장 ${safe_margin:.2f}, 보유 ${available_balance:.2f}"
+        
+        return True, ""
+    
     def validate_position_limits(self, symbol: str, new_size: float, new_leverage: int, 
                                current_positions: List[Dict] = None) -> Tuple[bool, str]:
         """포지션 한계 검증"""
@@ -120,17 +134,10 @@ class OrderValidator:
             if existing_position:
                 total_size += abs(existing_position['size'])
             
-            # 최대 포지션 크기 확인
-            max_limits = self.max_position_limits.get(symbol, self.max_position_limits['DEFAULT'])
-            max_notional = max_limits['max_notional']
-            
-            # 현재 가격으로 명목 가치 계산 (간략화)
+            # 현재 가격으로 명목 가치 계산
             estimated_price = self._get_estimated_price(symbol)
             if estimated_price:
-                total_notional = total_size * estimated_price * new_leverage
-                
-                if total_notional > max_notional:
-                    return False, f"최대 포지션 한계 초과: ${max_notional:,} vs ${total_notional:,.0f}"
+                return self._check_position_notional(symbol, total_size, new_leverage, estimated_price)
             
             return True, ""
             
@@ -138,17 +145,29 @@ class OrderValidator:
             log_error("포지션 한계 검증 오류", e)
             return False, f"포지션 검증 실패: {str(e)}"
     
-    def validate_order_rate(self) -> Tuple[bool, str]:
-        """주문 속도 제한 검증"""
-        current_time = datetime.now()
+    def _check_position_notional(self, symbol: str, total_size: float, leverage: int,
+                                 price: float) -> Tuple[bool, str]:
+        """최대 포지션 명목 가치 확인"""
+        max_notional = self.max_position_limits.get(symbol, self.max_position_limits['DEFAULT'])['max_notional']
+        total_notional = total_size * price * leverage
         
-        # 1분 이내 주문만 카운트
-        recent_orders = [
-            order_time for order_time in self.order_history
-            if current_time - order_time <= timedelta(minutes=1)
-        ]
+        if total_notional > max_notional:
+            return False, f"최대 포지션 한계 초과: ${max_notional:,} vs ${total_notional:,.0f}"
+        
+        return True, ""
+    
+    def _prune_order_history(self, now: float):
+        """윈도우 밖으로 나간 주문 시각 제거 (오래된 것부터, 호출당 분할 상환 O(1))"""
+        cutoff = now - self.rate_window
+        history = self.order_history
+        while history and history[0] < cutoff:
+            history.popleft()
+    
+    def validate_order_rate(self) -> Tuple[bool, str]:
+        """주문 속도 제한 검증 (최근 1분 슬라이딩 윈도우)"""
+        self._prune_order_history(time.monotonic())
         
-        if len(recent_orders) >= self.max_orders_per_minute:
+        if len(self.order_history) >= self.max_orders_per_minute:
             return False, f"주문 속도 제한: 분당 최대 {self.max_orders_per_minute}회"
         
         return True, ""
@@ -167,27 +186,92 @@ class OrderValidator:
         return True, ""
     
     def _get_estimated_price(self, symbol: str) -> Optional[float]:
-        """예상 가격 조회 (간단한 구현)"""
+        """예상 가격 조회 (실시간 피드 최신가, 없으면 REST ticker)"""
         try:
-            # 실제로는 현재 시장가를 조회해야 함
-            # 여기서는 간략화
-            return 50000.0 if 'BTC' in symbol else 3000.0 if 'ETH' in symbol else 1.0
-        except:
+            return get_last_price(symbol)
+        except Exception:
             return None
     
     def validate_market_conditions(self, symbol: str) -> Tuple[bool, str]:
         """시장 상황 검증"""
         try:
-            # 시장 개장 시간 확인 (암호화폐는 24시간이므로 항상 True)
-            
-            # 거래량 확인 (실제 구현 시 필요)
-            # 높은 변동성 시간대 체크 등
+            # 암호화폐는 24시간 거래이므로 상품 상태만 확인 (스펙을 모르면 통과)
+            spec = instrument_specs.get(symbol)
+            if spec is not None and not spec.is_live:
+                return False, f"거래 불가 상태: {symbol} ({spec.state})"
             
             return True, ""
             
         except Exception as e:
             return False, f"시장 상황 검증 실패: {str(e)}"
     
+    def pre_trade_check(self, symbol: str, side: str, size: float, price: float = None,
+                        leverage: int = 1, available_balance: float = None,
+                        position_size: float = 0.0, total_capital: float = None) -> Tuple[bool, str]:
+        """
+        주문 직전 빠른 검증 (첫 번째 실패에서 바로 반환)
+        
+        comprehensive_validation과 같은 기준이지만 REST 조회 없이 메모리 값만 사용:
+        가격은 실시간 피드(price_book), 상품 스펙은 캐시, 잔고/포지션/총 자본은
+        호출부가 가진 스냅샷 (None이면 해당 검증 생략)
+        속도 제한은 확인만 하므로 실제 주문 전송 시 record_order_attempt() 호출
+        
+        Args:
+            symbol: 심볼
+            side: 'buy' / 'sell'
+            size: 주문 크기
+            price: 주문 가격 (None이면 price_book 최신가)
+            leverage: 레버리지
+            available_balance: 가용 USDT 잔고
+            position_size: 같은 심볼 기존 포지션 크기
+            total_capital: 총 자본
+        
+        Returns:
+            (통과 여부, 실패 사유)
+        """
+        if side not in _SIDES:
+            return False, "잘못된 거래 방향"
+        
+        ok, error = self.validate_symbol(symbol)
+        if not ok:
+            return ok, error
+        
+        ok, error = self.validate_order_rate()
+        if not ok:
+            return ok, error
+        
+        if price is None:
+            price = price_book.get(symbol, DEFAULT_MAX_AGE)
+            if price is None:
+                return False, f"실시간 가격 없음: {symbol}"
+        
+        ok, error = self.validate_order_size(symbol, size, price)
+        if not ok:
+            return ok, error
+        
+        ok, error = self.validate_leverage(symbol, leverage)
+        if not ok:
+            return ok, error
+        
+        ok, error = self.validate_market_conditions(symbol)
+        if not ok:
+            return ok, error
+        
+        ok, error = self._check_position_notional(symbol, size + abs(position_size), leverage, price)
+        if not ok:
+            return ok, error
+        
+        required_margin = (size * price) / leverage
+        if available_balance is not None:
+            ok, error = self._check_margin(required_margin, available_balance)
+            if not ok:
+                return ok, error
+        
+        if total_capital is not None:
+            return self.validate_capital_allocation(required_margin, total_capital)
+        
+        return True, ""
+    
     def comprehensive_validation(self, order_params: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """종합 주문 검증"""
         errors = []
@@ -243,14 +327,9 @@ class OrderValidator:
     
     def record_order_attempt(self):
         """주문 시도 기록 (속도 제한용)"""
-        self.order_history.append(datetime.now())
-        
-        # 오래된 기록 정리 (메모리 절약)
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        self.order_history = [
-            order_time for order_time in self.order_history
-            if order_time > cutoff_time
-        ]
+        now = time.monotonic()
+        self._prune_order_history(now)
+        self.order_history.append(now)
     
     def get_validation_summary(self, symbol: str) -> Dict[str, Any]:
         """검증 기준 요약"""
@@ -341,3 +420,39 @@ def get_order_limits(symbol: str) -> Dict[str, Any]:
 
 
 
+
+
+# 사전 검증 마이크로 벤치마크
+if __name__ == "__main__":
+    import timeit
+    from datetime import datetime, timedelta
+    from okx.instruments import InstrumentSpec
+    
+    symbol = 'BTC-USDT-SWAP'
+    validator = OrderValidator()
+    price_book.update(symbol, 50000.0)
+    instrument_specs.put(InstrumentSpec(inst_id=symbol, ct_val=0.01, lot_size=0.01, min_size=0.01,
+                                        tick_size=0.1, max_leverage=100))
+    
+    # 최근 1시간 동안 분당 20건 주문한 상태 (윈도우 안에는 20건)
+    now = time.monotonic()
+    validator.order_history.extend(now - 3 * i for i in range(20 * 60, 0, -1))
+    legacy_history = [datetime.now() - timedelta(seconds=3 * i) for i in range(20 * 60, 0, -1)]
+    
+    def legacy_order_rate():
+        current_time = datetime.now()
+        recent = [t for t in legacy_history if current_time - t <= timedelta(minutes=1)]
+        return len(recent) < validator.max_orders_per_minute
+    
+    def fast_check():
+        return validator.pre_trade_check(symbol, 'buy', 0.01, leverage=10,
+                                         available_balance=1000.0, total_capital=5000.0)
+    
+    print(f"pre_trade_check: {fast_check()}")
+    
+    n = 2000
+    for name, fn in [("이전 속도 제한 (리스트 재구성)", legacy_order_rate),
+                     ("validate_order_rate (deque)", validator.validate_order_rate),
+                     ("pre_trade_check 전체", fast_check)]:
+        elapsed = min(timeit.repeat(fn, number=n, repeat=3))
+        print(f"{name}: {elapsed / n * 1e6:.2f} µs/회")
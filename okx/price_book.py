@@ -0,0 +1,79 @@
+# okx/price_book.py
+"""
+실시간 최신가 저장소 (프로세스 공유)
+
+실시간 WebSocket 피드(WebSocketMarketFeed / WebSocketHandler)가 ticker를 받을 때마다
+기록하고 (ReplayMarketFeed는 과거 가격이므로 전용 인스턴스에 기록), 주문 검증/사이징 등은 REST 조회 대신 여기서 최신가를 읽음.
+가격이 없거나 오래됐으면 get_last_price()가 공유 REST 클라이언트(요청 병합/캐시)로 대체 조회
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+# 이보다 오래된 가격은 get_last_price()에서 REST로 다시 조회 (초)
+DEFAULT_MAX_AGE = 5.0
+
+
+class LivePriceBook:
+    """심볼별 (최신가, 수신 monotonic 시각)"""
+    
+    def __init__(self):
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+    
+    def update(self, symbol: str, price: float, recv_ts: float = None):
+        """
+        최신가 기록
+        
+        Args:
+            symbol: 심볼
+            price: 가격 (0 이하는 무시)
+            recv_ts: 수신 시각 (time.monotonic(), None이면 현재)
+        """
+        if price <= 0:
+            return
+        entry = (float(price), time.monotonic() if recv_ts is None else recv_ts)
+        # 튜플 교체는 원자적이지만 여러 피드가 같은 심볼을 쓰는 경우 순서 보장을 위해 잠금
+        with self._lock:
+            self._prices[symbol] = entry
+    
+    def get(self, symbol: str, max_age: float = None) -> Optional[float]:
+        """최신가 (없거나 max_age초보다 오래됐으면 None)"""
+        entry = self._prices.get(symbol)
+        if entry is None:
+            return None
+        if max_age is not None and time.monotonic() - entry[1] > max_age:
+            return None
+        return entry[0]
+    
+    def age(self, symbol: str) -> Optional[float]:
+        """마지막 갱신 후 경과 시간 (초)"""
+        entry = self._prices.get(symbol)
+        return None if entry is None else time.monotonic() - entry[1]
+    
+    def snapshot(self) -> Dict[str, float]:
+        return {s: p for s, (p, _) in self._prices.items()}
+
+
+# 프로세스 공유 인스턴스
+price_book = LivePriceBook()
+
+
+def get_last_price(symbol: str, max_age: float = DEFAULT_MAX_AGE) -> Optional[float]:
+    """
+    최신가 조회 (실시간 피드 우선, 없거나 오래됐으면 REST ticker)
+    
+    REST 결과도 price_book에 기록하므로 피드가 없는 환경에서도
+    max_age 동안은 추가 요청 없이 응답
+    """
+    price = price_book.get(symbol, max_age)
+    if price is not None:
+        return price
+    
+    from okx.async_client import get_okx_client
+    price = get_okx_client().get_last_price(symbol)
+    if price:
+        price_book.update(symbol, price)
+    return price
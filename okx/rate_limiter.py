@@ -0,0 +1,228 @@
+# okx/rate_limiter.py
+"""
+OKX 엔드포인트 그룹별 토큰 버킷 레이트 리미터 (프로세스 공유)
+
+- 엔드포인트 그룹(market / trade / account / ws 등)마다 토큰 버킷을 두고,
+  모든 REST 요청이 공유하는 전체 버킷을 한 번 더 거침
+- 우선순위 레인: 토큰이 부족할 때 대기자 중 우선순위가 높은 요청부터 통과
+  (주문 > 계정 조회 > 백그라운드 시세 폴링)
+- 고정 sleep 대신 토큰이 생길 때까지만 기다리므로 허용 한도 내 최대 처리량 유지
+
+config.http_request가 모든 REST 요청에 대해 acquire_for_path()를 호출하므로
+REST 호출부는 따로 대기할 필요 없음
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_HIGH = 0     # 주문 / 취소
+PRIORITY_NORMAL = 1   # 계정 / 포지션 조회
+PRIORITY_LOW = 2      # 시세 폴링, 과거 데이터 로드
+
+# 그룹별 한도 (rate: 초당 토큰, burst: 버킷 크기)
+# OKX 공개 한도(대부분 2초당 N회)보다 약간 낮게 설정
+DEFAULT_LIMITS: Dict[str, Dict[str, float]] = {
+    "rest": {"rate": 20.0, "burst": 40},     # 전체 REST (IP 단위)
+    "market": {"rate": 9.0, "burst": 18},    # /market, /public (ticker 20회/2초)
+    "trade": {"rate": 28.0, "burst": 56},    # /trade (주문 60회/2초)
+    "account": {"rate": 4.5, "burst": 9},    # /account (잔고/포지션 10회/2초)
+    "other": {"rate": 4.5, "burst": 9},
+    "ws": {"rate": 3.0, "burst": 3},         # WebSocket 연결/구독 요청 (초당 3회)
+}
+
+# 그룹 기본 우선순위
+GROUP_PRIORITY = {
+    "trade": PRIORITY_HIGH,
+    "account": PRIORITY_NORMAL,
+    "other": PRIORITY_NORMAL,
+    "market": PRIORITY_LOW,
+    "ws": PRIORITY_NORMAL,
+}
+
+# 전체 REST 버킷을 거치지 않는 그룹
+NON_REST_GROUPS = frozenset({"ws"})
+
+# 경로 접두사 → 그룹
+_PATH_GROUPS = (
+    ("/api/v5/trade/", "trade"),
+    ("/api/v5/account/", "account"),
+    ("/api/v5/asset/", "account"),
+    ("/api/v5/market/", "market"),
+    ("/api/v5/public/", "market"),
+)
+
+
+def endpoint_group(path: str) -> str:
+    """요청 경로 → 엔드포인트 그룹"""
+    for prefix, group in _PATH_GROUPS:
+        if path.startswith(prefix):
+            return group
+    return "other"
+
+
+class TokenBucket:
+    """토큰 버킷 (잠금은 RateLimiter가 관리)"""
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+    
+    def refill(self, now: float):
+        if now > self._updated:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+    
+    def wait_time(self, n: float = 1.0) -> float:
+        """n개 토큰이 쌓이기까지 남은 시간 (refill 직후 호출)"""
+        if self.tokens >= n:
+            return 0.0
+        return (n - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    그룹별 토큰 버킷 + 우선순위 대기열
+    
+    사용법:
+        limiter = get_rate_limiter()
+        limiter.acquire("market")                        # 그룹 기본 우선순위
+        limiter.acquire("trade", PRIORITY_HIGH)
+        limiter.acquire_for_path("/api/v5/trade/order")  # 경로로 그룹 판별
+    """
+    
+    def __init__(self, limits: Dict[str, Dict[str, float]] = None, global_group: str = "rest"):
+        """
+        Args:
+            limits: {그룹: {"rate": 초당 토큰, "burst": 버킷 크기}}
+            global_group: 모든 REST 그룹이 함께 거치는 전체 버킷 이름 (None이면 사용 안 함)
+        """
+        self._cond = threading.Condition(threading.Lock())
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.global_group = global_group
+        self.configure(limits or DEFAULT_LIMITS)
+        
+        # 대기열 (priority, seq, group)
+        self._waiters: List[Tuple[int, int, str]] = []
+        self._seq = itertools.count()
+        
+        # 통계
+        self.stats: Dict[str, Dict[str, float]] = {}
+    
+    def configure(self, limits: Dict[str, Dict[str, float]]):
+        """그룹 한도 추가/변경"""
+        with self._cond:
+            for group, cfg in limits.items():
+                self._buckets[group] = TokenBucket(cfg["rate"], cfg["burst"])
+            self._cond.notify_all()
+    
+    def _buckets_for(self, group: str) -> Tuple[TokenBucket, ...]:
+        bucket = self._buckets.get(group) or self._buckets["other"]
+        if group in NON_REST_GROUPS or self.global_group not in self._buckets:
+            return (bucket,)
+        return bucket, self._buckets[self.global_group]
+    
+    def _ready(self, buckets, now: float) -> float:
+        for b in buckets:
+            b.refill(now)
+        return max(b.wait_time() for b in buckets)
+    
+    def acquire(self, group: str, priority: int = None, timeout: float = None) -> bool:
+        """
+        토큰 1개 획득 (필요하면 대기)
+        
+        Args:
+            group: 엔드포인트 그룹
+            priority: 우선순위 (None이면 그룹 기본값)
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        
+        Returns:
+            획득 여부 (timeout 초과 시 False)
+        """
+        if priority is None:
+            priority = GROUP_PRIORITY.get(group, PRIORITY_NORMAL)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        with self._cond:
+            buckets = self._buckets_for(group)
+            entry = (priority, next(self._seq), group)
+            heapq.heappush(self._waiters, entry)
+            started = time.monotonic()
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._ready(buckets, now)
+                    if wait == 0.0 and not self._blocked_by_higher(entry, now):
+                        for b in buckets:
+                            b.tokens -= 1.0
+                        self._record(group, now - started)
+                        return True
+                    
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait or remaining, remaining)
+                    # 앞선 대기자가 통과하면 notify_all로 깨어남
+                    self._cond.wait(wait if wait > 0 else None)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+    
+    def _blocked_by_higher(self, entry: Tuple[int, int, str], now: float) -> bool:
+        """
+        나보다 앞선 대기자 중 지금 통과할 수 있는 요청이 있는지
+        (앞선 대기자라도 자기 그룹 버킷이 비어 못 나가는 경우엔 막지 않음)
+        """
+        for other in self._waiters:
+            if other >= entry:
+                continue
+            if self._ready(self._buckets_for(other[2]), now) == 0.0:
+                return True
+        return False
+    
+    def _record(self, group: str, waited: float):
+        st = self.stats.get(group)
+        if st is None:
+            st = self.stats[group] = {"acquired": 0, "total_wait_s": 0.0, "max_wait_s": 0.0}
+        st["acquired"] += 1
+        st["total_wait_s"] += waited
+        st["max_wait_s"] = max(st["max_wait_s"], waited)
+    
+    def acquire_for_path(self, path: str, priority: int = None, timeout: float = None) -> bool:
+        """요청 경로로 그룹을 판별해 acquire"""
+        return self.acquire(endpoint_group(path), priority, timeout)
+    
+    def get_status(self) -> Dict:
+        with self._cond:
+            now = time.monotonic()
+            tokens = {}
+            for group, bucket in self._buckets.items():
+                bucket.refill(now)
+                tokens[group] = round(bucket.tokens, 2)
+            return {
+                "tokens": tokens,
+                "waiting": len(self._waiters),
+                "stats": {g: dict(st) for g, st in self.stats.items()},
+            }
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 공유 레이트 리미터"""
+    global _shared_limiter
+    if _shared_limiter is None:
+        with _shared_limiter_lock:
+            if _shared_limiter is None:
+                _shared_limiter = RateLimiter()
+    return _shared_limiter
@@ -13,6 +13,11 @@ import requests
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple, List
 
+from config import http_request
+from okx.instruments import instrument_specs
+from okx.price_book import get_last_price
+from okx.rate_limiter import get_rate_limiter
+
 class RealOrderManager:
     """실제 거래 전용 주문 관리자"""
     
@@ -50,6 +55,9 @@ class RealOrderManager:
         self.order_history = []
         self.last_order_time = None
         
+        # 상품 스펙은 전체 SWAP 목록을 메모리에 두고 백그라운드에서 갱신
+        instrument_specs.start()
+        
     def _get_timestamp(self) -> str:
         """ISO 형식 타임스탬프 생성"""
         return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
@@ -68,6 +76,8 @@ class RealOrderManager:
     def _make_request(self, method: str, endpoint: str, 
                       body: Optional[Dict] = None) -> Dict:
         """API 요청 수행"""
+        # 토큰 대기 후 서명 (대기 중에 타임스탬프가 오래되지 않도록)
+        get_rate_limiter().acquire_for_path(endpoint)
         timestamp = self._get_timestamp()
         body_str = json.dumps(body) if body else ""
         
@@ -85,10 +95,12 @@ class RealOrderManager:
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                response = http_request('GET', url, headers=headers, timeout=self.timeout,
+                                        acquire_token=False)
             elif method == 'POST':
-                response = requests.post(url, headers=headers, 
-                                        data=body_str, timeout=self.timeout)
+                response = http_request('POST', url, headers=headers, 
+                                        data=body_str, timeout=self.timeout,
+                                        acquire_token=False)
             else:
                 return {'code': '-1', 'msg': f'Unsupported method: {method}'}
             
@@ -102,34 +114,25 @@ class RealOrderManager:
             return {'code': '-1', 'msg': 'Invalid JSON response'}
     
     def get_instrument_info(self, inst_id: str) -> Optional[Dict]:
-        """상품 정보 조회 (최소 주문 요건 포함)"""
-        endpoint = f"/api/v5/public/instruments?instType=SWAP&instId={inst_id}"
+        """상품 정보 조회 (최소 주문 요건 포함, 상품 레지스트리 메모리에서 응답)"""
+        spec = instrument_specs.get(inst_id)
         
-        result = self._make_request('GET', endpoint)
-        
-        if result.get('code') == '0' and result.get('data'):
-            info = result['data'][0]
+        if spec is not None:
             return {
-                'inst_id': info.get('instId'),
-                'min_size': float(info.get('minSz', 0.001)),
-                'lot_size': float(info.get('lotSz', 0.001)),
-                'tick_size': float(info.get('tickSz', 0.01)),
-                'ct_val': float(info.get('ctVal', 1)),  # 계약 가치
-                'ct_mult': float(info.get('ctMult', 1)),  # 계약 승수
-                'settle_ccy': info.get('settleCcy', 'USDT'),
-                'state': info.get('state', 'live')
+                'inst_id': spec.inst_id,
+                'min_size': spec.min_size,
+                'lot_size': spec.lot_size,
+                'tick_size': spec.tick_size,
+                'ct_val': spec.ct_val,  # 계약 가치
+                'ct_mult': spec.ct_mult,  # 계약 승수
+                'settle_ccy': spec.settle_ccy,
+                'state': spec.state
             }
         return None
     
     def get_current_price(self, inst_id: str) -> Optional[float]:
-        """현재 시장 가격 조회"""
-        endpoint = f"/api/v5/market/ticker?instId={inst_id}"
-        
-        result = self._make_request('GET', endpoint)
-        
-        if result.get('code') == '0' and result.get('data'):
-            return float(result['data'][0].get('last', 0))
-        return None
+        """현재 시장 가격 조회 (실시간 피드 최신가, 없거나 오래됐으면 REST ticker)"""
+        return get_last_price(inst_id)
     
     def get_account_balance(self, ccy: str = "USDT") -> Optional[Dict]:
         """계좌 잔고 조회"""
@@ -14,6 +14,8 @@ import pandas as pd
 from datetime import datetime
 from typing import Optional, Callable, Dict, Any, List
 from config import API_KEY, API_SECRET, PASSPHRASE, EMA_PERIODS
+from okx.price_book import price_book
+from okx.rate_limiter import get_rate_limiter
 from utils.price_buffer import PriceBuffer
 from utils.logger import log_system, log_error, log_info
 
@@ -169,6 +171,7 @@ class WebSocketHandler:
                 
                 # 🔧 즉시 가격 정보 출력 (디버깅용)
                 if current_price > 0:
+                    price_book.update(inst_id, current_price)
                     change_24h = float(ticker.get('sodUtc8', 0))
                     volume_24h = float(ticker.get('vol24h', 0))
                     
@@ -439,54 +442,32 @@ class WebSocketHandler:
             return False
     
     def _subscribe_channels(self):
-        """채널 구독"""
+        """채널 구독 (연결별로 한 요청에 묶어서 전송, 요청 간격은 공유 레이트 리미터가 관리)"""
+        limiter = get_rate_limiter()
         try:
-            for symbol in self.target_symbols:
-                # 🔧 구독 요청을 더 명확하게 로깅
-                print(f"📡 구독 요청: {symbol} 실시간 가격 데이터")
+            if self.public_ws and self.target_symbols:
+                # Ticker (실시간 가격) + 30분 캔들
+                public_args = []
+                for symbol in self.target_symbols:
+                    print(f"📡 구독 요청: {symbol} 실시간 가격 데이터")
+                    public_args.append({"channel": "tickers", "instId": symbol})
+                    public_args.append({"channel": "candle30m", "instId": symbol})
                 
-                # Ticker 구독 (실시간 가격)
-                ticker_sub = {
-                    "op": "subscribe",
-                    "args": [{
-                        "channel": "tickers",
-                        "instId": symbol
-                    }]
-                }
-                
-                # 30분 캔들 구독
-                candle_sub = {
-                    "op": "subscribe",
-                    "args": [{
-                        "channel": "candle30m",
-                        "instId": symbol
-                    }]
-                }
+                limiter.acquire("ws")
+                self.public_ws.send(json.dumps({"op": "subscribe", "args": public_args}))
                 
-                if self.public_ws:
-                    self.public_ws.send(json.dumps(ticker_sub))
-                    time.sleep(0.1)  # 요청 간격
-                    self.public_ws.send(json.dumps(candle_sub))
-                    time.sleep(0.1)
-                    
-                    log_system(f"📡 Public 채널 구독 요청 전송: {symbol}")
-                    print(f"✅ 구독 요청 전송 완료: {symbol}")
+                log_system(f"📡 Public 채널 구독 요청 전송: {', '.join(self.target_symbols)}")
+                print(f"✅ 구독 요청 전송 완료: {', '.join(self.target_symbols)}")
             
             # Private 채널 구독 (인증 후)
             if self.is_authenticated and self.private_ws:
-                account_sub = {
-                    "op": "subscribe",
-                    "args": [{"channel": "account"}]
-                }
-                
-                position_sub = {
-                    "op": "subscribe",
-                    "args": [{"channel": "positions", "instType": "SWAP"}]
-                }
+                private_args = [
+                    {"channel": "account"},
+                    {"channel": "positions", "instType": "SWAP"},
+                ]
                 
-                self.private_ws.send(json.dumps(account_sub))
-                time.sleep(0.1)
-                self.private_ws.send(json.dumps(position_sub))
+                limiter.acquire("ws")
+                self.private_ws.send(json.dumps({"op": "subscribe", "args": private_args}))
                 
                 log_system("📡 Private 채널 구독 완료")
                 print("✅ 계좌 및 포지션 채널 구독 완료")
@@ -9,6 +9,8 @@
     python run_agent_team.py                  # 실거래 모드
     python run_agent_team.py --dry-run        # 주문 없이 테스트
     python run_agent_team.py --capital 200    # 초기 자본 지정
+    python run_agent_team.py --agent-processes reader,strategist
+                                              # 무거운 에이전트를 별도 프로세스로 실행
 """
 
 import sys
@@ -34,6 +36,7 @@ from agents.reader_agent import ReaderAgent
 from agents.trader_agent import TraderAgent
 from agents.strategist_agent import StrategistAgent
 from agents.monitor_agent import MonitorAgent
+from agents.bus_transport import AgentTeamServer
 
 from okx.order_manager import OrderManager
 
@@ -48,9 +51,65 @@ def parse_args():
                         help="Claude API 미사용 (기술적 분석만)")
     parser.add_argument("--symbol", type=str, default="BTC-USDT-SWAP",
                         help="거래 심볼 (기본: BTC-USDT-SWAP)")
+    parser.add_argument("--agent-processes", type=str, default="",
+                        help="별도 프로세스로 실행할 에이전트 (쉼표 구분, 예: reader,strategist)")
     return parser.parse_args()
 
 
+AGENT_NAMES = ("monitor", "reader", "trader", "strategist")
+
+
+def create_agent(name, message_bus, state_manager, strategy_modifier, llm_client,
+                 news_fetcher=None, order_manager=None):
+    """에이전트 생성 (메인 프로세스 / 에이전트 프로세스 공용)"""
+    if name == "monitor":
+        return MonitorAgent(
+            message_bus=message_bus,
+            state_manager=state_manager,
+            llm_client=llm_client,
+            strategy_modifier=strategy_modifier,
+            order_manager=order_manager,
+        )
+    if name == "reader":
+        return ReaderAgent(
+            message_bus=message_bus,
+            state_manager=state_manager,
+            llm_client=llm_client,
+            news_fetcher=news_fetcher,
+        )
+    if name == "trader":
+        return TraderAgent(
+            message_bus=message_bus,
+            state_manager=state_manager,
+            llm_client=llm_client,
+            order_manager=order_manager,
+        )
+    if name == "strategist":
+        return StrategistAgent(
+            message_bus=message_bus,
+            state_manager=state_manager,
+            llm_client=llm_client,
+            strategy_modifier=strategy_modifier,
+        )
+    raise ValueError(f"알 수 없는 에이전트: {name}")
+
+
+def create_process_agent(message_bus, state_manager, strategy_modifier,
+                         name, use_llm, api_key, dry_run):
+    """에이전트 프로세스용 factory (LLM/뉴스/주문 클라이언트는 프로세스마다 새로 생성)"""
+    llm_client = LLMClient(
+        api_key=api_key if use_llm else "",
+        model=AGENT_TEAM_CONFIG.get("claude_model", "claude-sonnet-4-5-20250929"),
+        use_cli=use_llm,
+    )
+    news_fetcher = NewsFetcher() if name == "reader" else None
+    order_manager = None
+    if not dry_run and name in ("monitor", "trader"):
+        order_manager = OrderManager(verbose=False)
+    return create_agent(name, message_bus, state_manager, strategy_modifier,
+                        llm_client, news_fetcher, order_manager)
+
+
 def print_banner():
     print("=" * 60)
     print("🤖 자율 매매 에이전트 팀 v1.0")
@@ -62,7 +121,7 @@ def print_banner():
     print("=" * 60)
 
 
-def print_status(state_manager, agents, message_bus):
+def print_status(state_manager, agents, message_bus, team_server=None):
     """터미널 대시보드 출력"""
     status = state_manager.get_team_status()
     bus_stats = message_bus.get_stats()
@@ -90,12 +149,32 @@ def print_status(state_manager, agents, message_bus):
 
     # 에이전트 상태
     agent_status = []
+    latency = None
     for agent in agents:
         s = agent.get_status()
         emoji = "🟢" if s["running"] else "🔴"
         err = f" ⚠️{s['last_error'][:20]}" if s["last_error"] else ""
         agent_status.append(f"{emoji}{s['name']}(#{s['cycle_count']}{err})")
+        if s.get("latency", {}).get("count"):
+            latency = s["latency"]
     print(f"  에이전트: {' | '.join(agent_status)}")
+    if team_server:
+        procs = team_server.get_status()["processes"]
+        print("  프로세스: " + " | ".join(
+            f"{'🟢' if p['alive'] else '🔴'}{name}(pid {p['pid']})" for name, p in procs.items()
+        ))
+    if latency:
+        print(f"  ⏱️ 신호→주문: 최근 {latency['last_ms']:.0f}ms  |  "
+              f"평균 {latency['avg_ms']:.0f}ms  |  최대 {latency['max_ms']:.0f}ms "
+              f"({latency['count']}건)")
+
+    # LLM 응답 캐시 (같은 프로세스의 에이전트가 공유하는 클라이언트)
+    llm_client = next((a.llm_client for a in agents if a.llm_client is not None), None)
+    if llm_client is not None:
+        cache = llm_client.get_stats()["cache"]
+        if cache["requests"]:
+            print(f"  🧠 LLM 캐시: 적중률 {cache['hit_rate']:.0%}  |  "
+                  f"호출 {cache['misses']}건  |  절약 {cache['saved_seconds']:.0f}초")
     print("─" * 60)
 
 
@@ -113,6 +192,12 @@ def main():
 
     initial_capital = args.capital or 70.0  # 현재 계좌 자산 기준
 
+    process_agents = [n.strip() for n in args.agent_processes.split(",") if n.strip()]
+    unknown = [n for n in process_agents if n not in AGENT_NAMES]
+    if unknown:
+        print(f"❌ 알 수 없는 에이전트: {', '.join(unknown)} (가능: {', '.join(AGENT_NAMES)})")
+        sys.exit(1)
+
     # ==================== 1. 설정 검증 ====================
     print("\n📋 설정 검증 중...")
 
@@ -185,48 +270,36 @@ def main():
     # ==================== 3. 에이전트 생성 ====================
     print("\n🤖 에이전트 생성...")
 
-    monitor = MonitorAgent(
-        message_bus=message_bus,
-        state_manager=state_manager,
-        llm_client=llm_client,
-        strategy_modifier=strategy_modifier,
-        order_manager=order_manager,
-    )
-
-    reader = ReaderAgent(
-        message_bus=message_bus,
-        state_manager=state_manager,
-        llm_client=llm_client,
-        news_fetcher=news_fetcher,
-    )
-
-    trader = TraderAgent(
-        message_bus=message_bus,
-        state_manager=state_manager,
-        llm_client=llm_client,
-        order_manager=order_manager,
-    )
-
-    strategist = StrategistAgent(
-        message_bus=message_bus,
-        state_manager=state_manager,
-        llm_client=llm_client,
-        strategy_modifier=strategy_modifier,
-    )
-
-    agents = [monitor, reader, trader, strategist]
+    agents = [
+        create_agent(name, message_bus, state_manager, strategy_modifier,
+                     llm_client, news_fetcher, order_manager)
+        for name in AGENT_NAMES if name not in process_agents
+    ]
     print(f"  ✅ {len(agents)}개 에이전트 생성 완료")
 
+    # 별도 프로세스 에이전트는 로컬 소켓으로 MessageBus / StateManager / StrategyModifier 공유
+    team_server = None
+    if process_agents:
+        team_server = AgentTeamServer(message_bus, state_manager, strategy_modifier)
+        team_server.start()
+
     # ==================== 4. 에이전트 시작 ====================
     print("\n🚀 에이전트 팀 시작!\n")
 
     # Monitor 먼저 시작 (안전장치 우선)
-    monitor.start()
-    time.sleep(0.5)
-
-    reader.start()
-    trader.start()
-    strategist.start()
+    for agent in agents:
+        agent.start()
+        if agent.name == "monitor":
+            time.sleep(0.5)
+
+    for name in process_agents:
+        proc = team_server.spawn_agent(
+            create_process_agent,
+            (name, use_llm, api_key, args.dry_run),
+            agent_config={"dry_run": AGENT_TEAM_CONFIG["dry_run"], "symbol": AGENT_TEAM_CONFIG["symbol"]},
+            name=f"agent-{name}",
+        )
+        print(f"  🧩 {name} 에이전트 프로세스 시작 (pid {proc.pid})")
 
     # ==================== 5. 메인 루프 ====================
     # 종료 시그널 핸들러
@@ -251,7 +324,7 @@ def main():
                     state_manager.refresh_balance()
                     state_manager.refresh_price()
 
-                print_status(state_manager, agents, message_bus)
+                print_status(state_manager, agents, message_bus, team_server)
                 last_status = now
 
                 # 목표 달성 확인
@@ -270,6 +343,9 @@ def main():
     for agent in agents:
         agent.stop()
 
+    if team_server:
+        team_server.stop()
+
     # 포지션 확인
     if not args.dry_run:
         positions = state_manager.get_positions()
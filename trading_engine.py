@@ -12,46 +12,17 @@
 """
 
 import time
+import queue
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Callable, Any
-from collections import deque
 
 import pandas as pd
 import numpy as np
 
-from config import make_api_request
-
-
-class PriceBuffer:
-    """가격 데이터 버퍼"""
-    
-    def __init__(self, max_size: int = 1000):
-        self.data: deque = deque(maxlen=max_size)
-        self.max_size = max_size
-        self.last_timestamp = None
-    
-    def add_candle(self, candle: Dict):
-        self.data.append(candle)
-        self.last_timestamp = candle.get('timestamp')
-    
-    def update_last(self, close: float, high: float = None, low: float = None):
-        if self.data:
-            self.data[-1]['close'] = close
-            if high:
-                self.data[-1]['high'] = max(self.data[-1]['high'], high)
-            if low:
-                self.data[-1]['low'] = min(self.data[-1]['low'], low)
-    
-    def to_dataframe(self) -> Optional[pd.DataFrame]:
-        if not self.data:
-            return None
-        df = pd.DataFrame(list(self.data))
-        df.set_index('timestamp', inplace=True)
-        return df
-    
-    def __len__(self):
-        return len(self.data)
+from okx.async_client import cached_api_request
+from utils.price_buffer import PriceBuffer
+from utils.indicator_service import IndicatorService, IndicatorSnapshot
 
 
 class MultiTimeframeStrategy:
@@ -97,9 +68,10 @@ class MultiTimeframeStrategy:
         self.winning_trades = 0
         self.total_pnl = 0
         
-        # EMA 캐시
+        # EMA 캐시 (IndicatorService 스냅샷 또는 update_*_emas로 갱신)
         self.last_ema_30m = {}
         self.last_ema_1m = {}
+        self.indicator_version = 0
         self.last_price = 0
     
     def update_30m_emas(self, df: pd.DataFrame):
@@ -128,6 +100,14 @@ class MultiTimeframeStrategy:
             'ema100': close.ewm(span=100).mean().iloc[-1],
         }
     
+    def apply_snapshot(self, snapshot: IndicatorSnapshot):
+        """공유 지표 서비스 스냅샷 반영 (봉 수가 부족한 타임프레임은 이전 값 유지)"""
+        if snapshot.ema_30m:
+            self.last_ema_30m = snapshot.ema_30m
+        if snapshot.ema_1m:
+            self.last_ema_1m = snapshot.ema_1m
+        self.indicator_version = snapshot.version
+    
     def check_trend_condition(self, price: float = None) -> bool:
         """트렌드 조건 확인 (30분봉)"""
         if not self.last_ema_30m:
@@ -303,20 +283,41 @@ class MultiTimeframeStrategy:
             'winning_trades': self.winning_trades,
             'total_pnl': self.total_pnl,
             'leverage': self.leverage,
-            'ema_30m': self.last_ema_30m,
-            'ema_1m': self.last_ema_1m,
+            'ema_30m': dict(self.last_ema_30m),
+            'ema_1m': dict(self.last_ema_1m),
         }
 
 
 class MultiTimeframeTradingEngine:
-    """멀티 타임프레임 자동매매 엔진 - 전략 모드 선택 기능 포함"""
+    """
+    멀티 타임프레임 자동매매 엔진 - 전략 모드 선택 기능 포함
     
-    def __init__(self, config: Dict = None):
+    feed_mode:
+        - 'rest' (기본): check_interval마다 REST ticker 폴링
+        - 'websocket': WebSocket 피드 이벤트가 심볼별 큐를 거쳐 전략을 바로 구동
+          (ticker → 트레일링 peak 갱신/신호 체크, 확정 캔들 → 버퍼 반영)
+    """
+    
+    # 심볼별 이벤트 큐 최대 크기 (가득 차면 ticker 이벤트는 버림)
+    EVENT_QUEUE_SIZE = 10000
+    
+    def __init__(self, config: Dict = None, feed=None):
+        """
+        Args:
+            config: 엔진 설정
+            feed: 시장 데이터 피드 (WebSocketMarketFeed / ReplayMarketFeed 등).
+                  지정하면 websocket 모드로 동작
+        """
         self.config = config or {}
         
         self.symbols = self.config.get('symbols', ['BTC-USDT-SWAP'])
         self.check_interval = self.config.get('check_interval', 60)
         
+        # 시장 데이터 공급 방식
+        self.feed = feed
+        self.feed_mode = 'websocket' if feed is not None else self.config.get('feed_mode', 'rest')
+        self.preload_candles = self.config.get('preload_candles', True)
+        
         # ⭐⭐⭐ 전략 모드 설정 (핵심 추가 부분) ⭐⭐⭐
         self.strategy_mode = self.config.get('strategy_mode', 'long_only')
         self.long_enabled = self.config.get('long_enabled', True)
@@ -343,6 +344,18 @@ class MultiTimeframeTradingEngine:
         self.total_signals = 0
         self.executed_trades = 0
         
+        # 이벤트 파이프라인 (websocket 모드)
+        self.event_queues: Dict[str, queue.Queue] = {}
+        self.event_threads: List[threading.Thread] = []
+        self.events_processed = 0
+        self.dropped_events = 0
+        self.last_signal_latency_ms = 0.0
+        self._latency_sum_ms = 0.0
+        self._latency_count = 0
+        
+        # 심볼별 공유 EMA 서비스 (1분봉 → 30분봉 리샘플링, 봉 마감 시 증분 갱신 후 전략에 스냅샷 전달)
+        self.indicators = IndicatorService()
+        
         # 콜백
         self.on_signal_callback: Optional[Callable] = None
         self.on_trade_callback: Optional[Callable] = None
@@ -362,6 +375,10 @@ class MultiTimeframeTradingEngine:
         # 가격 버퍼 생성
         self._create_price_buffers()
         
+        # 전략을 심볼 지표 스냅샷에 구독
+        for strategy in self.strategies.values():
+            self.indicators.subscribe(strategy.symbol, strategy.apply_snapshot)
+        
         # ⭐ 초기화 로그
         self._log_init_status()
     
@@ -374,7 +391,10 @@ class MultiTimeframeTradingEngine:
         print(f"📈 롱 전략: {'✅ 활성' if self.long_enabled else '⛔ 비활성'}")
         print(f"📉 숏 전략: {'✅ 활성' if self.short_enabled else '⛔ 비활성'}")
         print(f"🎯 심볼: {', '.join(self.symbols)}")
-        print(f"⏱️ 체크 간격: {self.check_interval}초")
+        if self.feed_mode == 'websocket':
+            print(f"📡 데이터: WebSocket 이벤트 구동")
+        else:
+            print(f"⏱️ 체크 간격: {self.check_interval}초")
         print(f"{'='*60}\n")
     
     # ⭐⭐⭐ 전략 모드 설정 메서드 (핵심 추가) ⭐⭐⭐
@@ -456,8 +476,8 @@ class MultiTimeframeTradingEngine:
     def _create_price_buffers(self):
         """가격 버퍼 생성"""
         for symbol in self.symbols:
-            self.price_buffers_30m[symbol] = PriceBuffer(500)
-            self.price_buffers_1m[symbol] = PriceBuffer(200)
+            self.price_buffers_30m[symbol] = PriceBuffer(500, index_col='timestamp')
+            self.price_buffers_1m[symbol] = PriceBuffer(200, index_col='timestamp')
     
     def _log(self, message: str, category: str = "INFO", force: bool = False):
         """로그 출력"""
@@ -473,14 +493,18 @@ class MultiTimeframeTradingEngine:
         self._log("🚀 자동매매 엔진 시작 중...", force=True)
         
         # 초기 데이터 로드
-        self._load_initial_data()
+        if self.preload_candles:
+            self._load_initial_data()
         
         self.is_running = True
         self.start_time = datetime.now()
         
-        # 백그라운드 스레드 시작
-        self.run_thread = threading.Thread(target=self._run_loop, daemon=True)
-        self.run_thread.start()
+        if self.feed_mode == 'websocket':
+            self._start_event_pipeline()
+        else:
+            # 백그라운드 스레드 시작
+            self.run_thread = threading.Thread(target=self._run_loop, daemon=True)
+            self.run_thread.start()
         
         self._log("✅ 자동매매 엔진 시작됨!", force=True)
         return True
@@ -490,6 +514,15 @@ class MultiTimeframeTradingEngine:
         self.is_running = False
         if self.run_thread:
             self.run_thread.join(timeout=5)
+        
+        if self.feed is not None:
+            self.feed.stop()
+        for q in self.event_queues.values():
+            q.put(None)
+        for thread in self.event_threads:
+            thread.join(timeout=5)
+        self.event_threads = []
+        
         self._log("🛑 자동매매 엔진 중지됨", force=True)
     
     def _load_initial_data(self):
@@ -499,17 +532,18 @@ class MultiTimeframeTradingEngine:
                 # 30분봉 데이터 로드
                 df_30m = self._fetch_candles(symbol, '30m', 300)
                 if df_30m is not None:
-                    for _, row in df_30m.iterrows():
-                        self.price_buffers_30m[symbol].add_candle(row.to_dict())
+                    self.price_buffers_30m[symbol].load_dataframe(df_30m)
                     self._log(f"✅ {symbol} 30분봉 {len(df_30m)}개 로드", force=True)
                 
                 # 1분봉 데이터 로드
                 df_1m = self._fetch_candles(symbol, '1m', 150)
                 if df_1m is not None:
-                    for _, row in df_1m.iterrows():
-                        self.price_buffers_1m[symbol].add_candle(row.to_dict())
+                    self.price_buffers_1m[symbol].load_dataframe(df_1m)
                     self._log(f"✅ {symbol} 1분봉 {len(df_1m)}개 로드", force=True)
-                    
+                
+                # EMA 상태 초기화 (이후로는 확정 캔들마다 증분 갱신)
+                self.indicators.load_history(symbol, df_30m, df_1m)
+            
             except Exception as e:
                 self._log(f"❌ {symbol} 데이터 로드 실패: {e}", "ERROR", force=True)
     
@@ -519,7 +553,7 @@ class MultiTimeframeTradingEngine:
             bar_map = {'30m': '30m', '1m': '1m', '1H': '1H'}
             bar = bar_map.get(timeframe, '30m')
             
-            response = make_api_request(
+            response = cached_api_request(
                 'GET',
                 '/api/v5/market/candles',
                 params={'instId': symbol, 'bar': bar, 'limit': str(limit)}
@@ -546,7 +580,8 @@ class MultiTimeframeTradingEngine:
     def _get_current_price(self, symbol: str) -> Optional[float]:
         """현재 가격 조회"""
         try:
-            response = make_api_request(
+            # GUI/에이전트의 같은 ticker 요청과 병합 (공유 클라이언트)
+            response = cached_api_request(
                 'GET',
                 '/api/v5/market/ticker',
                 params={'instId': symbol}
@@ -564,7 +599,7 @@ class MultiTimeframeTradingEngine:
             return None
     
     def _run_loop(self):
-        """메인 루프"""
+        """메인 루프 (REST 폴링)"""
         while self.is_running:
             try:
                 for symbol in self.symbols:
@@ -573,100 +608,235 @@ class MultiTimeframeTradingEngine:
                     if not current_price:
                         continue
                     
-                    # 데이터 업데이트
-                    df_30m = self.price_buffers_30m[symbol].to_dataframe()
-                    df_1m = self.price_buffers_1m[symbol].to_dataframe()
-                    
-                    if df_30m is None or len(df_30m) < 200:
-                        continue
-                    if df_1m is None or len(df_1m) < 100:
-                        continue
+                    self._process_symbol(symbol, current_price)
+            
+            except Exception as e:
+                self._log(f"[X] 루프 오류: {e}", "ERROR", force=True)
+            
+            time.sleep(self.check_interval)
+    
+    # ==================== WebSocket 이벤트 파이프라인 ====================
+    
+    def _start_event_pipeline(self):
+        """심볼별 이벤트 큐/처리 스레드 생성 후 피드 시작"""
+        if self.feed is None:
+            from okx.market_feed import WebSocketMarketFeed
+            self.feed = WebSocketMarketFeed(self.symbols, bars=['30m', '1m'])
+        
+        for symbol in self.symbols:
+            q = queue.Queue(maxsize=self.EVENT_QUEUE_SIZE)
+            self.event_queues[symbol] = q
+            thread = threading.Thread(
+                target=self._event_loop, args=(symbol, q),
+                name=f"EngineEvents-{symbol}", daemon=True,
+            )
+            thread.start()
+            self.event_threads.append(thread)
+        
+        self.feed.on_event = self._on_feed_event
+        self.feed.start()
+    
+    def _on_feed_event(self, event: Dict):
+        """피드 수신 스레드에서 호출 - 심볼 큐에 넣기만 함"""
+        q = self.event_queues.get(event.get('symbol'))
+        if q is None:
+            return
+        
+        if event['type'] == 'candle':
+            # 확정 캔들은 버리지 않음
+            q.put(event)
+            return
+        
+        try:
+            q.put_nowait(event)
+        except queue.Full:
+            self.dropped_events += 1
+    
+    def _event_loop(self, symbol: str, q: queue.Queue):
+        """
+        심볼별 이벤트 처리 루프
+        
+        쌓여 있는 이벤트를 한 번에 꺼내 캔들은 순서대로 반영하고,
+        ticker는 구간 고가/저가로 peak만 갱신한 뒤 마지막 가격으로 한 번만 전략 평가
+        """
+        while True:
+            event = q.get()
+            if event is None:
+                break
+            
+            batch = [event]
+            while True:
+                try:
+                    event = q.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    q.put(None)
+                    break
+                batch.append(event)
+            
+            try:
+                self._handle_events(symbol, batch)
+            except Exception as e:
+                self._log(f"[X] 이벤트 처리 오류 ({symbol}): {e}", "ERROR", force=True)
+    
+    def _handle_events(self, symbol: str, batch: List[Dict]):
+        """이벤트 묶음 처리"""
+        last_price = None
+        high = low = None
+        trigger = None
+        candle_committed = False
+        
+        for event in batch:
+            if event['type'] == 'candle':
+                if self._apply_candle(symbol, event):
+                    candle_committed = True
+                    trigger = trigger or event
+            elif event['type'] == 'ticker':
+                price = event['price']
+                last_price = price
+                high = price if high is None else max(high, price)
+                low = price if low is None else min(low, price)
+                trigger = event
+        
+        self.events_processed += len(batch)
+        
+        if last_price is None:
+            if not candle_committed:
+                return
+            # 새 봉만 확정된 경우 1분봉 종가로 평가
+            last_price = self.price_buffers_1m[symbol].get_latest_close()
+            if not last_price:
+                return
+        else:
+            # 묶음 안의 모든 tick을 트레일링 peak에 반영
+            for strategy_key, strategy in self.strategies.items():
+                if symbol not in strategy_key or not strategy.is_position_open:
+                    continue
+                if strategy.strategy_type == 'long':
+                    strategy.peak_price = max(strategy.peak_price, high)
+                else:
+                    strategy.peak_price = min(strategy.peak_price, low)
+        
+        self._process_symbol(symbol, last_price)
+        
+        # 수신 → 전략 평가 완료까지 지연 (ms)
+        latency_ms = (time.time() - trigger['recv_ts']) * 1000
+        self.last_signal_latency_ms = latency_ms
+        self._latency_sum_ms += latency_ms
+        self._latency_count += 1
+    
+    def _apply_candle(self, symbol: str, event: Dict) -> bool:
+        """확정 캔들을 버퍼/지표 서비스에 반영 (반영했으면 True)"""
+        if not event.get('confirmed'):
+            return False
+        
+        bar = event.get('bar')
+        buffers = {'30m': self.price_buffers_30m, '1m': self.price_buffers_1m}.get(bar)
+        if buffers is None or symbol not in buffers:
+            return False
+        
+        buffer = buffers[symbol]
+        candle = event['candle']
+        last_ts = buffer.last_timestamp
+        
+        if last_ts is None or candle['timestamp'] > last_ts:
+            buffer.add_candle(candle)
+        elif candle['timestamp'] == last_ts:
+            # 초기 로드 때 미확정 상태로 들어온 마지막 봉을 확정값으로 덮어씀
+            buffer.update_last(candle['close'], candle['high'], candle['low'])
+        else:
+            return False
+        
+        # EMA 증분 갱신 → 구독 전략에 스냅샷 전달 (1분봉은 30분봉 리샘플링 포함)
+        self.indicators.on_candle(symbol, bar, candle)
+        return True
+    
+    # ==================== 전략 처리 ====================
+    
+    def _process_symbol(self, symbol: str, current_price: float):
+        """심볼의 활성 전략들에 현재 가격 적용 (모드 전환/청산/진입)"""
+        # EMA는 지표 서비스가 봉 마감 시 구독 전략에 이미 반영해 둠
+        if not self.indicators.snapshot(symbol).ready:
+            return
+        
+        # 전략 처리
+        for strategy_key, strategy in self.strategies.items():
+            if symbol not in strategy_key:
+                continue
+            
+            # ⭐⭐⭐ 비활성화된 전략 스킵 (핵심 수정) ⭐⭐⭐
+            if not strategy.is_active:
+                continue
+            
+            # ⭐ 숏 전략 비활성화 확인 (이중 체크)
+            if 'short' in strategy_key and not self.short_enabled:
+                continue
+            
+            try:
+                strategy.last_price = current_price
+                
+                # 모드 체크
+                if strategy.check_mode_switch():
+                    mode = "REAL" if strategy.is_real_mode else "VIRTUAL"
+                    self._log(f"🔄 [{strategy.strategy_type.upper()}] 모드 전환 → {mode}", "MODE", force=True)
+                    if self.on_mode_change_callback:
+                        prev_mode = "VIRTUAL" if strategy.is_real_mode else "REAL"
+                        self.on_mode_change_callback(prev_mode, mode, "자동 전환")
+                
+                # 포지션 보유 시 청산 체크
+                if strategy.is_position_open:
+                    # peak 갱신
+                    if strategy.strategy_type == 'long':
+                        strategy.peak_price = max(strategy.peak_price, current_price)
+                    else:
+                        strategy.peak_price = min(strategy.peak_price, current_price)
                     
-                    # 전략 처리
-                    for strategy_key, strategy in self.strategies.items():
-                        if symbol not in strategy_key:
-                            continue
-                        
-                        # ⭐⭐⭐ 비활성화된 전략 스킵 (핵심 수정) ⭐⭐⭐
-                        if not strategy.is_active:
-                            continue
+                    should_exit, exit_reason = strategy.check_exit_signal(current_price)
+                    if should_exit:
+                        signal = strategy.exit_position(current_price, exit_reason)
+                        self.total_signals += 1
                         
-                        # ⭐ 숏 전략 비활성화 확인 (이중 체크)
-                        if 'short' in strategy_key and not self.short_enabled:
-                            continue
+                        self._log(
+                            f"🔴 [{signal['strategy_type'].upper()}] 청산: "
+                            f"${current_price:,.0f} | {exit_reason} | "
+                            f"PnL: ${signal['pnl']:+.2f}",
+                            "SIGNAL", force=True
+                        )
                         
-                        try:
-                            # EMA 업데이트
-                            strategy.update_30m_emas(df_30m)
-                            strategy.update_1m_emas(df_1m)
-                            strategy.last_price = current_price
-                            
-                            # 모드 체크
-                            if strategy.check_mode_switch():
-                                mode = "REAL" if strategy.is_real_mode else "VIRTUAL"
-                                self._log(f"🔄 [{strategy.strategy_type.upper()}] 모드 전환 → {mode}", "MODE", force=True)
-                                if self.on_mode_change_callback:
-                                    prev_mode = "VIRTUAL" if strategy.is_real_mode else "REAL"
-                                    self.on_mode_change_callback(prev_mode, mode, "자동 전환")
-                            
-                            # 포지션 보유 시 청산 체크
-                            if strategy.is_position_open:
-                                # peak 갱신
-                                if strategy.strategy_type == 'long':
-                                    strategy.peak_price = max(strategy.peak_price, current_price)
-                                else:
-                                    strategy.peak_price = min(strategy.peak_price, current_price)
-                                
-                                should_exit, exit_reason = strategy.check_exit_signal(current_price)
-                                if should_exit:
-                                    signal = strategy.exit_position(current_price, exit_reason)
-                                    self.total_signals += 1
-                                    
-                                    self._log(
-                                        f"🔴 [{signal['strategy_type'].upper()}] 청산: "
-                                        f"${current_price:,.0f} | {exit_reason} | "
-                                        f"PnL: ${signal['pnl']:+.2f}",
-                                        "SIGNAL", force=True
-                                    )
-                                    
-                                    if self.on_signal_callback:
-                                        self.on_signal_callback(signal)
-                                    
-                                    if signal['is_real']:
-                                        success = self._execute_trade(signal)
-                                        if self.on_trade_callback:
-                                            self.on_trade_callback(signal, success)
-                                continue
-                            
-                            # 진입 체크
-                            should_enter, status = strategy.check_entry_signal()
-                            if should_enter:
-                                signal = strategy.enter_position(current_price)
-                                self.total_signals += 1
-                                
-                                mode = "REAL" if signal['is_real'] else "VIRT"
-                                self._log(
-                                    f"🟢 [{signal['strategy_type'].upper()}] 진입: "
-                                    f"${current_price:,.0f} | [{mode}] | "
-                                    f"레버리지: {signal['leverage']}x",
-                                    "SIGNAL", force=True
-                                )
-                                
-                                if self.on_signal_callback:
-                                    self.on_signal_callback(signal)
-                                
-                                if signal['is_real']:
-                                    success = self._execute_trade(signal)
-                                    if self.on_trade_callback:
-                                        self.on_trade_callback(signal, success)
+                        if self.on_signal_callback:
+                            self.on_signal_callback(signal)
                         
-                        except Exception as e:
-                            self._log(f"[X] 전략 처리 오류: {e}", "ERROR", force=True)
+                        if signal['is_real']:
+                            success = self._execute_trade(signal)
+                            if self.on_trade_callback:
+                                self.on_trade_callback(signal, success)
+                    continue
                 
-            except Exception as e:
-                self._log(f"[X] 루프 오류: {e}", "ERROR", force=True)
+                # 진입 체크
+                should_enter, status = strategy.check_entry_signal()
+                if should_enter:
+                    signal = strategy.enter_position(current_price)
+                    self.total_signals += 1
+                    
+                    mode = "REAL" if signal['is_real'] else "VIRT"
+                    self._log(
+                        f"🟢 [{signal['strategy_type'].upper()}] 진입: "
+                        f"${current_price:,.0f} | [{mode}] | "
+                        f"레버리지: {signal['leverage']}x",
+                        "SIGNAL", force=True
+                    )
+                    
+                    if self.on_signal_callback:
+                        self.on_signal_callback(signal)
+                    
+                    if signal['is_real']:
+                        success = self._execute_trade(signal)
+                        if self.on_trade_callback:
+                            self.on_trade_callback(signal, success)
             
-            time.sleep(self.check_interval)
+            except Exception as e:
+                self._log(f"[X] 전략 처리 오류: {e}", "ERROR", force=True)
     
     def _execute_trade(self, signal: Dict) -> bool:
         """거래 실행"""
@@ -740,6 +910,13 @@ class MultiTimeframeTradingEngine:
             'runtime': runtime,
             'total_signals': self.total_signals,
             'executed_trades': self.executed_trades,
+            'feed_mode': self.feed_mode,
+            'events_processed': self.events_processed,
+            'dropped_events': self.dropped_events,
+            'queue_depth': {s: q.qsize() for s, q in self.event_queues.items()},
+            'last_signal_latency_ms': self.last_signal_latency_ms,
+            'avg_signal_latency_ms': self._latency_sum_ms / self._latency_count if self._latency_count else 0.0,
+            'indicators': self.indicators.get_status(),
             'strategies': {k: v.get_status() for k, v in self.strategies.items()}
         }
 
@@ -11,6 +11,7 @@ from utils.data_generator import (
     row_to_strategy_data,
 )
 from utils.price_buffer import PriceBuffer
+from utils.indicator_service import IndicatorService, IndicatorSnapshot
 from utils.logger import (
     log_system,
     log_error,
@@ -34,6 +35,10 @@ __all__ = [
     # 가격 버퍼
     'PriceBuffer',
     
+    # 지표 서비스
+    'IndicatorService',
+    'IndicatorSnapshot',
+    
     # 로깅
     'log_system',
     'log_error',
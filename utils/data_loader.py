@@ -2,37 +2,25 @@
 
 import requests
 import pandas as pd
-import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
-from config import API_KEY, API_SECRET, PASSPHRASE, EMA_PERIODS
+from config import API_KEY, API_SECRET, PASSPHRASE, EMA_PERIODS, get_http_session, http_request
 from utils.logger import log_system, log_error
 from utils.indicators import calculate_ema
 
 class HistoricalDataLoader:
     def __init__(self):
         self.base_url = "https://www.okx.com"
-        self.session = requests.Session()
-        
-        # 요청 간격 제한 (Rate limiting)
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms
+        # 요청 간격은 http_request의 공유 레이트 리미터가 관리
     
-    def _wait_for_rate_limit(self):
-        """Rate Limit 준수를 위한 대기"""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        
-        self.last_request_time = time.time()
+    @property
+    def session(self):
+        """공유 HTTP 세션 (configure_http_session()으로 교체될 수 있으므로 매번 조회)"""
+        return get_http_session()
     
     def get_historical_candles(self, inst_id: str, timeframe: str = "30m", 
                              limit: int = 300) -> Optional[pd.DataFrame]:
         """과거 캔들 데이터 조회 - 타임스탬프 변환 오류 수정"""
-        self._wait_for_rate_limit()
-        
         endpoint = "/api/v5/market/history-candles"
         
         params = {
@@ -43,7 +31,7 @@ class HistoricalDataLoader:
         
         try:
             url = self.base_url + endpoint
-            response = self.session.get(url, params=params, timeout=10)
+            response = http_request('GET', url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -162,10 +150,7 @@ class HistoricalDataLoader:
                         log_error(f"❌ {symbol} 전략 데이터 준비 실패")
                 else:
                     log_error(f"❌ {symbol} 캔들 데이터 로딩 실패")
-                
-                # Rate limit 준수
-                time.sleep(0.2)
-                
+            
             except Exception as e:
                 log_error(f"❌ {symbol} 데이터 로딩 중 오류", e)
                 continue
@@ -175,14 +160,12 @@ class HistoricalDataLoader:
     
     def get_latest_price(self, inst_id: str) -> Optional[float]:
         """최신 가격 조회"""
-        self._wait_for_rate_limit()
-        
         endpoint = "/api/v5/market/ticker"
         params = {'instId': inst_id}
         
         try:
             url = self.base_url + endpoint
-            response = self.session.get(url, params=params, timeout=5)
+            response = http_request('GET', url, params=params, timeout=5)
             response.raise_for_status()
             
             data = response.json()
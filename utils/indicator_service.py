@@ -0,0 +1,338 @@
+# utils/indicator_service.py
+"""
+심볼별 공유 지표 서비스 (멀티 타임프레임 증분 EMA)
+
+- 1분봉을 받아 30분봉으로 리샘플링하고 두 타임프레임의 EMA를 봉 마감 시 O(기간 수)로 갱신
+- 갱신될 때마다 읽기 전용 IndicatorSnapshot을 만들어 해당 심볼 구독자(전략)에게 전달
+  → 같은 심볼의 롱/숏 전략이 EMA를 각자 다시 계산하지 않음
+
+EMA는 pandas `close.ewm(span=p).mean()` (adjust=True)과 같은 연산 순서로 누적하므로
+초기 로드 이후 받은 봉까지 포함한 전체 시계열을 pandas로 계산한 값과 비트 단위로 일치
+"""
+
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.price_buffer import _to_ms
+
+
+# 기본 EMA 기간 (MultiTimeframeStrategy 기준)
+EMA_PERIODS_30M = (20, 50, 100, 150, 200)
+EMA_PERIODS_1M = (20, 50, 100)
+
+BAR_MS_1M = 60_000
+BAR_MS_30M = 30 * BAR_MS_1M
+
+_EMPTY = MappingProxyType({})
+
+
+class _EMABank:
+    """
+    한 타임프레임의 EMA 묶음 (기간별 상태를 NumPy 벡터로 한 번에 갱신)
+    
+    마지막 봉은 같은 타임스탬프로 다시 들어오면 직전 상태에서 다시 계산
+    (미확정 봉 → 확정 봉 덮어쓰기)
+    """
+    
+    def __init__(self, periods: Iterable[int]):
+        self.periods = tuple(int(p) for p in periods)
+        self.names = tuple(f"ema{p}" for p in self.periods)
+        self._decay = 1.0 - 2.0 / (np.array(self.periods, dtype=np.float64) + 1.0)
+        self.reset()
+    
+    def reset(self):
+        self.avg: Optional[np.ndarray] = None
+        self.old_wt: Optional[np.ndarray] = None
+        self.count = 0
+        self.last_ts: Optional[int] = None
+        self.last_close: Optional[float] = None
+        # 마지막 봉 반영 전 상태 (avg, old_wt, count)
+        self._prev: Tuple[Optional[np.ndarray], Optional[np.ndarray], int] = (None, None, 0)
+    
+    def _step(self, close: float):
+        # pandas ewma(adjust=True)와 같은 연산 순서
+        if self.avg is None:
+            self.avg = np.full(len(self.periods), close)
+            self.old_wt = np.ones(len(self.periods))
+        else:
+            self.old_wt = self.old_wt * self._decay
+            self.avg = (self.old_wt * self.avg + close) / (self.old_wt + 1.0)
+            self.old_wt = self.old_wt + 1.0
+        self.count += 1
+    
+    def push(self, ts: int, close: float) -> bool:
+        """
+        봉 반영 (반영했으면 True)
+        
+        - 새 타임스탬프: 누적
+        - 마지막 봉과 같은 타임스탬프: 직전 상태에서 다시 계산
+        - 더 오래된 봉 / NaN 종가: 무시
+        """
+        if close != close:
+            return False
+        if self.last_ts is not None:
+            if ts < self.last_ts:
+                return False
+            if ts == self.last_ts:
+                self.avg, self.old_wt, self.count = self._prev
+        self._prev = (self.avg, self.old_wt, self.count)
+        self._step(close)
+        self.last_ts = ts
+        self.last_close = close
+        return True
+    
+    def load(self, timestamps: np.ndarray, closes: np.ndarray):
+        """과거 봉 일괄 반영 (초기 로드, 기존 상태 초기화)"""
+        self.reset()
+        for ts, close in zip(timestamps.tolist(), closes.tolist()):
+            self.push(ts, close)
+    
+    def values(self) -> Mapping[str, float]:
+        if self.avg is None:
+            return _EMPTY
+        return MappingProxyType(dict(zip(self.names, self.avg.tolist())))
+
+
+@dataclass(frozen=True)
+class IndicatorSnapshot:
+    """
+    구독자에게 전달되는 읽기 전용 지표 스냅샷
+    
+    ema_30m / ema_1m은 봉 수가 최소 개수 미만이면 빈 매핑
+    (키: 'ema20', 'ema50', ...)
+    """
+    symbol: str
+    version: int
+    ts_30m: Optional[int] = None       # 마지막 30분봉 시작 시각 (ms)
+    ts_1m: Optional[int] = None        # 마지막 1분봉 시작 시각 (ms)
+    bars_30m: int = 0
+    bars_1m: int = 0
+    close_1m: Optional[float] = None
+    ema_30m: Mapping[str, float] = field(default_factory=lambda: _EMPTY)
+    ema_1m: Mapping[str, float] = field(default_factory=lambda: _EMPTY)
+    
+    @property
+    def ready(self) -> bool:
+        """두 타임프레임 EMA가 모두 준비됐는지"""
+        return bool(self.ema_30m) and bool(self.ema_1m)
+
+
+class _SymbolIndicators:
+    """심볼 하나의 30분/1분 EMA 상태 + 진행 중인 30분봉 집계"""
+    
+    def __init__(self, symbol: str, periods_30m, periods_1m):
+        self.symbol = symbol
+        self.ema_30m = _EMABank(periods_30m)
+        self.ema_1m = _EMABank(periods_1m)
+        self.partial: Optional[Dict] = None  # 1분봉으로 집계 중인 30분봉
+        self.version = 0
+        self.snapshot = IndicatorSnapshot(symbol=symbol, version=0)
+    
+    def aggregate_1m(self, ts: int, candle: Dict) -> Optional[Dict]:
+        """
+        1분봉을 30분봉 집계에 반영
+        
+        Returns:
+            버킷의 마지막 1분봉이 들어와 완성된 30분봉 (없으면 None)
+        """
+        bucket = ts - ts % BAR_MS_30M
+        close = float(candle['close'])
+        bar = self.partial
+        
+        if bar is None or bucket > bar['timestamp']:
+            bar = self.partial = {
+                'timestamp': bucket,
+                'open': float(candle.get('open', close)),
+                'high': float(candle.get('high', close)),
+                'low': float(candle.get('low', close)),
+                'close': close,
+                'last_1m': ts,
+            }
+        elif bucket == bar['timestamp'] and ts >= bar['last_1m']:
+            bar['high'] = max(bar['high'], float(candle.get('high', close)))
+            bar['low'] = min(bar['low'], float(candle.get('low', close)))
+            bar['close'] = close
+            bar['last_1m'] = ts
+        else:
+            return None
+        
+        if ts + BAR_MS_1M >= bucket + BAR_MS_30M:
+            self.partial = None
+            return bar
+        return None
+
+
+class IndicatorService:
+    """
+    심볼별 공유 지표 서비스
+    
+    사용법:
+        service = IndicatorService()
+        service.subscribe("BTC-USDT-SWAP", strategy.apply_snapshot)
+        service.load_history("BTC-USDT-SWAP", df_30m, df_1m)
+        service.on_candle("BTC-USDT-SWAP", "1m", candle)   # 확정 1분봉마다
+        snap = service.snapshot("BTC-USDT-SWAP")
+    
+    - 1분봉 마감 시 1분 EMA 갱신, 30분 버킷의 마지막 1분봉이면 30분봉도 확정해 30분 EMA 갱신
+    - 피드에서 30분봉이 직접 들어오면 같은 버킷의 리샘플링 결과를 덮어씀
+    - 같은 심볼 호출은 한 스레드(심볼별 이벤트 스레드)에서 들어온다고 가정하고,
+      심볼 등록/구독 목록 변경만 잠금으로 보호
+    """
+    
+    def __init__(
+        self,
+        periods_30m: Iterable[int] = EMA_PERIODS_30M,
+        periods_1m: Iterable[int] = EMA_PERIODS_1M,
+        min_bars_30m: int = 200,
+        min_bars_1m: int = 100,
+    ):
+        """
+        Args:
+            periods_30m: 30분봉 EMA 기간
+            periods_1m: 1분봉 EMA 기간
+            min_bars_30m: 30분 EMA를 스냅샷에 싣기 위한 최소 봉 수
+            min_bars_1m: 1분 EMA를 스냅샷에 싣기 위한 최소 봉 수
+        """
+        self.periods_30m = tuple(periods_30m)
+        self.periods_1m = tuple(periods_1m)
+        self.min_bars_30m = min_bars_30m
+        self.min_bars_1m = min_bars_1m
+        
+        self._symbols: Dict[str, _SymbolIndicators] = {}
+        self._subscribers: Dict[str, List[Callable[[IndicatorSnapshot], None]]] = {}
+        self._lock = threading.Lock()
+        
+        # 통계
+        self.bars_30m_resampled = 0
+        self.snapshots_published = 0
+    
+    def _state(self, symbol: str) -> _SymbolIndicators:
+        state = self._symbols.get(symbol)
+        if state is None:
+            with self._lock:
+                state = self._symbols.setdefault(
+                    symbol, _SymbolIndicators(symbol, self.periods_30m, self.periods_1m)
+                )
+        return state
+    
+    # ==================== 구독 ====================
+    
+    def subscribe(self, symbol: str, callback: Callable[[IndicatorSnapshot], None]):
+        """심볼 스냅샷 구독 (이미 준비된 스냅샷이 있으면 바로 한 번 전달)"""
+        state = self._state(symbol)
+        with self._lock:
+            self._subscribers[symbol] = self._subscribers.get(symbol, []) + [callback]
+        if state.version:
+            callback(state.snapshot)
+    
+    def unsubscribe(self, symbol: str, callback: Callable[[IndicatorSnapshot], None]):
+        with self._lock:
+            self._subscribers[symbol] = [cb for cb in self._subscribers.get(symbol, []) if cb != callback]
+    
+    def snapshot(self, symbol: str) -> IndicatorSnapshot:
+        """심볼의 최신 스냅샷"""
+        return self._state(symbol).snapshot
+    
+    def _publish(self, state: _SymbolIndicators):
+        e30, e1 = state.ema_30m, state.ema_1m
+        state.version += 1
+        snap = IndicatorSnapshot(
+            symbol=state.symbol,
+            version=state.version,
+            ts_30m=e30.last_ts,
+            ts_1m=e1.last_ts,
+            bars_30m=e30.count,
+            bars_1m=e1.count,
+            close_1m=e1.last_close,
+            ema_30m=e30.values() if e30.count >= self.min_bars_30m else _EMPTY,
+            ema_1m=e1.values() if e1.count >= self.min_bars_1m else _EMPTY,
+        )
+        state.snapshot = snap
+        self.snapshots_published += 1
+        
+        # 구독 목록은 변경 시 새 리스트로 교체하므로 잠금 없이 순회
+        for callback in self._subscribers.get(state.symbol, ()):
+            callback(snap)
+    
+    # ==================== 데이터 입력 ====================
+    
+    @staticmethod
+    def _timestamps_ms(df: pd.DataFrame) -> np.ndarray:
+        ts = df['timestamp'] if 'timestamp' in df.columns else df.index.to_series()
+        if pd.api.types.is_datetime64_any_dtype(ts):
+            if getattr(ts.dt, 'tz', None) is not None:
+                ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+            return ts.to_numpy(dtype='datetime64[ms]').astype(np.int64)
+        return pd.to_numeric(ts).to_numpy(dtype=np.int64)
+    
+    def load_history(self, symbol: str, df_30m: pd.DataFrame = None, df_1m: pd.DataFrame = None):
+        """
+        과거 캔들로 EMA 상태 초기화 (REST 초기 로드)
+        
+        마지막 행은 미확정 봉일 수 있으며, 같은 타임스탬프의 확정 봉이 들어오면 덮어씀
+        """
+        state = self._state(symbol)
+        
+        if df_30m is not None and len(df_30m):
+            state.ema_30m.load(self._timestamps_ms(df_30m), df_30m['close'].to_numpy(dtype=np.float64))
+        
+        if df_1m is not None and len(df_1m):
+            ts_1m = self._timestamps_ms(df_1m)
+            state.ema_1m.load(ts_1m, df_1m['close'].to_numpy(dtype=np.float64))
+            
+            # 진행 중인 30분 버킷에 속한 1분봉으로 집계 상태 복원
+            state.partial = None
+            bucket = state.ema_30m.last_ts
+            if bucket is None:
+                bucket = ts_1m[-1] - ts_1m[-1] % BAR_MS_30M
+            start = int(np.searchsorted(ts_1m, bucket))
+            for ts, candle in zip(ts_1m[start:].tolist(), df_1m.iloc[start:].to_dict('records')):
+                state.aggregate_1m(ts, candle)
+        
+        self._publish(state)
+    
+    def on_candle(self, symbol: str, bar: str, candle: Dict) -> bool:
+        """
+        확정 캔들 반영 (갱신됐으면 스냅샷 발행 후 True)
+        
+        Args:
+            symbol: 심볼
+            bar: '1m' 또는 '30m'
+            candle: {'timestamp', 'open', 'high', 'low', 'close', ...}
+        """
+        state = self._state(symbol)
+        ts = _to_ms(candle['timestamp'])
+        close = float(candle['close'])
+        
+        if bar == '1m':
+            changed = state.ema_1m.push(ts, close)
+            if changed:
+                completed = state.aggregate_1m(ts, candle)
+                if completed is not None and state.ema_30m.push(completed['timestamp'], completed['close']):
+                    self.bars_30m_resampled += 1
+        elif bar == '30m':
+            changed = state.ema_30m.push(ts, close)
+            partial = state.partial
+            if changed and partial is not None and partial['timestamp'] <= ts:
+                state.partial = None
+        else:
+            return False
+        
+        if changed:
+            self._publish(state)
+        return changed
+    
+    def get_status(self) -> Dict:
+        return {
+            'symbols': {
+                s: {'version': st.version, 'bars_30m': st.ema_30m.count, 'bars_1m': st.ema_1m.count}
+                for s, st in self._symbols.items()
+            },
+            'bars_30m_resampled': self.bars_30m_resampled,
+            'snapshots_published': self.snapshots_published,
+        }